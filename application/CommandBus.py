@@ -1,5 +1,4 @@
 import time
-from functools import partial
 
 from typing import Dict, Type, Optional
 
@@ -15,6 +14,7 @@ from protocol0.application.command.SerializableCommand import SerializableComman
 from protocol0.application.command.ToggleSceneLoopCommand import ToggleSceneLoopCommand
 from protocol0.application.command_handler.CommandHandlerInterface import CommandHandlerInterface
 from protocol0.domain.lom.set.AbletonSet import AbletonSet
+from protocol0.domain.shared.LatencyHistogram import LatencyHistogram
 from protocol0.domain.shared.errors.Protocol0Error import Protocol0Error
 from protocol0.domain.shared.errors.error_handler import handle_error
 from protocol0.domain.shared.utils.utils import import_package
@@ -42,6 +42,9 @@ class CommandBus(object):
         self._container = container
         self._ableton_set = ableton_set
         self._command_mapping = self._create_command_mapping()
+        # handlers are stateless
+        self._handlers = {}  # type: Dict[Type[SerializableCommand], CommandHandlerInterface]
+        self._latencies = {}  # type: Dict[Type[SerializableCommand], LatencyHistogram]
 
         self._history = CommandBusHistory()
         CommandBus._INSTANCE = self
@@ -67,6 +70,8 @@ class CommandBus(object):
 
             mapping[command_class] = handler_names_to_class[handler_class_name]
 
+        SerializableCommand.register_classes(command_classes)
+
         return mapping
 
     @classmethod
@@ -92,19 +97,33 @@ class CommandBus(object):
 
         self._history.push(command)
 
-        try:
-            handler = self._command_mapping[command.__class__](self._container)
-        except KeyError:
-            Logger.error("Cannot find command %s in command mapping" % command.__class__)
-            return None
+        command_class = command.__class__
+        handler = self._handlers.get(command_class)
+        if handler is None:
+            try:
+                handler = self._command_mapping[command_class](self._container)
+            except KeyError:
+                Logger.error("Cannot find command %s in command mapping" % command_class)
+                return None
+            self._handlers[command_class] = handler
+
+        seq = handler.handle(command)
 
-        seq = Sequence()
-        seq.add(partial(handler.handle, command))
+        # synchronous part of the handling
+        duration = time.time() - start_at
+        if command_class not in self._latencies:
+            self._latencies[command_class] = LatencyHistogram()
+        self._latencies[command_class].add(duration)
 
         if self._DEBUG:
-            seq.add(partial(Logger.info, "%s : took %.3fs" % (command, time.time() - start_at)))
+            Logger.info("%s : took %.1fms" % (command, duration * 1000))
 
-        return seq.done()
+        return seq if isinstance(seq, Sequence) else None
+
+    @classmethod
+    def latencies(cls):
+        # type: () -> Dict[Type[SerializableCommand], LatencyHistogram]
+        return cls._INSTANCE._latencies
 
     @classmethod
     def get_recent_command(cls, command_class, delay, except_current=False):
@@ -1,6 +1,7 @@
+import collections
 import time
 
-from typing import List, Optional, Type
+from typing import Optional, Type, Deque
 
 from protocol0.application.command.SerializableCommand import SerializableCommand
 from protocol0.shared.AbstractEnum import T
@@ -18,22 +19,19 @@ class CommandBusHistory(object):
 
     def __init__(self):
         # type: () -> None
-        self._history = [None] * self._SIZE  # type: List[Optional[HistoryEntry]]
+        self._history = collections.deque(maxlen=self._SIZE)  # type: Deque[HistoryEntry]
 
     def push(self, command):
         # type: (SerializableCommand) -> None
         """Expect only increasing time.time"""
         self._history.append(HistoryEntry(command))
 
-        # rotate history
-        self._history = self._history[-20:]
-
     def get_recent_command(self, command_class, delay, except_current):
         # type: (Type[T], float, bool) -> Optional[T]
         """Delay in ms"""
         time_limit = time.time() - delay
 
-        for entry in reversed(list(filter(None, self._history))):
+        for entry in reversed(self._history):
             if entry.executed_at < time_limit:
                 return None
             if isinstance(entry.command, command_class):
@@ -6,10 +6,13 @@ from protocol0.application.Container import Container
 from protocol0.application.ScriptDisconnectedEvent import ScriptDisconnectedEvent
 from protocol0.application.ScriptResetActivatedEvent import ScriptResetActivatedEvent
 from protocol0.application.command.ReloadScriptCommand import ReloadScriptCommand
+from protocol0.domain.lom.clip_slot.ClipSlotIndex import ClipSlotIndex
 from protocol0.domain.shared.errors.ErrorRaisedEvent import ErrorRaisedEvent
 from protocol0.domain.shared.event.DomainEventBus import DomainEventBus
+from protocol0.infra.persistence.DataWriter import DataWriter
 from protocol0.shared.Song import Song
 from protocol0.shared.logging.Logger import Logger
+from protocol0.shared.observer.NotificationTransaction import NotificationTransaction
 from protocol0.shared.sequence.Sequence import Sequence
 
 
@@ -51,3 +54,9 @@ class Protocol0(ControlSurface):
             track.disconnect()
         for scene in Song.scenes():
             scene.disconnect()
+        # the data marked dirty since the last tick (and on track disconnect)
+        DataWriter.flush()
+        DataWriter.reset()
+        NotificationTransaction.reset()
+        Logger.flush()
+        ClipSlotIndex.reset()
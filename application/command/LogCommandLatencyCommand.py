@@ -0,0 +1,5 @@
+from protocol0.application.command.SerializableCommand import SerializableCommand
+
+
+class LogCommandLatencyCommand(SerializableCommand):
+    pass
@@ -1,12 +1,15 @@
 import json
 
-from typing import Optional
+from typing import Optional, Dict, Type, Iterable
 
 from protocol0.domain.shared.errors.Protocol0Error import Protocol0Error
 from protocol0.domain.shared.utils.utils import locate
 
 
 class SerializableCommand(object):
+    # serialized class name -> class, filled by the CommandBus
+    _CLASSES = {}  # type: Dict[str, Type[SerializableCommand]]
+
     def __init__(self):
         # type: () -> None
         self.set_id = None  # type: Optional[str]
@@ -30,6 +33,14 @@ class SerializableCommand(object):
             indent=4,
         )
 
+    @classmethod
+    def register_classes(cls, command_classes):
+        # type: (Iterable[Type[SerializableCommand]]) -> None
+        from pydoc import classname
+
+        for command_class in command_classes:
+            cls._CLASSES[classname(command_class, "")] = command_class
+
     @classmethod
     def un_serialize(cls, json_string):
         # type: (str) -> SerializableCommand
@@ -37,7 +48,7 @@ class SerializableCommand(object):
         assert "class" in json_dict, "class is missing from json serialization"
         assert "args" in json_dict, "attrs is missing from json serialization"
 
-        sub_class = locate(json_dict["class"])
+        sub_class = cls._CLASSES.get(json_dict["class"]) or locate(json_dict["class"])
         if not sub_class:
             raise Protocol0Error("Couldn't locate %s" % json_dict["class"])
 
@@ -0,0 +1,14 @@
+from protocol0.application.command.LogCommandLatencyCommand import LogCommandLatencyCommand
+from protocol0.application.command_handler.CommandHandlerInterface import CommandHandlerInterface
+from protocol0.shared.logging.Logger import Logger
+
+
+class LogCommandLatencyCommandHandler(CommandHandlerInterface):
+    def handle(self, _):
+        # type: (LogCommandLatencyCommand) -> None
+        from protocol0.application.CommandBus import CommandBus
+
+        Logger.info("********* COMMAND LATENCIES *************")
+        latencies = sorted(CommandBus.latencies().items(), key=lambda item: -item[1].count)
+        for command_class, histogram in latencies:
+            Logger.info("%s: %s" % (command_class.__name__, histogram))
@@ -10,6 +10,6 @@ class ReloadScriptCommandHandler(CommandHandlerInterface):
     def handle(self, _):
         # type: (ReloadScriptCommand) -> None
         Logger.clear()
-        self._container.get(TrackMapperService).tracks_listener()
+        self._container.get(TrackMapperService).remap_tracks()
         self._container.get(SceneService).scenes_listener()
         self._container.get(SongInitService).init_song()
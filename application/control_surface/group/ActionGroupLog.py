@@ -35,3 +35,17 @@ class ActionGroupLog(ActionGroupInterface):
             name="log missing vsts",
             on_press=self._container.get(LogService).log_missing_vsts,
         )
+
+        # PERFormance encoder
+        self.add_encoder(
+            identifier=6,
+            name="log performance stats",
+            on_press=self._container.get(LogService).log_performance_stats,
+        )
+
+        # RECords encoder
+        self.add_encoder(
+            identifier=7,
+            name="log last records",
+            on_press=self._container.get(LogService).log_last_records,
+        )
@@ -1,3 +1,4 @@
+from protocol0.domain.lom.clip_slot.ClipSlotIndex import ClipSlotIndex
 from protocol0.domain.lom.track.group_track.AbstractGroupTrack import AbstractGroupTrack
 from protocol0.shared.Song import Song
 
@@ -27,3 +28,9 @@ class LOMAnalyzerService(object):
                         assert sub_track.group_track == abstract_group_track, (
                             "failed on %s" % simple_track
                         )
+
+    def check_clip_slot_index_consistency(self):
+        # type: () -> None
+        clip_slots = [cs for track in Song.all_simple_tracks() for cs in track.clip_slots]
+        errors = ClipSlotIndex.get_inconsistencies(clip_slots)
+        assert not errors, "clip slot index inconsistency: %s" % "\n".join(errors)
@@ -1,16 +1,30 @@
+import collections
+
+from typing import Dict, List
+
 from protocol0.domain.audit.utils import tail_logs
 from protocol0.domain.lom.clip.AudioClip import AudioClip
 from protocol0.domain.lom.device.DeviceEnum import DeviceEnum
+from protocol0.domain.lom.device.SetDeviceIndex import SetDeviceIndex
 from protocol0.domain.lom.set.AbletonSet import AbletonSet
 from protocol0.domain.lom.track.TrackMapperService import TrackMapperService
 from protocol0.domain.lom.track.group_track.matching_track.MatchingTrackService import \
     MatchingTrackService
+from protocol0.domain.shared.CacheStats import CacheStats
+from protocol0.domain.shared.TimerStats import TimerStats
+from protocol0.domain.shared.event.DomainEventBus import DomainEventBus
 from protocol0.domain.shared.utils.list import find_if
+from protocol0.infra.persistence.DataWriter import DataWriter
+from protocol0.shared.Config import Config
 from protocol0.shared.Song import Song
 from protocol0.shared.logging.Logger import Logger
+from protocol0.shared.observer.NotificationTransaction import NotificationTransaction
+from protocol0.shared.sequence.Sequence import Sequence
 
 
 class LogService(object):
+    _DUMPED_RECORD_COUNT = 200
+
     def __init__(self, ableton_set, track_mapper_service, matching_track_service):
         # type: (AbletonSet, TrackMapperService, MatchingTrackService) -> None
         self._ableton_set = ableton_set
@@ -186,7 +200,109 @@ class LogService(object):
     @tail_logs
     def log_missing_vsts(self):
         # type: () -> None
-        for track in Song.all_simple_tracks():
-            for device in track.devices.all:
-                if device.name in DeviceEnum.missing_plugin_names():
-                    Logger.warning((track, device))
+        set_device_index = SetDeviceIndex.get()
+        for device_name in DeviceEnum.missing_plugin_names():
+            for track, device in set_device_index.get_from_name(device_name):
+                Logger.warning((track, device))
+
+    @tail_logs
+    def log_last_records(self):
+        # type: () -> None
+        """The records are kept in memory : this writes them again after clearing the logs"""
+        Logger.clear()
+        Logger.dump_last_records(self._DUMPED_RECORD_COUNT)
+
+    @tail_logs
+    def log_performance_stats(self):
+        # type: () -> None
+        Logger.clear()
+
+        Logger.info("********* DOMAIN EVENT BUS *************")
+        if not DomainEventBus._STATS:
+            Logger.info("stats are disabled, set DomainEventBus._STATS")
+        event_stats = sorted(DomainEventBus.stats().items(), key=lambda item: -item[1].count)
+        for event_name, stats in event_stats:
+            Logger.info("%s: %s" % (event_name, stats))
+
+        Logger.info()
+        Logger.info("********* OBSERVERS *************")
+        if not NotificationTransaction._STATS:
+            Logger.info("stats are disabled, set NotificationTransaction._STATS")
+        notification_stats = sorted(
+            NotificationTransaction.stats().items(), key=lambda item: -item[1].notifications
+        )
+        for pair_name, stats in notification_stats:
+            Logger.info("%s: %s" % (pair_name, stats))
+
+        Logger.info()
+        Logger.info("********* CACHES *************")
+        for cache_stats in CacheStats.all():
+            Logger.info(cache_stats)
+
+        Logger.info()
+        Logger.info("********* TIMERS *************")
+        for timer_stats in TimerStats.all():
+            Logger.info(timer_stats)
+
+        Logger.info()
+        Logger.info("********* DEVICES *************")
+        self._log_device_stats()
+
+        Logger.info()
+        Logger.info("********* CLIP LISTENERS *************")
+        self._log_clip_listener_stats()
+
+        Logger.info()
+        Logger.info("********* PERSISTENCE *************")
+        Logger.info("flushes: %s" % DataWriter.flush_count)
+        Logger.info("bytes written: %s" % DataWriter.bytes_written)
+        Logger.info("last flush bytes written: %s" % DataWriter.last_flush_bytes_written)
+
+        Logger.info()
+        Logger.info("********* SEQUENCES *************")
+        Logger.info("running sequences: %s" % len(Sequence.RUNNING_SEQUENCES))
+        Logger.info(
+            "oldest running sequence age: %.1fs" % Sequence.RUNNING_SEQUENCES.oldest_sequence_age
+        )
+
+    def _log_device_stats(self):
+        # type: () -> None
+        """Parameters wrapped by device class : approximate memory and wrapping time"""
+        # device class name -> [devices, parameters, wrapped parameters, bytes, seconds]
+        device_stats = collections.OrderedDict()  # type: Dict[str, List]
+        for _, device in SetDeviceIndex.get().all:
+            stats = device_stats.setdefault(device.__class__.__name__, [0, 0, 0, 0, 0.0])
+            stats[0] += 1
+            stats[1] += len(device.parameters)
+            stats[2] += device.parameters.wrapped_count
+            stats[3] += device.parameters.memory_size
+            stats[4] += device.parameters.wrap_duration
+
+        for class_name, stats in sorted(device_stats.items(), key=lambda item: -item[1][3]):
+            Logger.info(
+                "%s: devices: %s, parameters: %s, wrapped: %s, memory: %.1fKB, wrap time: %.1fms"
+                % (
+                    class_name,
+                    stats[0],
+                    stats[1],
+                    stats[2],
+                    float(stats[3]) / 1024,
+                    stats[4] * 1000,
+                )
+            )
+
+    def _log_clip_listener_stats(self):
+        # type: () -> None
+        """Live listeners attached by the clips, compared to the eager mode"""
+        clips = [clip for track in Song.simple_tracks() for clip in track.clips]
+        active_clips = [clip for clip in clips if clip.listeners_attached]
+
+        Logger.info("lazy mode: %s" % Config.LAZY_CLIP_LISTENERS)
+        Logger.info("clips: %s, with listeners: %s" % (len(clips), len(active_clips)))
+        Logger.info(
+            "listeners: %s (eager: %s)"
+            % (
+                sum(clip.listener_count for clip in clips),
+                sum(clip.max_listener_count for clip in clips),
+            )
+        )
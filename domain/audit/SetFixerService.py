@@ -3,6 +3,7 @@ from protocol0.domain.lom.validation.ValidatorService import ValidatorService
 from protocol0.domain.shared.backend.Backend import Backend
 from protocol0.shared.Song import Song
 from protocol0.shared.logging.Logger import Logger
+from protocol0.shared.observer.NotificationTransaction import NotificationTransaction
 
 
 class SetFixerService(object):
@@ -18,7 +19,7 @@ class SetFixerService(object):
 
         invalid_objects = []
 
-        objects_to_validate = Song.scenes() + list(Song.abstract_tracks())  # noqa
+        objects_to_validate = list(Song.scenes()) + list(Song.abstract_tracks())  # noqa
         for obj in objects_to_validate:
             is_valid = self._validator_service.validate_object(obj)
             if not is_valid:
@@ -42,13 +43,14 @@ class SetFixerService(object):
         if len(devices_to_remove):
             Logger.warning("Devices to remove: %s" % devices_to_remove)
 
+    @NotificationTransaction()
     def _refresh_objects_appearance(self):
         # type: () -> None
         clip_slots = [cs for track in Song.simple_tracks() for cs in track.clip_slots]
         clips = [clip for track in Song.simple_tracks() for clip in track.clips]
         # noinspection PyTypeChecker
         objects_to_refresh_appearance = (
-                clip_slots + clips + Song.scenes()
+                clip_slots + clips + list(Song.scenes())
         )
 
         for obj in objects_to_refresh_appearance:
@@ -1,15 +1,16 @@
+import collections
 from functools import partial
 
 from typing import Iterator, List, Dict, Tuple
 
 from protocol0.domain.lom.device.Device import Device
 from protocol0.domain.lom.device.DeviceEnum import DeviceEnum
+from protocol0.domain.lom.device.SetDeviceIndex import SetDeviceIndex
 from protocol0.domain.lom.device_parameter.DeviceParameterEnum import DeviceParameterEnum
 from protocol0.domain.lom.song.components.TrackCrudComponent import TrackCrudComponent
 from protocol0.domain.lom.track.simple_track.SimpleTrack import SimpleTrack
 from protocol0.domain.lom.validation.ValidatorService import ValidatorService
 from protocol0.domain.shared.errors.Protocol0Error import Protocol0Error
-from protocol0.shared.Song import Song
 from protocol0.shared.logging.StatusBar import StatusBar
 from protocol0.shared.sequence.Sequence import Sequence
 
@@ -51,16 +52,19 @@ class SetUpgradeService(object):
     def get_deletable_devices(self):
         # type: () -> Iterator[Tuple[SimpleTrack, Device]]
         # devices with default values (unchanged)
+        set_device_index = SetDeviceIndex.get()
         for device_enum in DeviceEnum:  # type: DeviceEnum
             try:
                 default_parameter_values = device_enum.main_parameters_default
             except Protocol0Error:
                 continue
 
-            for track in Song.all_simple_tracks():
-                device = track.devices.get_one_from_enum(device_enum)
-                if not device:
-                    continue
+            # the first device of each track
+            track_devices = collections.OrderedDict()  # type: Dict[int, Tuple[SimpleTrack, Device]]
+            for track, device in set_device_index.get_from_enum(device_enum):
+                track_devices.setdefault(id(track), (track, device))
+
+            for track, device in track_devices.values():
                 device_on = device.get_parameter_by_name(DeviceParameterEnum.DEVICE_ON)
                 if device_on.value is False and not device_on.is_automated:
                     yield track, device
@@ -5,9 +5,9 @@ from typing import Dict, Iterator, Any
 from protocol0.domain.lom.device.Device import Device
 from protocol0.domain.lom.device.DeviceEnum import DeviceEnum
 from protocol0.domain.lom.device.DrumRackDevice import DrumRackDevice
+from protocol0.domain.lom.device.SetDeviceIndex import SetDeviceIndex
 from protocol0.domain.lom.device.SimplerDevice import SimplerDevice
 from protocol0.domain.shared.utils.list import find_if
-from protocol0.shared.Song import Song
 
 
 class DeviceStats(object):
@@ -66,13 +66,12 @@ class DevicesStats(object):
         # type: () -> Iterator[Device]
         """Return only devices that matters for stats"""
 
-        for track in Song.all_simple_tracks():
-            for device in track.devices.all:  # type: ignore[has-type]
-                if (
-                    not isinstance(device, (SimplerDevice, DrumRackDevice))
-                    and device.type_name not in self._EXCLUDED_DEVICE_NAMES
-                ):
-                    yield device
+        for _, device in SetDeviceIndex.get().all:
+            if (
+                not isinstance(device, (SimplerDevice, DrumRackDevice))
+                and device.type_name not in self._EXCLUDED_DEVICE_NAMES
+            ):
+                yield device
 
     def to_dict(self):
         # type: () -> Dict
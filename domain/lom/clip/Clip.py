@@ -14,6 +14,7 @@ from protocol0.domain.lom.clip.automation.ClipAutomation import ClipAutomation
 from protocol0.domain.lom.device_parameter.DeviceParameter import DeviceParameter
 from protocol0.domain.shared.scheduler.Scheduler import Scheduler
 from protocol0.domain.shared.utils.forward_to import ForwardTo
+from protocol0.shared.Config import Config
 from protocol0.shared.Song import Song
 from protocol0.shared.UndoFacade import UndoFacade
 from protocol0.shared.observer.Observable import Observable
@@ -21,6 +22,9 @@ from protocol0.shared.sequence.Sequence import Sequence
 
 
 class Clip(SlotManager, Observable):
+    # the clip listens through its name and loop
+    LISTENER_COUNT = 0
+
     def __init__(self, live_clip, index, config):
         # type: (Live.Clip.Clip, int, ClipConfig) -> None
         super(Clip, self).__init__()
@@ -40,9 +44,14 @@ class Clip(SlotManager, Observable):
         )  # type: ClipPlayingPosition
 
         self.loop.register_observer(self)
+        self.listeners_attached = False
 
         self.previous_hash = 0
 
+        # in lazy mode, listeners are attached when the clip is selected, playing or needed
+        if not Config.LAZY_CLIP_LISTENERS or (live_clip and live_clip.is_playing):
+            self.attach_listeners()
+
     def __eq__(self, clip):
         # type: (object) -> bool
         return isinstance(clip, Clip) and self._clip == clip._clip
@@ -56,6 +65,32 @@ class Clip(SlotManager, Observable):
         if isinstance(observable, ClipLoop):
             self.notify_observers()
 
+    def attach_listeners(self):
+        # type: () -> None
+        if self.listeners_attached:
+            return
+        self.listeners_attached = True
+
+        self.clip_name.attach_listeners()
+        self.loop.attach_listeners()
+
+    @property
+    def listener_count(self):
+        # type: () -> int
+        """Live listeners currently attached"""
+        count = self.LISTENER_COUNT if self.listeners_attached else 0
+        if self.clip_name.listeners_attached:
+            count += self.clip_name.LISTENER_COUNT
+        if self.loop.listeners_attached:
+            count += self.loop.LISTENER_COUNT
+        return count
+
+    @property
+    def max_listener_count(self):
+        # type: () -> int
+        """Live listeners attached when not in lazy mode"""
+        return self.LISTENER_COUNT + self.clip_name.LISTENER_COUNT + self.loop.LISTENER_COUNT
+
     name = cast(str, ForwardTo("clip_name", "name"))
     color = cast(int, ForwardTo("appearance", "color"))
     length = cast(float, ForwardTo("loop", "length"))
@@ -93,6 +128,8 @@ class Clip(SlotManager, Observable):
         # type: (bool) -> None
         if self._clip:
             self._clip.muted = muted
+            # the scene caches depend on it (mute from Live is seen on the next bar)
+            self.notify_observers()
 
     _QUANTIZATION_OPTIONS = [
         Live.Song.RecordingQuantization.rec_q_no_q,
@@ -115,12 +152,16 @@ class Clip(SlotManager, Observable):
     def is_playing(self, is_playing):
         # type: (Clip, bool) -> None
         if self._clip:
+            if is_playing:
+                self.attach_listeners()
             self._clip.is_playing = is_playing
 
     def select(self):
         # type: () -> None
+        self.attach_listeners()
         self.selected = True
-        self.notify_observers()
+        # the observers read the flag
+        self.notify_observers(immediate=True)
         self.selected = False
 
     def blink(self):
@@ -154,6 +195,7 @@ class Clip(SlotManager, Observable):
     def fire(self):
         # type: () -> Optional[Sequence]
         if self._clip:
+            self.attach_listeners()
             self._clip.fire()
         return None
 
@@ -18,13 +18,15 @@ if TYPE_CHECKING:
 class ClipInfo(object):
     _DEBUG = False
 
-    def __init__(self, clip, device_parameters, duplicate_clips=None):
-        # type: (Clip, List[DeviceParameter], Optional[List[Clip]]) -> None
+    def __init__(self, clip, device_parameters, duplicate_clips=None, clip_hash=None):
+        # type: (Clip, List[DeviceParameter], Optional[List[Clip]], Optional[int]) -> None
         duplicate_clips = duplicate_clips or []
 
         self.index = clip.index
         self.name = clip.name
-        self.hash = clip.get_hash(device_parameters)
+        if clip_hash is None:
+            clip_hash = clip.get_hash(device_parameters)
+        self.hash = clip_hash
         self._duplicate_indexes = [clip.index for clip in duplicate_clips]
 
         self.replaced_clip_slots = []  # type: List[AudioClipSlot]
@@ -46,7 +48,10 @@ class ClipInfo(object):
             clip_hash = clip.get_hash(device_parameters)
             unique_clips_by_hash[clip_hash] = unique_clips_by_hash.get(clip_hash, []) + [clip]
 
-        clip_infos = [cls(clips[0], device_parameters, clips[1:]) for clips in unique_clips_by_hash.values()]
+        clip_infos = [
+            cls(clips[0], device_parameters, clips[1:], clip_hash)
+            for clip_hash, clips in unique_clips_by_hash.items()
+        ]
 
         if clean_duplicates:
             for clips in unique_clips_by_hash.values():
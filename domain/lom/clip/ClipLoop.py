@@ -12,10 +12,19 @@ from protocol0.shared.observer.Observable import Observable
 class ClipLoop(SlotManager, Observable, LoopableInterface):
     """handle start / end markers and loop gracefully"""
 
+    LISTENER_COUNT = 3
+
     def __init__(self, clip):
         # type: (Live.Clip.Clip) -> None
         super(ClipLoop, self).__init__()
         self._clip = clip
+        self.listeners_attached = False
+
+    def attach_listeners(self):
+        # type: () -> None
+        if self.listeners_attached:
+            return
+        self.listeners_attached = True
 
         self._loop_start_listener.subject = self._clip
         self._loop_end_listener.subject = self._clip
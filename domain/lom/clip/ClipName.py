@@ -14,11 +14,21 @@ from protocol0.shared.logging.Logger import Logger
 
 class ClipName(SlotManager):
     _DEBUG = False
+    LISTENER_COUNT = 5
 
     def __init__(self, live_clip):
         # type: (Live.Clip.Clip) -> None
         super(ClipName, self).__init__()
         self._live_clip = live_clip
+        self._base_name = None  # type: Optional[str]
+        self.listeners_attached = False
+
+    def attach_listeners(self):
+        # type: () -> None
+        if self.listeners_attached:
+            return
+        self.listeners_attached = True
+
         self.register_slot(self._live_clip, partial(self._name_listener, force=True), "loop_start")
         self.register_slot(self._live_clip, partial(self._name_listener, force=True), "loop_end")
         self.register_slot(
@@ -26,7 +36,6 @@ class ClipName(SlotManager):
         )
         self.register_slot(self._live_clip, partial(self._name_listener, force=True), "end_marker")
         self._name_listener.subject = self._live_clip
-        self._base_name = None  # type: Optional[str]
 
     @property
     def name(self):
@@ -46,6 +55,8 @@ class ClipName(SlotManager):
     def base_name(self):
         # type: () -> str
         """lazy loading"""
+        # the cached base name is kept up to date by the name listener
+        self.attach_listeners()
         if self._base_name is None:
             self._base_name = self._get_base_name()
         return self._base_name
@@ -3,47 +3,106 @@ from __future__ import division
 from functools import partial
 
 import Live
-from typing import List, Optional, Iterator, Any
+from _Framework.SubjectSlot import subject_slot
+from typing import List, Optional, Iterator, Any, Dict, Tuple, Union
 
 from protocol0.domain.lom.clip.Clip import Clip
+from protocol0.domain.lom.clip.ClipLoop import ClipLoop
 from protocol0.domain.lom.device_parameter.DeviceParameter import DeviceParameter
 from protocol0.domain.lom.device_parameter.LinkedDeviceParameters import LinkedDeviceParameters
 from protocol0.domain.lom.instrument.instrument.InstrumentSimpler import InstrumentSimpler
 from protocol0.domain.lom.note.Note import Note
+from protocol0.domain.lom.note.NoteBuffer import NoteBuffer
+from protocol0.domain.shared.CacheStats import CacheStats
 from protocol0.domain.shared.errors.Protocol0Warning import Protocol0Warning
 from protocol0.domain.shared.scheduler.Scheduler import Scheduler
 from protocol0.domain.shared.utils.list import find_if
 from protocol0.shared.Song import Song
 from protocol0.shared.logging.Logger import Logger
+from protocol0.shared.observer.Observable import Observable
 from protocol0.shared.sequence.Sequence import Sequence
 
 
 class MidiClip(Clip):
+    # notes
+    LISTENER_COUNT = Clip.LISTENER_COUNT + 1
+    CACHE_STATS = CacheStats("midi clip notes")
+    HASH_CACHE_STATS = CacheStats("midi clip notes hash")
+
     def __init__(self, *a, **k):
         # type: (Any, Any) -> None
         super(MidiClip, self).__init__(*a, **k)
-        self._cached_notes = []  # type: List[Note]
+        # Note.key -> note, the notes we set (keeps their float velocity)
+        self._cached_notes = {}  # type: Dict[Tuple[int, int, int, bool], Note]
+        # the clip notes, fetched once per clip modification
+        self._notes = None  # type: Optional[List[Note]]
+        self._notes_hash = None  # type: Optional[int]
 
         # select when a new midi clip is recorded
         if self.is_recording:
             Scheduler.defer(self.select)
 
+    def attach_listeners(self):
+        # type: () -> None
+        if self.listeners_attached:
+            return
+        super(MidiClip, self).attach_listeners()
+        self._notes_listener.subject = self._clip
+
+    def update(self, observable):
+        # type: (Observable) -> None
+        if isinstance(observable, ClipLoop):
+            # the notes are fetched in the loop
+            self._invalidate_notes()
+
+        super(MidiClip, self).update(observable)
+
+    @subject_slot("notes")
+    def _notes_listener(self):
+        # type: () -> None
+        self._invalidate_notes()
+
+    def _invalidate_notes(self):
+        # type: () -> None
+        if self._notes is not None:
+            self.CACHE_STATS.invalidations += 1
+        self._notes = None
+        self._notes_hash = None
+
     def get_hash(self, device_parameters):
         # type: (List[DeviceParameter]) -> int
-        midi_hash = hash(tuple(note.to_data() for note in self.get_notes()))
+        if self._notes_hash is None:
+            self.HASH_CACHE_STATS.recomputes += 1
+            self._notes_hash = hash(tuple(note.to_data() for note in self._get_notes()))
+        else:
+            self.HASH_CACHE_STATS.hits += 1
 
-        return hash((midi_hash, self.automation.get_hash(device_parameters)))
+        # there is no envelope listener : the automation footprint is computed each time
+        return hash((self._notes_hash, self.automation.get_hash(device_parameters)))
 
     @property
     def starts_at_1(self):
         # type: () -> bool
-        return any(note.start == 0 for note in self.get_notes())
+        return any(note.start == 0 for note in self._get_notes())
 
     def get_notes(self):
         # type: () -> List[Note]
+        """Copies : the callers modify the notes before setting them"""
+        return [note.copy() for note in self._get_notes()]
+
+    def _get_notes(self):
+        # type: () -> List[Note]
+        """The cached notes, read only"""
         if not self._clip:
             return []
 
+        # the notes cache is invalidated by the listeners
+        self.attach_listeners()
+        if self._notes is not None:
+            self.CACHE_STATS.hits += 1
+            return self._notes
+
+        self.CACHE_STATS.recomputes += 1
         # noinspection PyArgumentList,PyUnresolvedReferences
         clip_notes = [
             # Note(*note) for note in self._clip.get_notes(self.loop.start, 0, self.length, 128)
@@ -53,30 +112,41 @@ class MidiClip(Clip):
 
         notes = list(self._get_notes_from_cache(notes=clip_notes))
         notes.sort(key=lambda x: x.start)
+        self._notes = notes
         return notes
 
     def _get_notes_from_cache(self, notes):
         # type: (List[Note]) -> Iterator[Note]
         for note in notes:
-            yield next(
-                (cached_note for cached_note in self._cached_notes if cached_note == note), note
-            )
+            yield self._cached_notes.get(note.key, note)
+
+    def get_note_buffer(self):
+        # type: () -> NoteBuffer
+        """For clip wide transforms"""
+        return NoteBuffer.from_notes(self._get_notes())
 
     def set_notes(self, notes):
-        # type: (List[Note]) -> Optional[Sequence]
+        # type: (Union[List[Note], NoteBuffer]) -> Optional[Sequence]
         if not self._clip:
             return None
-        self._cached_notes = notes
+        # copies : the NoteBuffer views and the caller notes can still be modified
+        self._cached_notes = {note.key: note.copy() for note in notes}
+        if isinstance(notes, NoteBuffer):
+            notes_data = notes.to_data()
+        else:
+            notes_data = tuple(note.to_data() for note in notes)
+
         self._clip.select_all_notes()  # noqa
         seq = Sequence()
-        seq.add(partial(self._clip.replace_selected_notes, tuple(note.to_data() for note in notes)))
+        seq.add(partial(self._clip.replace_selected_notes, notes_data))
+        seq.add(self._invalidate_notes)
         # noinspection PyUnresolvedReferences
         seq.defer()
         return seq.done()
 
     def on_added(self):
         # type: () -> Optional[Sequence]
-        if len(self.get_notes()) > 0 or self.is_recording:
+        if len(self._get_notes()) > 0 or self.is_recording:
             return None
 
         self._clip.view.grid_quantization = Live.Clip.GridQuantization.g_eighth
@@ -115,16 +185,10 @@ class MidiClip(Clip):
 
     def scale_velocities(self, go_next, scaling_factor=4):
         # type: (bool, int) -> None
-        notes = self.get_notes()
+        notes = self.get_note_buffer()
         if len(notes) == 0:
             return
-        average_velo = sum([note.velocity for note in notes]) / len(notes)
-        for note in notes:
-            velocity_diff = note.velocity - average_velo
-            if go_next:
-                note.velocity += velocity_diff / (scaling_factor - 1)
-            else:
-                note.velocity -= velocity_diff / scaling_factor
+        notes.scale_velocities(go_next, scaling_factor)
         self.set_notes(notes)
 
     def crop(self):
@@ -137,18 +201,13 @@ class MidiClip(Clip):
     def to_mono(self):
         # type: () -> None
         """If notes overlap : make end of each note match the start of the next one"""
-        notes = self.get_notes()
+        notes = self.get_note_buffer()
 
         if len(notes) < 2:
             return None
 
-        current_note = notes[0]
-
-        for next_note in notes[1:]:
-            current_note.end = max(current_note.end, next_note.start)
-            current_note = next_note
-
-            self.set_notes(notes)
+        notes.to_mono()
+        self.set_notes(notes)
 
     def get_linked_parameters(self, device_parameters):
         # type: (List[DeviceParameter]) -> List[LinkedDeviceParameters]
@@ -1,9 +1,10 @@
 import Live
-from typing import Optional, List, cast
+from typing import Optional, List, cast, Tuple, Sequence
 
 from protocol0.domain.lom.clip.ClipEnvelopeShowedEvent import ClipEnvelopeShowedEvent
 from protocol0.domain.lom.clip.ClipLoop import ClipLoop
 from protocol0.domain.lom.clip.automation.ClipAutomationEnvelope import ClipAutomationEnvelope
+from protocol0.domain.lom.device_parameter.ChainedDeviceParameters import get_live_parameters
 from protocol0.domain.lom.device_parameter.DeviceParameter import DeviceParameter
 from protocol0.domain.shared.ApplicationView import ApplicationView
 from protocol0.domain.shared.errors.error_handler import handle_error
@@ -18,10 +19,9 @@ class ClipAutomation(object):
 
     def get_hash(self, device_parameters):
         # type: (List[DeviceParameter]) -> int
-        automated_parameters = self.get_automated_parameters(device_parameters)
-        envs = [self.get_envelope(param) for param in automated_parameters]
+        envelopes = self._get_automated_envelopes(device_parameters)
 
-        return hash(tuple([env.hash for env in envs]))
+        return hash(tuple([env.hash for _, env in envelopes]))
 
     def has_automation(self, device_parameters):
         # type: (List[DeviceParameter]) -> bool
@@ -29,17 +29,27 @@ class ClipAutomation(object):
 
     def get_automated_parameters(self, device_parameters):
         # type: (List[DeviceParameter]) -> List[DeviceParameter]
-        automated_parameters = []
-        for parameter in device_parameters:
+        return [parameter for parameter, _ in self._get_automated_envelopes(device_parameters)]
+
+    def _get_automated_envelopes(self, device_parameters):
+        # type: (Sequence[DeviceParameter]) -> List[Tuple[DeviceParameter, ClipAutomationEnvelope]]
+        """Scans the raw parameters : only the automated ones get wrapped"""
+        automated_envelopes = []
+        if not self._live_clip:
+            return automated_envelopes
+
+        for index, live_parameter in enumerate(get_live_parameters(device_parameters)):
             # ignore rev2 b layer (we edit only A)
-            if parameter.name.startswith("B-"):
+            if live_parameter is None or live_parameter.name.startswith("B-"):
                 continue
-            if self.get_envelope(parameter) is None:
+            env = self._live_clip.automation_envelope(live_parameter)
+            if not env:
                 continue
 
-            automated_parameters.append(parameter)
+            envelope = ClipAutomationEnvelope(env, self._loop.length)
+            automated_envelopes.append((device_parameters[index], envelope))
 
-        return automated_parameters
+        return automated_envelopes
 
     def show_parameter_envelope(self, parameter):
         # type: (DeviceParameter) -> None
@@ -1,11 +1,13 @@
+from __future__ import division
+
 import Live
 
 from protocol0.domain.shared.backend.Backend import Backend
-from protocol0.domain.shared.utils.utils import float_seq
 
 
 class ClipAutomationEnvelope(object):
-    _FOOTPRINT_MEASURES = 100
+    # values sampled whatever the clip length
+    _FOOTPRINT_MEASURES = 16
 
     def __init__(self, envelope, length):
         # type: (Live.Clip.AutomationEnvelope, float) -> None
@@ -15,12 +17,13 @@ class ClipAutomationEnvelope(object):
     @property
     def hash(self):
         # type: () -> float
-        """pick up to 10 values to generate a footprint of the automation"""
-        values = [
-            self.value_at_time(i)
-            for i in float_seq(0, int(self._length), self._length / self._FOOTPRINT_MEASURES)
-        ]
-        values.append(self.value_at_time(self._length))
+        """
+        Footprint of the automation : the clip bounds and the middle of each measure
+        (steps are mostly drawn on the grid)
+        """
+        measure_length = self._length / self._FOOTPRINT_MEASURES
+        times = [(i + 0.5) * measure_length for i in range(self._FOOTPRINT_MEASURES)]
+        values = [self.value_at_time(time) for time in [0] + times + [self._length]]
 
         return hash(tuple(values))
 
@@ -9,6 +9,7 @@ from protocol0.domain.lom.clip.ClipConfig import ClipConfig
 from protocol0.domain.lom.clip.ClipCreatedOrDeletedEvent import ClipCreatedOrDeletedEvent
 from protocol0.domain.lom.clip.ClipSlotSelectedEvent import ClipSlotSelectedEvent
 from protocol0.domain.lom.clip_slot.ClipSlotAppearance import ClipSlotAppearance
+from protocol0.domain.lom.clip_slot.ClipSlotIndex import ClipSlotIndex
 from protocol0.domain.shared.errors.Protocol0Warning import Protocol0Warning
 from protocol0.domain.shared.event.DomainEventBus import DomainEventBus
 from protocol0.domain.shared.scheduler.Scheduler import Scheduler
@@ -56,6 +57,7 @@ class ClipSlot(SlotManager, Observable):
 
     def _map_clip(self, is_new=False):
         # type: (bool) -> None
+        previous_clip = self.clip
         if self.has_clip:
             self.clip = self.CLIP_CLASS(self._clip_slot.clip, self.index, self._clip_config)
 
@@ -69,6 +71,8 @@ class ClipSlot(SlotManager, Observable):
 
             self.clip = None
 
+        ClipSlotIndex.update_clip(self, previous_clip)
+
     def update(self, observable):
         # type: (Observable) -> None
         if isinstance(observable, Clip):
@@ -0,0 +1,97 @@
+import Live
+from typing import Dict, Optional, List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from protocol0.domain.lom.clip.Clip import Clip
+    from protocol0.domain.lom.clip_slot.ClipSlot import ClipSlot
+
+
+class ClipSlotIndex(object):
+    """
+    Set wide live ptr -> ClipSlot and live ptr -> Clip index.
+
+    Clip slots are added and removed by SimpleTrackClipSlots (build and disconnect),
+    their clip is updated by the ClipSlot has_clip listener.
+    Entries are removed only by the object they point to : a replaced track
+    disconnecting does not remove the clip slots of the new one.
+    """
+
+    _CLIP_SLOTS = {}  # type: Dict[int, ClipSlot]
+    _CLIPS = {}  # type: Dict[int, Clip]
+
+    @classmethod
+    def reset(cls):
+        # type: () -> None
+        cls._CLIP_SLOTS = {}
+        cls._CLIPS = {}
+
+    @classmethod
+    def add_clip_slot(cls, clip_slot):
+        # type: (ClipSlot) -> None
+        cls._CLIP_SLOTS[clip_slot._clip_slot._live_ptr] = clip_slot
+        if clip_slot.clip is not None:
+            cls._CLIPS[clip_slot.clip._clip._live_ptr] = clip_slot.clip
+
+    @classmethod
+    def remove_clip_slot(cls, clip_slot):
+        # type: (ClipSlot) -> None
+        live_ptr = clip_slot._clip_slot._live_ptr
+        if cls._CLIP_SLOTS.get(live_ptr) is clip_slot:
+            del cls._CLIP_SLOTS[live_ptr]
+        if clip_slot.clip is not None:
+            cls._remove_clip(clip_slot.clip)
+
+    @classmethod
+    def update_clip(cls, clip_slot, previous_clip):
+        # type: (ClipSlot, Optional[Clip]) -> None
+        if cls._CLIP_SLOTS.get(clip_slot._clip_slot._live_ptr) is not clip_slot:
+            return
+
+        if previous_clip is not None:
+            cls._remove_clip(previous_clip)
+        if clip_slot.clip is not None:
+            cls._CLIPS[clip_slot.clip._clip._live_ptr] = clip_slot.clip
+
+    @classmethod
+    def _remove_clip(cls, clip):
+        # type: (Clip) -> None
+        live_ptr = clip._clip._live_ptr
+        if cls._CLIPS.get(live_ptr) is clip:
+            del cls._CLIPS[live_ptr]
+
+    @classmethod
+    def get_clip_slot(cls, live_clip_slot):
+        # type: (Live.ClipSlot.ClipSlot) -> Optional[ClipSlot]
+        return cls._CLIP_SLOTS.get(live_clip_slot._live_ptr)
+
+    @classmethod
+    def get_clip(cls, live_clip):
+        # type: (Live.Clip.Clip) -> Optional[Clip]
+        return cls._CLIPS.get(live_clip._live_ptr)
+
+    @classmethod
+    def get_inconsistencies(cls, clip_slots):
+        # type: (List[ClipSlot]) -> List[str]
+        """Compares the index with the clip slots of the set"""
+        errors = []
+        clip_slot_ptrs = set()
+        clip_ptrs = set()
+        for clip_slot in clip_slots:
+            live_ptr = clip_slot._clip_slot._live_ptr
+            clip_slot_ptrs.add(live_ptr)
+            if cls._CLIP_SLOTS.get(live_ptr) is not clip_slot:
+                errors.append("%s is not indexed" % clip_slot)
+
+            if clip_slot.clip is not None:
+                clip_ptrs.add(clip_slot.clip._clip._live_ptr)
+                if cls._CLIPS.get(clip_slot.clip._clip._live_ptr) is not clip_slot.clip:
+                    errors.append("%s is not indexed" % clip_slot.clip)
+
+        for live_ptr, clip_slot in cls._CLIP_SLOTS.items():
+            if live_ptr not in clip_slot_ptrs:
+                errors.append("%s is indexed but not in the set" % clip_slot)
+        for live_ptr, clip in cls._CLIPS.items():
+            if live_ptr not in clip_ptrs:
+                errors.append("%s is indexed but not in the set" % clip)
+
+        return errors
@@ -1,12 +1,11 @@
 import Live
 from _Framework.SubjectSlot import SlotManager, subject_slot
-from typing import List, Any, Type, Optional, Union
+from typing import Any, Type, Optional, Union
 
 from protocol0.domain.lom.device.DeviceEnum import DeviceEnum
 from protocol0.domain.lom.device_parameter.DeviceParameter import DeviceParameter
 from protocol0.domain.lom.device_parameter.DeviceParameterEnum import DeviceParameterEnum
-from protocol0.domain.shared.errors.Protocol0Error import Protocol0Error
-from protocol0.domain.shared.utils.list import find_if
+from protocol0.domain.lom.device_parameter.DeviceParameters import DeviceParameters
 from protocol0.domain.shared.utils.string import smart_string
 
 
@@ -16,7 +15,7 @@ class Device(SlotManager):
         super(Device, self).__init__()
         self._device = device
         self._view = self._device.view  # type: Live.Device.Device.View
-        self.parameters = []  # type: List[DeviceParameter]
+        self.parameters = DeviceParameters("", [])  # type: DeviceParameters
         self._parameters_listener.subject = self._device
         self._parameters_listener()
         self.can_have_drum_pads = self._device.can_have_drum_pads  # type: bool
@@ -57,24 +56,18 @@ class Device(SlotManager):
     @property
     def enum(self):
         # type: () -> Optional[DeviceEnum]
-        try:
-            return DeviceEnum.from_value(self.name)
-        except Protocol0Error:
-            return None
+        return DeviceEnum.get_from_value(self.name)
 
     @subject_slot("parameters")
     def _parameters_listener(self):
         # type: () -> None
-        self.parameters = [
-            DeviceParameter.create_from_name(self.name, parameter)
-            for parameter in self._device.parameters
-        ]
+        self.parameters = DeviceParameters(self.name, self._device.parameters)
 
     def get_parameter_by_name(self, device_parameter_name):
         # type: (Union[DeviceParameterEnum, str]) -> Optional[DeviceParameter]
         if isinstance(device_parameter_name, DeviceParameterEnum):
             device_parameter_name = device_parameter_name.parameter_name
-        return find_if(lambda p: p.name == device_parameter_name, self.parameters)
+        return self.parameters.get_by_name(device_parameter_name)
 
     @property
     def name(self):
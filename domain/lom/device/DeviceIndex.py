@@ -0,0 +1,88 @@
+import collections
+import itertools
+
+from typing import List, Dict, Optional, Tuple, Type, TypeVar
+
+from protocol0.domain.lom.device.Device import Device
+from protocol0.domain.lom.device.DeviceEnum import DeviceEnum
+from protocol0.domain.lom.device.RackDevice import RackDevice
+
+DeviceT = TypeVar("DeviceT", bound=Device)
+# device index in the track or chain, then chain index and device index for each rack
+DevicePath = Tuple[int, ...]
+
+
+class DeviceIndex(object):
+    """
+    Flattened device tree of a track, built by the devices / chains listeners only.
+
+    Renaming a device doesn't rebuild the index : the enum lookups read the current
+    device enums (DeviceEnum.get_from_value is a dict lookup)
+    """
+
+    _VERSIONS = itertools.count(1)
+
+    def __init__(self, devices):
+        # type: (List[Device]) -> None
+        # identifies this build (see SetDeviceIndex)
+        self.version = next(self._VERSIONS)
+        self.all = []  # type: List[Device]
+        self._by_live_ptr = {}  # type: Dict[int, Device]
+        self._by_class = collections.OrderedDict()  # type: Dict[Type[Device], List[Device]]
+        # id(device) -> path (devices are not hashable)
+        self._paths = {}  # type: Dict[int, DevicePath]
+
+        self._add_devices(devices, ())
+
+    def __repr__(self):
+        # type: () -> str
+        return "DeviceIndex(%s devices)" % len(self.all)
+
+    def _add_devices(self, devices, path):
+        # type: (List[Device], DevicePath) -> None
+        for device_index, device in enumerate(devices):
+            if device is None:
+                continue
+
+            device_path = path + (device_index,)
+            self._add_device(device, device_path)
+
+            if not isinstance(device, RackDevice):
+                continue
+
+            # drum racks : only the selected pad
+            if device.can_have_drum_pads and device.can_have_chains and device.selected_chain:
+                chain = device.selected_chain
+                self._add_devices(chain.devices, device_path + (chain.index,))
+            else:
+                for chain in device.chains:
+                    self._add_devices(chain.devices, device_path + (chain.index,))
+
+    def _add_device(self, device, path):
+        # type: (Device, DevicePath) -> None
+        self.all.append(device)
+        self._by_live_ptr[device._device._live_ptr] = device
+        self._by_class.setdefault(device.__class__, []).append(device)
+        self._paths[id(device)] = path
+
+    def get_from_live_device(self, live_device):
+        # type: (object) -> Optional[Device]
+        return self._by_live_ptr.get(getattr(live_device, "_live_ptr", None))
+
+    def get_from_enum(self, device_enum):
+        # type: (DeviceEnum) -> List[Device]
+        return [device for device in self.all if device.enum == device_enum]
+
+    def get_from_class(self, device_class):
+        # type: (Type[DeviceT]) -> List[DeviceT]
+        """Including subclasses"""
+        return [
+            device
+            for cls, devices in self._by_class.items()
+            if issubclass(cls, device_class)
+            for device in devices
+        ]
+
+    def get_path(self, device):
+        # type: (Device) -> Optional[DevicePath]
+        return self._paths.get(id(device))
@@ -125,10 +125,8 @@ class DrumRackService(object):
     def _from_drum_rack_to_simpler_notes(self):
         # type: () -> None
         for clip in cast(SimpleMidiTrack, Song.selected_track()).clips:
-            notes = clip.get_notes()
-            for note in notes:
-                note.pitch = 60
-
+            notes = clip.get_note_buffer()
+            notes.set_pitch(60)
             clip.set_notes(notes)
 
     def clean_racks(self, track=None):
@@ -33,6 +33,9 @@ class RackDevice(Device, Observable):
         for chain in self.chains:
             chain.register_observer(self)
 
+        # the track device index is built again
+        self.notify_observers()
+
     @property
     def selected_chain(self):
         # type: () -> Optional[DeviceChain]
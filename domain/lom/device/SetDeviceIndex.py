@@ -0,0 +1,50 @@
+from typing import List, Tuple, Optional
+
+from protocol0.domain.lom.device.Device import Device
+from protocol0.domain.lom.device.DeviceEnum import DeviceEnum
+from protocol0.domain.lom.track.simple_track.SimpleTrack import SimpleTrack
+from protocol0.domain.shared.CacheStats import CacheStats
+from protocol0.shared.Song import Song
+
+TrackDevice = Tuple[SimpleTrack, Device]
+
+
+class SetDeviceIndex(object):
+    """
+    Devices of every track for the audit services,
+    aggregated again only when a track device index was rebuilt.
+    The enum and name lookups read the current device names
+    """
+
+    CACHE_STATS = CacheStats("set device index")
+
+    _INSTANCE = None  # type: Optional[SetDeviceIndex]
+
+    def __init__(self, index_versions):
+        # type: (Tuple[int, ...]) -> None
+        self._index_versions = index_versions
+        self.all = [
+            (track, device) for track in Song.all_simple_tracks() for device in track.devices.all
+        ]  # type: List[TrackDevice]
+
+    @classmethod
+    def get(cls):
+        # type: () -> SetDeviceIndex
+        index_versions = tuple(
+            track.devices.index.version for track in Song.all_simple_tracks()
+        )
+        if cls._INSTANCE is not None and cls._INSTANCE._index_versions == index_versions:
+            cls.CACHE_STATS.hits += 1
+        else:
+            cls.CACHE_STATS.recomputes += 1
+            cls._INSTANCE = SetDeviceIndex(index_versions)
+
+        return cls._INSTANCE
+
+    def get_from_enum(self, device_enum):
+        # type: (DeviceEnum) -> List[TrackDevice]
+        return [(track, device) for track, device in self.all if device.enum == device_enum]
+
+    def get_from_name(self, name):
+        # type: (str) -> List[TrackDevice]
+        return [(track, device) for track, device in self.all if device.name == name]
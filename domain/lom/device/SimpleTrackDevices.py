@@ -1,18 +1,17 @@
-from itertools import chain
-
 import Live
 from _Framework.SubjectSlot import subject_slot, SlotManager
-from typing import List, Optional, Iterator, cast
+from typing import List, Optional, Iterator, cast, Union
 
 from protocol0.domain.lom.device.Device import Device
 from protocol0.domain.lom.device.DeviceEnum import DeviceEnum
+from protocol0.domain.lom.device.DeviceIndex import DeviceIndex
 from protocol0.domain.lom.device.MixerDevice import MixerDevice
 from protocol0.domain.lom.device.RackDevice import RackDevice
+from protocol0.domain.lom.device_parameter.ChainedDeviceParameters import ChainedDeviceParameters
 from protocol0.domain.lom.device_parameter.DeviceParameter import DeviceParameter
+from protocol0.domain.lom.device_parameter.DeviceParameters import DeviceParameters
 from protocol0.domain.shared.LiveObjectMapping import LiveObjectMapping
-from protocol0.domain.shared.errors.Protocol0Error import Protocol0Error
 from protocol0.domain.shared.errors.Protocol0Warning import Protocol0Warning
-from protocol0.domain.shared.utils.list import find_if
 from protocol0.shared.observer.Observable import Observable
 
 
@@ -22,7 +21,7 @@ class SimpleTrackDevices(SlotManager, Observable):
         super(SimpleTrackDevices, self).__init__()
         self._track = live_track
         self._devices = []  # type: List[Device]
-        self._all_devices = []  # type: List[Device]
+        self.index = DeviceIndex([])
         self._devices_listener.subject = live_track
         self._devices_mapping = LiveObjectMapping(Device.make)
         self.mixer_device = MixerDevice(live_track.mixer_device)
@@ -52,8 +51,8 @@ class SimpleTrackDevices(SlotManager, Observable):
 
         self._devices_mapping.build(self._track.devices)
         self._devices = cast(List[Device], self._devices_mapping.all)
-        self._all_devices = self._find_all_devices(self._devices)
-        for device in self._all_devices:
+        self.index = DeviceIndex(self._devices)
+        for device in self.index.all:
             if isinstance(device, RackDevice):
                 device.register_observer(self)
 
@@ -62,15 +61,13 @@ class SimpleTrackDevices(SlotManager, Observable):
     @property
     def all(self):
         # type: () -> List[Device]
-        return self._all_devices
+        return self.index.all
 
     @property
     def selected(self):
         # type: () -> Optional[Device]
         if self._track and self._track.view.selected_device:
-            device = find_if(
-                lambda d: d._device == self._track.view.selected_device, self.all
-            )  # type: Optional[Device]
+            device = self.index.get_from_live_device(self._track.view.selected_device)
             if device is None:
                 raise Protocol0Warning(
                     "%s is not in %s devices"
@@ -85,43 +82,12 @@ class SimpleTrackDevices(SlotManager, Observable):
 
     def get_one_from_enum(self, device_enum):
         # type: (DeviceEnum) -> Optional[Device]
-        return find_if(lambda d: d.enum == device_enum, self._all_devices)
+        devices = self.index.get_from_enum(device_enum)
+        return devices[0] if devices else None
 
     def get_from_enum(self, device_enum):
         # type: (DeviceEnum) -> List[Device]
-        devices = []
-        for d in self._all_devices:
-            try:
-                if d.enum == device_enum:
-                    devices.append(d)
-            except Protocol0Error:
-                continue
-
-        return devices
-
-    def _find_all_devices(self, devices, only_visible=False):
-        # type: (Optional[List[Device]], bool) -> List[Device]
-        """Returns a list with all devices from a track or chain"""
-        all_devices = []
-        if devices is None:
-            return []
-        for device in filter(None, devices):  # type: Device
-            if not isinstance(device, RackDevice):
-                all_devices += [device]
-                continue
-
-            if device.can_have_drum_pads and device.can_have_chains and device.selected_chain:
-                all_devices += chain(
-                    [device], self._find_all_devices(device.selected_chain.devices)
-                )
-            elif isinstance(device, RackDevice):
-                all_devices += [device]
-                for device_chain in device.chains:
-                    all_devices += self._find_all_devices(
-                        device_chain.devices, only_visible=only_visible
-                    )
-
-        return all_devices
+        return self.index.get_from_enum(device_enum)
 
     def delete(self, device):
         # type: (Device) -> None
@@ -134,10 +100,12 @@ class SimpleTrackDevices(SlotManager, Observable):
 
     @property
     def parameters(self):
-        # type: () -> List[DeviceParameter]
-        return (
-            list(chain(*[device.parameters for device in self.all])) + self.mixer_device.parameters
-        )
+        # type: () -> ChainedDeviceParameters
+        """Lazy : the device parameters are wrapped on access"""
+        groups = [
+            device.parameters for device in self.all
+        ]  # type: List[Union[DeviceParameters, List[DeviceParameter]]]
+        return ChainedDeviceParameters(groups + [self.mixer_device.parameters])
 
     @property
     def load_time(self):
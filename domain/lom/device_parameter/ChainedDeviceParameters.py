@@ -0,0 +1,83 @@
+import Live
+from typing import List, Optional, Iterator, Any, Sequence, Union
+
+from protocol0.domain.lom.device_parameter.DeviceParameter import DeviceParameter
+from protocol0.domain.lom.device_parameter.DeviceParameters import DeviceParameters
+from protocol0.domain.shared.utils.list import find_if
+
+
+class ChainedDeviceParameters(object):
+    """
+    Read only sequence of the parameters of several devices (e.g. all the track devices).
+    Device parameters stay wrapped on first access
+    """
+
+    def __init__(self, groups):
+        # type: (List[Union[DeviceParameters, List[DeviceParameter]]]) -> None
+        self._groups = groups
+
+    def __repr__(self):
+        # type: () -> str
+        return repr(list(self))
+
+    def __len__(self):
+        # type: () -> int
+        return sum(len(group) for group in self._groups)
+
+    def __getitem__(self, index):
+        # type: (Any) -> Any
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if index >= 0:
+            for group in self._groups:
+                if index < len(group):
+                    return group[index]
+                index -= len(group)
+
+        raise IndexError("device parameter index out of range")
+
+    def __iter__(self):
+        # type: () -> Iterator[DeviceParameter]
+        for group in self._groups:
+            for parameter in group:
+                yield parameter
+
+    def __contains__(self, parameter):
+        # type: (Any) -> bool
+        if not isinstance(parameter, DeviceParameter) or parameter._device_parameter is None:
+            return False
+        return self.get_by_live_ptr(parameter._device_parameter._live_ptr) is parameter
+
+    def __add__(self, other):
+        # type: (List[DeviceParameter]) -> List[DeviceParameter]
+        return list(self) + list(other)
+
+    @property
+    def live_parameters(self):
+        # type: () -> List[Live.DeviceParameter.DeviceParameter]
+        """The raw parameters : reading them doesn't wrap anything"""
+        return [parameter for group in self._groups for parameter in get_live_parameters(group)]
+
+    def get_by_live_ptr(self, live_ptr):
+        # type: (int) -> Optional[DeviceParameter]
+        """The parameter wrapping this Live parameter"""
+        for group in self._groups:
+            if isinstance(group, DeviceParameters):
+                parameter = group.get_by_live_ptr(live_ptr)
+            else:
+                parameter = find_if(lambda p: p._device_parameter._live_ptr == live_ptr, group)
+            if parameter is not None:
+                return parameter
+
+        return None
+
+
+def get_live_parameters(device_parameters):
+    # type: (Sequence[DeviceParameter]) -> Sequence[Live.DeviceParameter.DeviceParameter]
+    """The raw parameters of a parameter sequence, wrapping nothing when it is lazy"""
+    if isinstance(device_parameters, (DeviceParameters, ChainedDeviceParameters)):
+        return device_parameters.live_parameters
+    return [parameter._device_parameter for parameter in device_parameters]
@@ -1,11 +1,16 @@
-from typing import Optional, Any, TYPE_CHECKING
+from typing import Optional, Any, TYPE_CHECKING, Dict, Tuple
 
-from protocol0.domain.shared.errors.Protocol0Error import Protocol0Error
+from protocol0.domain.shared.CacheStats import CacheStats
 from protocol0.shared.AbstractEnum import AbstractEnum
 
 if TYPE_CHECKING:
     from protocol0.domain.lom.device.DeviceEnum import DeviceEnum
 
+# (device name, parameter name) -> enum, most parameters have none
+_FROM_NAME_CACHE = {}  # type: Dict[Tuple[str, str], Optional[DeviceParameterEnum]]
+_FROM_NAME_CACHE_SIZE = 50000
+_FROM_NAME_CACHE_STATS = CacheStats("device parameter enums")
+
 
 class DeviceParameterEnum(AbstractEnum):
     AUTO_FILTER_HIGH_PASS_FREQUENCY = "AUTO FILTER HIGH PASS FREQUENCY"
@@ -78,11 +83,21 @@ class DeviceParameterEnum(AbstractEnum):
     @classmethod
     def from_name(cls, device_name, name):
         # type: (str, str) -> Optional[DeviceParameterEnum]
+        key = (device_name, name)
+        if key in _FROM_NAME_CACHE:
+            _FROM_NAME_CACHE_STATS.hits += 1
+            return _FROM_NAME_CACHE[key]
+
+        _FROM_NAME_CACHE_STATS.recomputes += 1
+        if len(_FROM_NAME_CACHE) >= _FROM_NAME_CACHE_SIZE:
+            _FROM_NAME_CACHE.clear()
+            _FROM_NAME_CACHE_STATS.invalidations += 1
+
         enum_name = "%s %s" % (device_name.upper(), name.upper())
-        try:
-            return DeviceParameterEnum.from_value(enum_name)
-        except Protocol0Error:
-            return None
+        enum = DeviceParameterEnum.get_from_value(enum_name)
+        _FROM_NAME_CACHE[key] = enum
+
+        return enum
 
     @property
     def default_value(self):
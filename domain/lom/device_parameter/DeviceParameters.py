@@ -0,0 +1,123 @@
+import sys
+import time
+
+import Live
+from typing import List, Optional, Dict, Iterator, Any, Sequence
+
+from protocol0.domain.lom.device_parameter.DeviceParameter import DeviceParameter
+
+
+class DeviceParameters(object):
+    """
+    Read only sequence of the device parameters : each one is wrapped on first access
+    (plugins expose up to thousands of parameters, most of them never used)
+    """
+
+    # measured on the first wrapped parameter
+    _WRAPPER_SIZE = None  # type: Optional[int]
+
+    def __init__(self, device_name, live_parameters):
+        # type: (str, Sequence[Live.DeviceParameter.DeviceParameter]) -> None
+        self._device_name = device_name
+        self._live_parameters = tuple(live_parameters)
+        # wrapped parameters by index
+        self._parameters = [None] * len(
+            self._live_parameters
+        )  # type: List[Optional[DeviceParameter]]
+        self._name_to_index = None  # type: Optional[Dict[str, int]]
+        self._live_ptr_to_index = None  # type: Optional[Dict[int, int]]
+
+        self.wrapped_count = 0
+        self.wrap_duration = 0.0
+
+    def __repr__(self):
+        # type: () -> str
+        return repr(list(self))
+
+    def __len__(self):
+        # type: () -> int
+        return len(self._live_parameters)
+
+    def __getitem__(self, index):
+        # type: (Any) -> Any
+        if isinstance(index, slice):
+            return [self._get(i) for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("device parameter index out of range")
+
+        return self._get(index)
+
+    def __iter__(self):
+        # type: () -> Iterator[DeviceParameter]
+        for index in range(len(self)):
+            yield self._get(index)
+
+    def __add__(self, other):
+        # type: (List[DeviceParameter]) -> List[DeviceParameter]
+        return list(self) + list(other)
+
+    def _get(self, index):
+        # type: (int) -> DeviceParameter
+        parameter = self._parameters[index]
+        if parameter is None:
+            start_at = time.time()
+            parameter = DeviceParameter.create_from_name(
+                self._device_name, self._live_parameters[index]
+            )
+            self._parameters[index] = parameter
+            self.wrapped_count += 1
+            self.wrap_duration += time.time() - start_at
+
+            if DeviceParameters._WRAPPER_SIZE is None:
+                DeviceParameters._WRAPPER_SIZE = sys.getsizeof(parameter) + sys.getsizeof(
+                    parameter.__dict__
+                )
+
+        return parameter
+
+    @property
+    def live_parameters(self):
+        # type: () -> Sequence[Live.DeviceParameter.DeviceParameter]
+        """The raw parameters : reading them doesn't wrap anything"""
+        return self._live_parameters
+
+    @property
+    def memory_size(self):
+        # type: () -> int
+        """Approximate size in bytes of the wrapped parameters"""
+        wrapper_size = self._WRAPPER_SIZE or 0
+        return sys.getsizeof(self._parameters) + self.wrapped_count * wrapper_size
+
+    def get_by_name(self, name):
+        # type: (str) -> Optional[DeviceParameter]
+        """First parameter with this name"""
+        index = self._get_index(name)
+        # some plugins rename their parameters (e.g. on instrument change)
+        if index is None or self._live_parameters[index].name != name:
+            self._name_to_index = None
+            index = self._get_index(name)
+
+        return self._get(index) if index is not None else None
+
+    def _get_index(self, name):
+        # type: (str) -> Optional[int]
+        if self._name_to_index is None:
+            self._name_to_index = {}
+            for index in reversed(range(len(self._live_parameters))):
+                self._name_to_index[self._live_parameters[index].name] = index
+
+        return self._name_to_index.get(name)
+
+    def get_by_live_ptr(self, live_ptr):
+        # type: (int) -> Optional[DeviceParameter]
+        """The parameter wrapping this Live parameter"""
+        if self._live_ptr_to_index is None:
+            self._live_ptr_to_index = {
+                parameter._live_ptr: index for index, parameter in enumerate(self._live_parameters)
+            }
+
+        index = self._live_ptr_to_index.get(live_ptr)
+        return self._get(index) if index is not None else None
@@ -3,6 +3,9 @@ import os
 from typing import List, Optional
 
 from protocol0.domain.lom.instrument.preset.InstrumentPreset import InstrumentPreset
+from protocol0.domain.lom.instrument.preset.preset_importer.PresetDirectoryIndex import (
+    PresetDirectoryIndex,
+)
 from protocol0.domain.lom.instrument.preset.preset_importer.PresetImportInterface import (
     PresetImportInterface,
 )
@@ -16,13 +19,14 @@ class DirectoryPresetImporter(PresetImportInterface):
             self._extensions = [extension]
         else:
             self._extensions = [".wav", ".aif"]
+        self._directory_index = PresetDirectoryIndex(path)
 
     def _import_presets(self):
         # type: () -> List[InstrumentPreset]
         presets = []  # type: List[InstrumentPreset]
         has_categories = False
 
-        for root, dir_names, files in os.walk(self._path):
+        for root, dir_names, files in self._directory_index.walk():
             if len(dir_names):
                 has_categories = True
 
@@ -30,7 +34,7 @@ class DirectoryPresetImporter(PresetImportInterface):
                 if root == self._path:
                     category = "unclassified"
                 else:
-                    category = root.replace(self._path + "\\", "").split("\\")[0]
+                    category = root.replace(self._path + os.sep, "").split(os.sep)[0]
 
                 if category.startswith("_"):
                     continue
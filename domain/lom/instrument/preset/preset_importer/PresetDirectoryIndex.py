@@ -0,0 +1,139 @@
+import hashlib
+import json
+import os
+import sys
+
+from typing import Dict, List, Tuple, Any, Optional, Text
+
+from protocol0.shared.Config import Config
+from protocol0.shared.logging.Logger import Logger
+
+# directory path -> {"mtime": float, "dirs": [str], "files": [str]}
+DirectoryEntries = Dict[str, Dict[str, Any]]
+
+
+class PresetDirectoryIndex(object):
+    """
+    Listing of a preset (or sample) directory tree, saved on disk in one file per root.
+
+    Each directory is stored with its mtime : a walk only lists again the directories
+    that changed (a file or directory was added, removed or renamed in it).
+    The other directories are only stat'ed.
+    """
+
+    # root -> entries of the last walk, loaded from disk once
+    _ENTRIES = {}  # type: Dict[str, DirectoryEntries]
+
+    def __init__(self, path, index_directory=None):
+        # type: (str, Optional[str]) -> None
+        self._path = path
+        self._index_directory = index_directory or Config.PRESET_INDEX_DIRECTORY
+        self.listed_directory_count = 0
+
+    def __repr__(self):
+        # type: () -> str
+        return "PresetDirectoryIndex(%s)" % self._path
+
+    @property
+    def _index_path(self):
+        # type: () -> str
+        path = self._path if isinstance(self._path, bytes) else self._path.encode("utf-8")
+        path_hash = hashlib.md5(path).hexdigest()
+        return os.path.join(self._index_directory, "%s.json" % path_hash)
+
+    @property
+    def _root(self):
+        # type: () -> Text
+        """With a unicode path, os.listdir returns unicode names on python 2 (json serializable)"""
+        if isinstance(self._path, bytes):
+            return self._path.decode(sys.getfilesystemencoding() or "utf-8")
+        return self._path
+
+    @classmethod
+    def clear_memory_cache(cls):
+        # type: () -> None
+        cls._ENTRIES = {}
+
+    def walk(self):
+        # type: () -> List[Tuple[str, List[str], List[str]]]
+        """Same output as os.walk (top down)"""
+        self.listed_directory_count = 0
+        if self._path not in self._ENTRIES:
+            self._ENTRIES[self._path] = self._load()
+
+        entries = self._ENTRIES[self._path]
+        walked_entries = {}  # type: DirectoryEntries
+        directories = []  # type: List[Tuple[str, List[str], List[str]]]
+
+        stack = [self._root]
+        while stack:
+            path = stack.pop()
+            try:
+                mtime = os.stat(path).st_mtime
+            except OSError:
+                continue
+
+            entry = entries.get(path)
+            if entry is None or entry["mtime"] != mtime:
+                entry = self._list_directory(path, mtime)
+
+            walked_entries[path] = entry
+            directories.append((path, entry["dirs"], entry["files"]))
+            stack.extend(os.path.join(path, name) for name in reversed(entry["dirs"]))
+
+        if self.listed_directory_count or len(walked_entries) != len(entries):
+            self._ENTRIES[self._path] = walked_entries
+            self._save(walked_entries)
+
+        return directories
+
+    def _list_directory(self, path, mtime):
+        # type: (str, float) -> Dict[str, Any]
+        self.listed_directory_count += 1
+        dir_names = []  # type: List[str]
+        file_names = []  # type: List[str]
+
+        if hasattr(os, "scandir"):
+            for dir_entry in os.scandir(path):
+                if dir_entry.is_dir():
+                    dir_names.append(dir_entry.name)
+                else:
+                    file_names.append(dir_entry.name)
+        else:  # python 2
+            for name in os.listdir(path):
+                if os.path.isdir(os.path.join(path, name)):
+                    dir_names.append(name)
+                else:
+                    file_names.append(name)
+
+        return {"mtime": mtime, "dirs": dir_names, "files": file_names}
+
+    def _load(self):
+        # type: () -> DirectoryEntries
+        if not os.path.exists(self._index_path):
+            return {}
+
+        try:
+            with open(self._index_path) as f:
+                return json.load(f)
+        except (IOError, ValueError) as e:
+            Logger.warning("Couldn't load preset index of %s: %s" % (self._path, e))
+            return {}
+
+    def _save(self, entries):
+        # type: (DirectoryEntries) -> None
+        """Written to a temporary file first : a failed save keeps the previous index"""
+        temporary_path = self._index_path + ".tmp"
+        try:
+            if not os.path.isdir(self._index_directory):
+                os.makedirs(self._index_directory)
+            with open(temporary_path, "w") as f:
+                json.dump(entries, f)
+            if hasattr(os, "replace"):
+                os.replace(temporary_path, self._index_path)
+            else:  # python 2 : rename doesn't overwrite on windows
+                if os.path.exists(self._index_path):
+                    os.remove(self._index_path)
+                os.rename(temporary_path, self._index_path)
+        except (IOError, OSError, ValueError, UnicodeError) as e:
+            Logger.warning("Couldn't save preset index of %s: %s" % (self._path, e))
@@ -8,6 +8,10 @@ from protocol0.domain.shared.utils.utils import clamp
 
 class Note(object):
     MIN_DURATION = 1 / 128
+    # start and duration tolerance of __eq__, also the key quantization step
+    DELTA = 0.00001
+
+    __slots__ = ("_pitch", "_start", "_duration", "_velocity", "_muted")
 
     def __init__(self, pitch=127, start=0, duration=1, velocity=127, muted=False):
         # type: (int, float, float, int, bool) -> None
@@ -48,13 +52,36 @@ class Note(object):
             velocity=note.velocity
         )
 
+    @property
+    def key(self):
+        # type: () -> Tuple[int, int, int, bool]
+        """
+        Hashable identity of the note, start and duration quantized to the __eq__ delta.
+
+        NB : equal notes get the same key, except the ones less than a delta apart
+        on each side of a quantization boundary (a cache miss, not a wrong match)
+        """
+        return (
+            self.pitch,
+            int(round(self.start / self.DELTA)),
+            int(round(self.duration / self.DELTA)),
+            self.muted,
+        )
+
+    def copy(self):
+        # type: () -> Note
+        note = Note(self._pitch, self._start, self._duration, muted=self._muted)
+        # keeps the float velocity
+        note._velocity = self._velocity
+        return note
+
     def to_data(self):
         # type: () -> Tuple[int, float, float, int, bool]
         return self.pitch, self.start, self.duration, int(self.velocity), self.muted
 
-    def _is_value_equal(self, val1, val2, delta=0.00001):
-        # type: (float, float, float) -> bool
-        return abs(val1 - val2) < delta
+    def _is_value_equal(self, val1, val2):
+        # type: (float, float) -> bool
+        return abs(val1 - val2) < self.DELTA
 
     @property
     def pitch(self):
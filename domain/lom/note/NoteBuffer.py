@@ -0,0 +1,127 @@
+from __future__ import division
+
+from array import array
+
+from typing import Iterable, Iterator, Tuple, Dict
+
+from protocol0.domain.lom.note.Note import Note
+from protocol0.domain.lom.note.NoteView import NoteView
+from protocol0.domain.shared.utils.utils import clamp
+
+
+class NoteBuffer(object):
+    """
+    Column oriented notes : one array per note attribute.
+
+    The columns hold the values Note would return (clamped),
+    so that clip wide transforms work on the columns instead of Note properties.
+    Iterating yields NoteViews on the rows, they are invalidated by sort.
+    """
+
+    __slots__ = ("pitches", "starts", "durations", "velocities", "muted")
+
+    def __init__(self, pitches=(), starts=(), durations=(), velocities=(), muted=()):
+        # type: (Iterable[int], Iterable[float], Iterable[float], Iterable[float], Iterable[bool]) -> None
+        self.pitches = array("B", pitches)
+        self.starts = array("d", starts)
+        self.durations = array("d", durations)
+        self.velocities = array("d", velocities)
+        self.muted = array("B", muted)
+
+    def __repr__(self):
+        # type: () -> str
+        return "NoteBuffer(%s notes)" % len(self)
+
+    def __len__(self):
+        # type: () -> int
+        return len(self.pitches)
+
+    def __iter__(self):
+        # type: () -> Iterator[Note]
+        for index in range(len(self)):
+            yield NoteView(self, index)
+
+    def __getitem__(self, index):
+        # type: (int) -> Note
+        return NoteView(self, range(len(self))[index])
+
+    @classmethod
+    def from_notes(cls, notes):
+        # type: (Iterable[Note]) -> NoteBuffer
+        notes = list(notes)
+        return cls(
+            pitches=[note.pitch for note in notes],
+            starts=[note.start for note in notes],
+            durations=[note.duration for note in notes],
+            velocities=[note.velocity for note in notes],
+            muted=[note.muted for note in notes],
+        )
+
+    def to_data(self):
+        # type: () -> Tuple[Tuple[int, float, float, int, bool], ...]
+        """The replace_selected_notes format, see Note.to_data"""
+        return tuple(
+            zip(
+                self.pitches,
+                self.starts,
+                self.durations,
+                [int(velocity) for velocity in self.velocities],
+                [bool(muted) for muted in self.muted],
+            )
+        )
+
+    def sort(self):
+        # type: () -> None
+        """By start, stable"""
+        order = sorted(range(len(self)), key=self.starts.__getitem__)
+        for column_name in self.__slots__:
+            column = getattr(self, column_name)
+            setattr(self, column_name, array(column.typecode, [column[i] for i in order]))
+
+    def scale_velocities(self, go_next, scaling_factor):
+        # type: (bool, int) -> None
+        """Spreads (go_next) or compresses the velocities around their average"""
+        if len(self) == 0:
+            return
+
+        average = sum(self.velocities) / len(self)
+        if go_next:
+            velocities = [v + (v - average) / (scaling_factor - 1) for v in self.velocities]
+        else:
+            velocities = [v - (v - average) / scaling_factor for v in self.velocities]
+
+        self.velocities = array("d", [clamp(v, 0, 127) for v in velocities])
+
+    def transpose(self, semitones):
+        # type: (int) -> None
+        self.pitches = array("B", [int(clamp(p + semitones, 0, 127)) for p in self.pitches])
+
+    def set_pitch(self, pitch):
+        # type: (int) -> None
+        self.pitches = array("B", [int(clamp(pitch, 0, 127))] * len(self))
+
+    def remap_pitches(self, pitch_map):
+        # type: (Dict[int, int]) -> None
+        """Pitches missing from pitch_map are kept"""
+        self.pitches = array(
+            "B", [int(clamp(pitch_map.get(p, p), 0, 127)) for p in self.pitches]
+        )
+
+    def quantize(self, grid, amount=1.0):
+        # type: (float, float) -> None
+        """Moves the starts towards the closest grid line, amount being in [0, 1]"""
+        self.starts = array(
+            "d",
+            [max(0.0, s + (round(s / grid) * grid - s) * amount) for s in self.starts],
+        )
+
+    def to_mono(self):
+        # type: () -> None
+        """If notes overlap : make end of each note match the start of the next one"""
+        self.sort()
+        starts = self.starts
+        durations = self.durations
+        for index in range(len(self) - 1):
+            next_start = starts[index + 1]
+            if starts[index] + durations[index] < next_start:
+                durations[index] = next_start - starts[index]
@@ -0,0 +1,68 @@
+from typing import TYPE_CHECKING
+
+from protocol0.domain.lom.note.Note import Note
+
+if TYPE_CHECKING:
+    from protocol0.domain.lom.note.NoteBuffer import NoteBuffer
+
+
+class NoteView(Note):
+    """Note reading and writing its values in a NoteBuffer row"""
+
+    __slots__ = ("_buffer", "_index")
+
+    # noinspection PyMissingConstructor
+    def __init__(self, buffer, index):
+        # type: (NoteBuffer, int) -> None
+        self._buffer = buffer
+        self._index = index
+
+    @property
+    def _pitch(self):
+        # type: () -> int
+        return self._buffer.pitches[self._index]
+
+    @_pitch.setter
+    def _pitch(self, pitch):
+        # type: (int) -> None
+        self._buffer.pitches[self._index] = pitch
+
+    @property
+    def _start(self):
+        # type: () -> float
+        return self._buffer.starts[self._index]
+
+    @_start.setter
+    def _start(self, start):
+        # type: (float) -> None
+        self._buffer.starts[self._index] = start
+
+    @property
+    def _duration(self):
+        # type: () -> float
+        return self._buffer.durations[self._index]
+
+    @_duration.setter
+    def _duration(self, duration):
+        # type: (float) -> None
+        self._buffer.durations[self._index] = duration
+
+    @property
+    def _velocity(self):
+        # type: () -> float
+        return self._buffer.velocities[self._index]
+
+    @_velocity.setter
+    def _velocity(self, velocity):
+        # type: (float) -> None
+        self._buffer.velocities[self._index] = velocity
+
+    @property
+    def _muted(self):
+        # type: () -> bool
+        return bool(self._buffer.muted[self._index])
+
+    @_muted.setter
+    def _muted(self, muted):
+        # type: (bool) -> None
+        self._buffer.muted[self._index] = muted
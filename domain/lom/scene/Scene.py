@@ -7,6 +7,7 @@ from typing import List, Optional, Dict, cast
 
 from protocol0.domain.lom.scene.NextSceneStartedEvent import NextSceneStartedEvent
 from protocol0.domain.lom.scene.SceneAppearance import SceneAppearance
+from protocol0.domain.lom.scene.SceneClipMatrix import SceneClipMatrix
 from protocol0.domain.lom.scene.SceneClips import SceneClips
 from protocol0.domain.lom.scene.SceneCropScroller import SceneCropScroller
 from protocol0.domain.lom.scene.SceneFiredEvent import SceneFiredEvent
@@ -20,7 +21,7 @@ from protocol0.domain.shared.ValueScroller import ValueScroller
 from protocol0.domain.shared.event.DomainEventBus import DomainEventBus
 from protocol0.domain.shared.scheduler.BarChangedEvent import BarChangedEvent
 from protocol0.domain.shared.utils.forward_to import ForwardTo
-from protocol0.domain.shared.utils.timing import throttle
+from protocol0.domain.shared.utils.timing import throttle, debounce
 from protocol0.shared.Song import Song
 from protocol0.shared.observer.Observable import Observable
 from protocol0.shared.sequence.Sequence import Sequence
@@ -29,14 +30,14 @@ from protocol0.shared.sequence.Sequence import Sequence
 class Scene(SlotManager):
     LAST_MANUALLY_STARTED_SCENE = None  # type: Optional[Scene]
 
-    def __init__(self, live_scene, index):
-        # type: (Live.Scene.Scene, int) -> None
+    def __init__(self, live_scene, index, clip_matrix):
+        # type: (Live.Scene.Scene, int, SceneClipMatrix) -> None
         super(Scene, self).__init__()
         self._scene = live_scene
         self.index = index
         self.live_id = self._scene._live_ptr  # type: int
 
-        self.clips = SceneClips(self.index)
+        self.clips = SceneClips(clip_matrix, self.index)
         self._scene_length = SceneLength(self.clips, self.index)
         self.playing_state = ScenePlayingState(self.clips, self._scene_length)
         self.scene_name = SceneName(live_scene, self._scene_length, self.playing_state)
@@ -61,15 +62,12 @@ class Scene(SlotManager):
 
         return list(sorted(tracks.values(), key=lambda t: t.index))
 
+    @debounce(duration=50)
     def update(self, observable):
         # type: (Observable) -> None
         if isinstance(observable, SceneClips):
             self.appearance.refresh()
 
-    def on_tracks_change(self):
-        # type: () -> None
-        self.clips.build()
-
     def on_added(self):
         # type: () -> None
         self.clips.on_added_scene()
@@ -158,6 +156,7 @@ class Scene(SlotManager):
         It could almost be removed as this case happens very rarely
         (I fire scenes almost always from keyboard shortcuts / commands)
         """
+        SceneClips.on_playing_changed()
         if Song.is_playing() is False or not self.playing_state.is_playing:
             return
         if Song.playing_scene() == self:
@@ -170,6 +169,9 @@ class Scene(SlotManager):
         # stop the previous scene in advance, using clip launch quantization
         DomainEventBus.emit(SceneFiredEvent(self.index))
 
+        for clip in self.clips.all:
+            clip.attach_listeners()
+
         self._scene.fire()
 
     def stop(self, next_scene=None, immediate=False):
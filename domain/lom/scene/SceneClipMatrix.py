@@ -0,0 +1,100 @@
+from typing import List, Dict, Set, Tuple
+
+from protocol0.domain.lom.clip.Clip import Clip
+from protocol0.domain.lom.clip_slot.ClipSlot import ClipSlot
+from protocol0.domain.lom.scene.SceneClips import SceneClipSlot, SceneClips
+from protocol0.domain.lom.track.simple_track.SimpleTrack import SimpleTrack
+from protocol0.shared.Song import Song
+from protocol0.shared.observer.Observable import Observable
+
+
+class SceneClipMatrix(object):
+    """
+    (scene, track) -> SceneClipSlot index shared by the scenes, one row per scene.
+
+    Clip slots are observed once, when their track is inserted in the matrix.
+    Tracks changes only touch their own column and clip changes only notify their row.
+    Each Scene.clips is a view over its row.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        self._rows = []  # type: List[List[SceneClipSlot]]
+        self._scene_clips = {}  # type: Dict[int, SceneClips]
+        # id(ClipSlot) -> cell (ClipSlot is not hashable)
+        self._cells = {}  # type: Dict[int, SceneClipSlot]
+
+    def __repr__(self):
+        # type: () -> str
+        return "SceneClipMatrix(scenes=%s, tracks=%s)" % (
+            len(self._rows),
+            len(self._rows[0]) if self._rows else 0,
+        )
+
+    def build(self, scene_count):
+        # type: (int) -> None
+        """Full build, when the track clip slots were generated again"""
+        self._rows = [[] for _ in range(scene_count)]
+        self._scene_clips = {}
+        self._cells = {}
+        self._insert_tracks(list(enumerate(Song.simple_tracks())))
+
+    def get_row(self, scene_index):
+        # type: (int) -> List[SceneClipSlot]
+        return self._rows[scene_index]
+
+    def register_scene_clips(self, scene_clips):
+        # type: (SceneClips) -> None
+        self._scene_clips[scene_clips.index] = scene_clips
+
+    def on_tracks_change(self, track_ids, tracks):
+        # type: (Set[int], List[Tuple[int, SimpleTrack]]) -> None
+        """
+        Removes the given tracks columns and inserts the ones of tracks (index, track)
+        The other columns are kept
+        """
+        for scene_index, row in enumerate(self._rows):
+            kept_row = []
+            for scene_cs in row:
+                if scene_cs.track.live_id in track_ids:
+                    self._cells.pop(id(scene_cs.clip_slot), None)
+                else:
+                    kept_row.append(scene_cs)
+            self._rows[scene_index] = kept_row
+
+        self._insert_tracks(tracks)
+
+        for scene_clips in self._scene_clips.values():
+            scene_clips.notify_observers()
+
+    def _insert_tracks(self, tracks):
+        # type: (List[Tuple[int, SimpleTrack]]) -> None
+        # ascending indexes : the previous tracks are already in place
+        for track_index, track in tracks:
+            for scene_index, row in enumerate(self._rows):
+                clip_slot = track.clip_slots[scene_index]
+                clip_slot.register_observer(self)
+                scene_cs = SceneClipSlot(track, clip_slot)
+                if scene_cs.clip is not None and scene_cs.is_main_clip:
+                    scene_cs.clip.register_observer(self)
+                row.insert(track_index, scene_cs)
+                self._cells[id(clip_slot)] = scene_cs
+
+    def update(self, observable):
+        # type: (Observable) -> None
+        if isinstance(observable, ClipSlot):
+            scene_cs = self._cells.get(id(observable))
+            if scene_cs is None:
+                return
+            # the clip slot has a new clip (or none)
+            scene_index = observable.index
+            if scene_cs.clip is not None and scene_cs.is_main_clip:
+                scene_cs.clip.register_observer(self)
+        elif isinstance(observable, Clip):
+            scene_index = observable.index
+        else:
+            return
+
+        # clip slots of deleted scenes
+        if scene_index in self._scene_clips:
+            self._scene_clips[scene_index].update(observable)
@@ -1,6 +1,6 @@
 import re
 
-from typing import List, Iterator, Optional
+from typing import List, Iterator, Optional, TYPE_CHECKING
 
 from protocol0.domain.lom.clip.Clip import Clip
 from protocol0.domain.lom.clip.ClipColorEnum import ClipColorEnum
@@ -8,10 +8,11 @@ from protocol0.domain.lom.clip_slot.ClipSlot import ClipSlot
 from protocol0.domain.lom.track.group_track.ext_track.SimpleAudioExtTrack import SimpleAudioExtTrack
 from protocol0.domain.lom.track.simple_track.SimpleTrack import SimpleTrack
 from protocol0.domain.lom.track.simple_track.audio.special.ResamplingTrack import ResamplingTrack
-from protocol0.domain.shared.utils.timing import debounce
-from protocol0.shared.Song import Song
 from protocol0.shared.observer.Observable import Observable
 
+if TYPE_CHECKING:
+    from protocol0.domain.lom.scene.SceneClipMatrix import SceneClipMatrix
+
 
 class SceneClipSlot(object):
     def __init__(self, track, clip_slot):
@@ -34,13 +35,17 @@ class SceneClipSlot(object):
 
 
 class SceneClips(Observable):
-    def __init__(self, index):
-        # type: (int) -> None
+    """View over the scene row of the SceneClipMatrix"""
+
+    # bumped on the song playing events : the clips playing status is not listened to
+    playing_generation = 0
+
+    def __init__(self, clip_matrix, index):
+        # type: (SceneClipMatrix, int) -> None
         super(SceneClips, self).__init__()
         self.index = index
-        self._clip_slot_tracks = []  # type: List[SceneClipSlot]
-
-        self.build()
+        self._clip_matrix = clip_matrix
+        clip_matrix.register_scene_clips(self)
 
     def __repr__(self):
         # type: () -> str
@@ -54,6 +59,11 @@ class SceneClips(Observable):
             if scene_cs.clip is not None and scene_cs.is_main_clip
         )
 
+    @property
+    def _clip_slot_tracks(self):
+        # type: () -> List[SceneClipSlot]
+        return self._clip_matrix.get_row(self.index)
+
     @property
     def all(self):
         # type: () -> List[Clip]
@@ -64,24 +74,16 @@ class SceneClips(Observable):
         # type: () -> List[SimpleTrack]
         return [scene_clip.track for scene_clip in self._clip_slot_tracks]
 
-    @debounce(duration=50)
     def update(self, observable):
         # type: (Observable) -> None
+        """Notified by the matrix on this row clip slots and clips changes"""
         if isinstance(observable, ClipSlot) or isinstance(observable, Clip):
-            self.build()
             self.notify_observers()
 
-    def build(self):
-        # type: () -> None
-        self._clip_slot_tracks = []
-
-        for track in Song.simple_tracks():
-            clip_slot = track.clip_slots[self.index]
-            clip_slot.register_observer(self)
-            self._clip_slot_tracks.append(SceneClipSlot(track, clip_slot))
-
-        for clip in self:
-            clip.register_observer(self)
+    @classmethod
+    def on_playing_changed(cls, _=None):
+        # type: (object) -> None
+        cls.playing_generation += 1
 
     def on_added_scene(self):
         # type: () -> None
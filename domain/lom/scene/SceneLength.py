@@ -1,22 +1,55 @@
-from typing import Optional
+from typing import Optional, Dict, Tuple
 
 from protocol0.domain.lom.clip.Clip import Clip
 from protocol0.domain.lom.scene.SceneClips import SceneClips
+from protocol0.domain.shared.CacheStats import CacheStats
 from protocol0.domain.shared.utils.utils import previous_power_of_2
 from protocol0.shared.Song import Song
 from protocol0.shared.logging.Logger import Logger
+from protocol0.shared.observer.Observable import Observable
 
 
 class SceneLength(object):
+    """
+    The length is cached until the scene clips change (clips added / removed, loop changes)
+    or the song playing events (see SceneClips.playing_generation)
+    """
+
+    CACHE_STATS = CacheStats("scene length")
+
     def __init__(self, clips, scene_index):
         # type: (SceneClips, int) -> None
         self._clips = clips
         self._scene_index = scene_index
+        # (signature numerator, length)
+        self._length = None  # type: Optional[Tuple[int, float]]
+        # is_playing -> longest clip
+        self._longest_clips = {}  # type: Dict[bool, Optional[Clip]]
+        self._playing_generation = SceneClips.playing_generation
+
+        self._clips.register_observer(self)
 
     def __repr__(self):
         # type: () -> str
         return "SceneLength(index=%s, length=%f)" % (self._scene_index, self.length)
 
+    def update(self, observable):
+        # type: (Observable) -> None
+        if isinstance(observable, SceneClips):
+            self.invalidate()
+
+    def invalidate(self):
+        # type: () -> None
+        self._length = None
+        self._longest_clips = {}
+        self._playing_generation = SceneClips.playing_generation
+        self.CACHE_STATS.invalidations += 1
+
+    def _invalidate_on_playing_change(self):
+        # type: () -> None
+        if self._playing_generation != SceneClips.playing_generation:
+            self.invalidate()
+
     @property
     def _is_playing(self):
         # type: () -> bool
@@ -25,10 +58,28 @@ class SceneLength(object):
     @property
     def length(self):
         # type: () -> float
+        self._invalidate_on_playing_change()
+        numerator = Song.signature_numerator()
+        if self._length is not None and self._length[0] == numerator:
+            self.CACHE_STATS.hits += 1
+            return self._length[1]
+
+        self.CACHE_STATS.recomputes += 1
+        self.attach_clip_listeners()
+        self._length = (numerator, self._get_length(numerator))
+        return self._length[1]
+
+    def attach_clip_listeners(self):
+        # type: () -> None
+        """The cache is invalidated by the clip loops (see Config.LAZY_CLIP_LISTENERS)"""
+        for clip in self._clips:
+            clip.loop.attach_listeners()
+
+    def _get_length(self, numerator):
+        # type: (int) -> float
         longest_clip = self.get_longest_clip(
             is_playing=True) if self._is_playing else self.get_longest_clip()
         clip_length = longest_clip.length if longest_clip else 0.0
-        numerator = Song.signature_numerator()
 
         if clip_length % numerator != 0:
             return clip_length
@@ -54,7 +105,15 @@ class SceneLength(object):
         We cannot exclude all recording clips in the case the midi clip is the longest
         and we are recording audio
         """
+        self._invalidate_on_playing_change()
+        if is_playing not in self._longest_clips:
+            self.attach_clip_listeners()
+            self._longest_clips[is_playing] = self._get_longest_clip(is_playing)
+
+        return self._longest_clips[is_playing]
 
+    def _get_longest_clip(self, is_playing):
+        # type: (bool) -> Optional[Clip]
         clips = [
             clip
             for clip in self._clips
@@ -1,15 +1,30 @@
+from typing import Optional
+
 from protocol0.domain.lom.clip.AudioClip import AudioClip
 from protocol0.domain.lom.clip.Clip import Clip
 from protocol0.domain.lom.scene.SceneClips import SceneClips
 from protocol0.domain.lom.scene.SceneLength import SceneLength
+from protocol0.domain.shared.CacheStats import CacheStats
 from protocol0.shared.Song import Song
+from protocol0.shared.observer.Observable import Observable
 
 
 class ScenePlayingState(object):
+    """
+    The playing clips are cached until the scene clips change
+    or the song playing events, like the scene length
+    """
+
+    CACHE_STATS = CacheStats("scene playing state")
+
     def __init__(self, clips, scene_length):
         # type: (SceneClips, SceneLength) -> None
         self._clips = clips
         self._scene_length = scene_length
+        self._has_playing_clips = None  # type: Optional[bool]
+        self._playing_generation = SceneClips.playing_generation
+
+        self._clips.register_observer(self)
 
     def __repr__(self):
         # type: () -> str
@@ -19,8 +34,33 @@ class ScenePlayingState(object):
             self.in_last_bar,
         )
 
+    def update(self, observable):
+        # type: (Observable) -> None
+        if isinstance(observable, SceneClips):
+            self._has_playing_clips = None
+            self.CACHE_STATS.invalidations += 1
+
     @property
     def is_playing(self):
+        # type: () -> bool
+        if not Song.is_playing():
+            return False
+
+        if self._playing_generation != SceneClips.playing_generation:
+            self._playing_generation = SceneClips.playing_generation
+            self._has_playing_clips = None
+            self.CACHE_STATS.invalidations += 1
+
+        if self._has_playing_clips is None:
+            self.CACHE_STATS.recomputes += 1
+            self._scene_length.attach_clip_listeners()
+            self._has_playing_clips = self._get_has_playing_clips()
+        else:
+            self.CACHE_STATS.hits += 1
+
+        return self._has_playing_clips
+
+    def _get_has_playing_clips(self):
         # type: () -> bool
         def _is_clip_playing(clip):
             # type: (Clip) -> bool
@@ -32,9 +72,7 @@ class ScenePlayingState(object):
 
             return True
 
-        return Song.is_playing() and any(
-            _is_clip_playing(clip) for clip in self._clips
-        )
+        return any(_is_clip_playing(clip) for clip in self._clips)
 
     @property
     def position(self):
@@ -7,18 +7,26 @@ from typing import List, Iterator, Dict
 
 from protocol0.domain.lom.scene.PlayingSceneFacade import PlayingSceneFacade
 from protocol0.domain.lom.scene.Scene import Scene
+from protocol0.domain.lom.scene.SceneClipMatrix import SceneClipMatrix
+from protocol0.domain.lom.scene.SceneClips import SceneClips
+from protocol0.domain.lom.scene.SceneFiredEvent import SceneFiredEvent
 from protocol0.domain.lom.scene.ScenesMappedEvent import ScenesMappedEvent
+from protocol0.domain.lom.song.SongStartedEvent import SongStartedEvent
+from protocol0.domain.lom.song.SongStoppedEvent import SongStoppedEvent
 from protocol0.domain.lom.song.components.SceneCrudComponent import SceneCrudComponent
+from protocol0.domain.lom.track.SimpleTracksChangedEvent import SimpleTracksChangedEvent
 from protocol0.domain.lom.track.TrackAddedEvent import TrackAddedEvent
 from protocol0.domain.lom.track.abstract_track.AbstractTrack import AbstractTrack
 from protocol0.domain.shared.backend.Backend import Backend
 from protocol0.domain.shared.errors.error_handler import handle_error
 from protocol0.domain.shared.event.DomainEventBus import DomainEventBus
+from protocol0.domain.shared.scheduler.BarChangedEvent import BarChangedEvent
 from protocol0.domain.shared.scheduler.Scheduler import Scheduler
 from protocol0.domain.shared.utils.list import find_if
 from protocol0.domain.shared.utils.timing import debounce
 from protocol0.infra.interface.session.SessionUpdatedEvent import SessionUpdatedEvent
 from protocol0.shared.Song import Song
+from protocol0.shared.SongSnapshot import SongSnapshot
 from protocol0.shared.logging.Logger import Logger
 from protocol0.shared.sequence.Sequence import Sequence
 
@@ -34,8 +42,13 @@ class SceneService(SlotManager):
         self.scenes_listener.subject = live_song
         self._selected_scene_listener.subject = live_song.view
         self._live_scene_id_to_scene = collections.OrderedDict()  # type: Dict[int, Scene]
+        self._clip_matrix = SceneClipMatrix()
 
         DomainEventBus.subscribe(TrackAddedEvent, self._on_track_added_event)
+        DomainEventBus.subscribe(SimpleTracksChangedEvent, self._on_simple_tracks_changed_event)
+        # launches are quantized : clips start and stop on bar changes
+        for event_class in (BarChangedEvent, SceneFiredEvent, SongStartedEvent, SongStoppedEvent):
+            DomainEventBus.subscribe(event_class, SceneClips.on_playing_changed)
 
     def get_scene(self, live_scene):
         # type: (Live.Scene.Scene) -> Scene
@@ -95,6 +108,7 @@ class SceneService(SlotManager):
             track.on_scenes_change()
 
         live_scenes = self._live_song.scenes
+        self._clip_matrix.build(len(live_scenes))
 
         # get the right scene or instantiate new scenes
         for index, live_scene in enumerate(live_scenes):
@@ -120,6 +134,7 @@ class SceneService(SlotManager):
                     Backend.client().show_warning("You just deleted %s" % scene)
 
                 del self._live_scene_id_to_scene[scene_id]
+                SongSnapshot.bump_generation()
 
             scene.disconnect()
             if scene == Song.playing_scene():
@@ -129,8 +144,9 @@ class SceneService(SlotManager):
     def generate_scene(self, live_scene, index):
         # type: (Live.Scene.Scene, int) -> None
         # switching to full remap because of persisting mapping problems when moving scenes
-        scene = Scene(live_scene, index)
+        scene = Scene(live_scene, index, self._clip_matrix)
         self._live_scene_id_to_scene[scene.live_id] = scene
+        SongSnapshot.bump_generation()
 
     def _sort_scenes(self):
         # type: () -> None
@@ -138,6 +154,11 @@ class SceneService(SlotManager):
         for scene in self._live_song.scenes:
             sorted_dict[scene._live_ptr] = self.get_scene(scene)
         self._live_scene_id_to_scene = sorted_dict
+        SongSnapshot.bump_generation()
+
+    def _on_simple_tracks_changed_event(self, event):
+        # type: (SimpleTracksChangedEvent) -> None
+        self._clip_matrix.on_tracks_change(event.track_ids, event.tracks)
 
     def _on_track_added_event(self, _):
         # type: (TrackAddedEvent) -> Sequence
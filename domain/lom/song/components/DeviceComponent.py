@@ -8,7 +8,6 @@ from protocol0.domain.lom.device.Device import Device
 from protocol0.domain.lom.device_parameter.DeviceParameter import DeviceParameter
 from protocol0.domain.lom.track.simple_track.SimpleTrack import SimpleTrack
 from protocol0.domain.shared.ApplicationView import ApplicationView
-from protocol0.domain.shared.utils.list import find_if
 from protocol0.shared.Song import Song
 from protocol0.shared.sequence.Sequence import Sequence
 
@@ -38,12 +37,16 @@ class DeviceComponent(SlotManager):
         # type: () -> Optional[DeviceParameter]
         if self._overridden_selected_parameter is not None:
             return self._overridden_selected_parameter
-        all_parameters = [
-            param for track in Song.simple_tracks() for param in track.devices.parameters
-        ]
-        return find_if(
-            lambda p: p._device_parameter == self._view.selected_parameter, all_parameters
-        )
+        live_parameter = self._view.selected_parameter
+        if live_parameter is None:
+            return None
+
+        for track in Song.simple_tracks():
+            parameter = track.devices.parameters.get_by_live_ptr(live_parameter._live_ptr)
+            if parameter is not None:
+                return parameter
+
+        return None
 
     @selected_parameter.setter
     def selected_parameter(self, parameter):
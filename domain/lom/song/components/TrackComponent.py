@@ -69,7 +69,7 @@ class TrackComponent(SlotManager):
     @property
     def scrollable_tracks(self):
         # type: () -> Iterator[AbstractTrack]
-        for track in self.abstract_tracks:
+        for track in Song.abstract_tracks():
             if not track.is_visible:
                 continue
             # when a group track is unfolded, will directly select the first sub_track
@@ -0,0 +1,12 @@
+from typing import Set, List, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from protocol0.domain.lom.track.simple_track.SimpleTrack import SimpleTrack
+
+
+class SimpleTracksChangedEvent(object):
+    def __init__(self, track_ids, tracks):
+        # type: (Set[int], List[Tuple[int, SimpleTrack]]) -> None
+        """track_ids : added, removed, moved or replaced tracks. tracks : their (index, track)"""
+        self.track_ids = track_ids
+        self.tracks = tracks
@@ -5,8 +5,10 @@ import Live
 from _Framework.SubjectSlot import subject_slot, SlotManager
 from typing import Optional, Dict
 
+from protocol0.domain.lom.track.SimpleTracksChangedEvent import SimpleTracksChangedEvent
 from protocol0.domain.lom.track.TrackAddedEvent import TrackAddedEvent
 from protocol0.domain.lom.track.TrackFactory import TrackFactory
+from protocol0.domain.lom.track.TracksLayoutDiff import TracksLayoutDiff
 from protocol0.domain.lom.track.TracksMappedEvent import TracksMappedEvent
 from protocol0.domain.lom.track.group_track.DrumsTrack import DrumsTrack
 from protocol0.domain.lom.track.group_track.NormalGroupTrack import NormalGroupTrack
@@ -25,6 +27,7 @@ from protocol0.domain.shared.errors.error_handler import handle_error
 from protocol0.domain.shared.event.DomainEventBus import DomainEventBus
 from protocol0.domain.shared.utils.list import find_if
 from protocol0.shared.Song import Song
+from protocol0.shared.SongSnapshot import SongSnapshot
 from protocol0.shared.UndoFacade import UndoFacade
 from protocol0.shared.logging.Logger import Logger
 from protocol0.shared.sequence.Sequence import Sequence
@@ -40,6 +43,8 @@ class TrackMapperService(SlotManager):
         self._live_track_id_to_simple_track = (
             collections.OrderedDict()
         )  # type: Dict[int, SimpleTrack]
+        # live track ptr -> group track live ptr, as of the last mapping
+        self._tracks_layout = collections.OrderedDict()  # type: Dict[int, Optional[int]]
         self._usamo_track = None  # type: Optional[SimpleTrack]
         self._drums_track = None  # type: Optional[DrumsTrack]
         self._vocals_track = None  # type: Optional[VocalsTrack]
@@ -53,18 +58,23 @@ class TrackMapperService(SlotManager):
     @handle_error
     def tracks_listener(self):
         # type: () -> None
+        layout_diff = TracksLayoutDiff(self._tracks_layout, self._get_tracks_layout())
+        self._tracks_layout = layout_diff.layout
+
+        previous_simple_tracks = self._live_track_id_to_simple_track.copy()
         self._clean_tracks()
 
-        previous_simple_track_count = len(list(Song.all_simple_tracks()))
-        has_added_tracks = 0 < previous_simple_track_count < len(list(Song.live_tracks()))
+        previous_simple_track_count = len(self._live_track_id_to_simple_track)
+        has_added_tracks = 0 < previous_simple_track_count < len(layout_diff.layout)
 
-        self._generate_simple_tracks()
-        self._generate_abstract_group_tracks()
+        self._generate_simple_tracks(layout_diff)
+        self._generate_abstract_group_tracks(layout_diff)
+        SongSnapshot.bump_generation()
 
-        for scene in Song.scenes():
-            scene.on_tracks_change()
+        if not layout_diff.is_empty:
+            self._emit_simple_tracks_changed(layout_diff, previous_simple_tracks)
 
-        Logger.info("mapped tracks")
+        Logger.info("mapped tracks : %s" % layout_diff)
 
         seq = Sequence()
         if has_added_tracks and Song.selected_track():
@@ -76,21 +86,41 @@ class TrackMapperService(SlotManager):
 
         self._get_special_tracks()
 
+    def remap_tracks(self):
+        # type: () -> None
+        """Maps all the tracks again instead of only the ones that changed since the last mapping"""
+        self._tracks_layout = collections.OrderedDict()
+        self.tracks_listener()
+
+    def _get_tracks_layout(self):
+        # type: () -> Dict[int, Optional[int]]
+        layout = collections.OrderedDict()  # type: Dict[int, Optional[int]]
+        for track in self._live_song.tracks:
+            group_track = track.group_track
+            layout[track._live_ptr] = group_track._live_ptr if group_track else None
+
+        for track in list(self._live_song.return_tracks) + [self._live_song.master_track]:
+            layout[track._live_ptr] = None
+
+        return layout
+
     def _clean_tracks(self):
         # type: () -> None
-        existing_track_ids = [track._live_ptr for track in list(Song.live_tracks())]
         deleted_ids = []
 
         for track_id, simple_track in self._live_track_id_to_simple_track.items():
-            if track_id not in existing_track_ids:
+            if track_id not in self._tracks_layout:
                 simple_track.disconnect()
                 deleted_ids.append(track_id)
 
         for track_id in deleted_ids:
             del self._live_track_id_to_simple_track[track_id]
 
-    def _generate_simple_tracks(self):
-        # type: () -> None
+        if deleted_ids:
+            SongSnapshot.bump_generation()
+
+    def _generate_simple_tracks(self, layout_diff):
+        # type: (TracksLayoutDiff) -> None
         """instantiate SimpleTracks (including return / master, that are marked as inactive)"""
         # instantiate set tracks
         for index, track in enumerate(list(self._live_song.tracks)):
@@ -105,8 +135,27 @@ class TrackMapperService(SlotManager):
 
         self._sort_simple_tracks()
 
+        # only the tracks whose group (or group content) changed are linked again
+        linked_track_ids = layout_diff.get_linked_track_ids()
         for track in Song.simple_tracks():
-            track.on_tracks_change()
+            if track.live_id in linked_track_ids:
+                track.on_tracks_change()
+
+    def _emit_simple_tracks_changed(self, layout_diff, previous_simple_tracks):
+        # type: (TracksLayoutDiff, Dict[int, SimpleTrack]) -> None
+        """Only the scene clips of added, removed, moved or replaced tracks are built again"""
+        track_ids = layout_diff.added_ids | layout_diff.removed_ids | layout_diff.moved_ids
+        for track_id, simple_track in self._live_track_id_to_simple_track.items():
+            if previous_simple_tracks.get(track_id) is not simple_track:
+                track_ids.add(track_id)
+
+        tracks = [
+            (index, track)
+            for index, track in enumerate(Song.simple_tracks())
+            if track.live_id in track_ids
+        ]
+
+        DomainEventBus.emit(SimpleTracksChangedEvent(track_ids, tracks))
 
     def _get_special_tracks(self):
         # type: () -> None
@@ -147,6 +196,7 @@ class TrackMapperService(SlotManager):
             self._replace_simple_track(previous_simple_track, event.track)
 
         self._live_track_id_to_simple_track[event.track.live_id] = event.track
+        SongSnapshot.bump_generation()
 
     def _replace_simple_track(self, previous_simple_track, new_simple_track):
         # type: (SimpleTrack, SimpleTrack) -> None
@@ -170,12 +220,14 @@ class TrackMapperService(SlotManager):
         for track in Song.live_tracks():
             sorted_dict[track._live_ptr] = Song.live_track_to_simple_track(track)
         self._live_track_id_to_simple_track = sorted_dict
+        SongSnapshot.bump_generation()
 
-    def _generate_abstract_group_tracks(self):
-        # type: () -> None
+    def _generate_abstract_group_tracks(self, layout_diff):
+        # type: (TracksLayoutDiff) -> None
         # 2nd pass : instantiate AbstractGroupTracks
+        abstract_group_track_ids = layout_diff.get_abstract_group_track_ids()
         for track in Song.simple_tracks():
-            if not track.is_foldable:
+            if not track.is_foldable or track.live_id not in abstract_group_track_ids:
                 continue
 
             previous_abstract_group_track = track.abstract_group_track
@@ -196,3 +248,5 @@ class TrackMapperService(SlotManager):
                 previous_abstract_group_track.disconnect()
 
             abstract_group_track.on_tracks_change()
+            # the abstract tracks changed
+            SongSnapshot.bump_generation()
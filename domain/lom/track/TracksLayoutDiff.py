@@ -0,0 +1,110 @@
+from typing import Dict, Optional, Set, List, Iterator
+
+
+class TracksLayoutDiff(object):
+    """
+    Difference between two song track layouts.
+
+    A layout maps each live track ptr to its group track live ptr, in song order.
+    Tracks are moved when their order relative to the other kept tracks changed.
+    """
+
+    def __init__(self, previous_layout, layout):
+        # type: (Dict[int, Optional[int]], Dict[int, Optional[int]]) -> None
+        self.previous_layout = previous_layout
+        self.layout = layout
+
+        self.added_ids = set(track_id for track_id in layout if track_id not in previous_layout)
+        self.removed_ids = set(
+            track_id for track_id in previous_layout if track_id not in layout
+        )
+
+        kept_ids = [track_id for track_id in layout if track_id in previous_layout]
+        previous_kept_ids = [track_id for track_id in previous_layout if track_id in layout]
+        self.moved_ids = set()  # type: Set[int]
+        for previous_track_id, track_id in zip(previous_kept_ids, kept_ids):
+            if previous_track_id != track_id:
+                self.moved_ids.add(previous_track_id)
+                self.moved_ids.add(track_id)
+
+        self.regrouped_ids = set(
+            track_id for track_id in kept_ids if previous_layout[track_id] != layout[track_id]
+        )
+
+        self._sub_track_ids = {}  # type: Dict[Optional[int], List[int]]
+        for track_id, group_track_id in layout.items():
+            self._sub_track_ids.setdefault(group_track_id, []).append(track_id)
+
+    def __repr__(self):
+        # type: () -> str
+        return "TracksLayoutDiff(added=%s, removed=%s, moved=%s, regrouped=%s)" % (
+            len(self.added_ids),
+            len(self.removed_ids),
+            len(self.moved_ids),
+            len(self.regrouped_ids),
+        )
+
+    @property
+    def is_empty(self):
+        # type: () -> bool
+        return not (self.added_ids or self.removed_ids or self.moved_ids or self.regrouped_ids)
+
+    @property
+    def changed_ids(self):
+        # type: () -> Set[int]
+        return self.added_ids | self.moved_ids | self.regrouped_ids
+
+    def get_group_track_ids(self):
+        # type: () -> Set[int]
+        """
+        The existing group tracks whose sub tracks changed, and all their nested group tracks.
+        Their sub tracks are all linked again.
+        """
+        group_track_ids = set()  # type: Set[int]
+        for track_id in self.changed_ids:
+            group_track_ids.add(self.layout[track_id])
+            if track_id in self._sub_track_ids:
+                group_track_ids.add(track_id)
+
+        for track_id in self.changed_ids | self.removed_ids:
+            group_track_ids.add(self.previous_layout.get(track_id))
+
+        group_track_ids = set(
+            track_id for track_id in group_track_ids if track_id in self.layout
+        )
+
+        return group_track_ids | set(self._get_nested_group_track_ids(group_track_ids))
+
+    def get_linked_track_ids(self):
+        # type: () -> Set[int]
+        """The tracks that should link again to their group track"""
+        linked_track_ids = self.changed_ids
+        for group_track_id in self.get_group_track_ids():
+            linked_track_ids.add(group_track_id)
+            linked_track_ids.update(self._sub_track_ids.get(group_track_id, []))
+
+        return linked_track_ids
+
+    def get_abstract_group_track_ids(self):
+        # type: () -> Set[int]
+        """
+        Abstract group tracks copy their base track sub tracks before nested abstract
+        group tracks replace themselves in it : the enclosing ones are generated again as well
+        """
+        group_track_ids = self.get_group_track_ids()
+        for group_track_id in list(group_track_ids):
+            parent_track_id = self.layout[group_track_id]
+            while parent_track_id is not None:
+                group_track_ids.add(parent_track_id)
+                parent_track_id = self.layout[parent_track_id]
+
+        return group_track_ids | set(self._get_nested_group_track_ids(group_track_ids))
+
+    def _get_nested_group_track_ids(self, group_track_ids):
+        # type: (Set[int]) -> Iterator[int]
+        stack = list(group_track_ids)
+        while stack:
+            for sub_track_id in self._sub_track_ids.get(stack.pop(), []):
+                if sub_track_id in self._sub_track_ids:
+                    yield sub_track_id
+                    stack.append(sub_track_id)
@@ -19,12 +19,9 @@ class RoutingDisplayNameDescriptor(object):
 
     def __get__(self, track_routing, _):
         # type: (TrackRoutingInterface, Type) -> Optional[Any]
-        try:
-            return self.routing_enum_class.from_value(
-                getattr(track_routing.live_track, self.routing_attribute_name).display_name
-            )
-        except Protocol0Error:
-            return None
+        return self.routing_enum_class.get_from_value(
+            getattr(track_routing.live_track, self.routing_attribute_name).display_name
+        )
 
     def __set__(self, track_routing, routing_enum):
         # type: (TrackRoutingInterface, AbstractEnum) -> None
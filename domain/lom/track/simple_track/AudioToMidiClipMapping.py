@@ -1,7 +1,7 @@
 import json
 from os.path import basename
 
-from typing import List, Dict, TYPE_CHECKING
+from typing import List, Dict, TYPE_CHECKING, Set, Any, Optional
 
 from protocol0.domain.lom.clip.ClipInfo import ClipInfo
 from protocol0.shared.logging.Logger import Logger
@@ -15,19 +15,49 @@ class AudioToMidiClipMapping(object):
     Keep a reference to audio clips origin as a list of hashes
     to be able to update audio clips on source clip change and rerecording
     hash to file path is a many to many relationship
+
+    file path -> hashes (the first one being the current version) is persisted,
+    hash -> file paths is the inverted index
     """
 
     _DEBUG = False
 
     def __init__(self, track_data, file_path_mapping=None):
-        # type: (TrackData, Dict[str, List[int]]) -> None
+        # type: (TrackData, Optional[Dict[Any, Any]]) -> None
         self._track_data = track_data
-        self._file_path_mapping = file_path_mapping or {}  # type: Dict[str, List[int]]
+        self._file_path_mapping = self._migrate(file_path_mapping or {})
+        self._hash_to_file_paths = {}  # type: Dict[int, Set[str]]
+        for file_path, equivalences in self._file_path_mapping.items():
+            for clip_hash in equivalences:
+                self._hash_to_file_paths.setdefault(clip_hash, set()).add(file_path)
 
     def __repr__(self):
         # type: () -> str
         return json.dumps({basename(k): v for k, v in self._file_path_mapping.items()}, indent=4)
 
+    @classmethod
+    def _migrate(cls, file_path_mapping):
+        # type: (Dict[Any, Any]) -> Dict[str, List[int]]
+        """Set data saved by previous versions : duplicate, non int or null hashes"""
+        migrated_mapping = {}  # type: Dict[str, List[int]]
+        for file_path, equivalences in file_path_mapping.items():
+            if not isinstance(equivalences, (list, tuple)):
+                equivalences = [equivalences]
+
+            hashes = []  # type: List[int]
+            for clip_hash in equivalences:
+                if clip_hash is None:
+                    continue
+                clip_hash = int(clip_hash)
+                if clip_hash not in hashes:
+                    hashes.append(clip_hash)
+
+            if hashes:
+                # unicode keys restored by json are kept as is
+                migrated_mapping[file_path] = hashes
+
+        return migrated_mapping
+
     def to_dict(self):
         # type: () -> Dict
         return self._file_path_mapping
@@ -36,22 +66,21 @@ class AudioToMidiClipMapping(object):
         # type: (AudioToMidiClipMapping) -> None
         for file_path, equivalences in other_mapping._file_path_mapping.items():
             for clip_hash in equivalences:
-                if file_path not in self._file_path_mapping:
-                    self._file_path_mapping[file_path] = []
+                self._add_hash(file_path, clip_hash)
 
-                if clip_hash not in self._file_path_mapping[file_path]:
-                    self._file_path_mapping[file_path].append(clip_hash)
+    def _add_hash(self, file_path, clip_hash):
+        # type: (str, int) -> None
+        file_paths = self._hash_to_file_paths.setdefault(clip_hash, set())
+        if file_path not in file_paths:
+            file_paths.add(file_path)
+            self._file_path_mapping.setdefault(file_path, []).append(clip_hash)
 
     def register_file_path(self, file_path, clip_info):
         # type: (str, ClipInfo) -> None
         if self._DEBUG:
             Logger.info("register %s -> %s" % (basename(file_path), clip_info.hash))
 
-        if file_path not in self._file_path_mapping:
-            self._file_path_mapping[file_path] = []
-
-        if clip_info.hash not in self._file_path_mapping[file_path]:
-            self._file_path_mapping[file_path].append(clip_info.hash)
+        self._add_hash(file_path, clip_info.hash)
 
         self._track_data.save()
 
@@ -60,19 +89,16 @@ class AudioToMidiClipMapping(object):
         if self._DEBUG:
             Logger.info("registering equivalence: %s -> %s" % (existing_hash, new_hash))
 
-        for equivalences in self._file_path_mapping.values():
-            if existing_hash in equivalences and new_hash not in equivalences:
-                equivalences.append(new_hash)
+        for file_path in list(self._hash_to_file_paths.get(existing_hash, ())):
+            self._add_hash(file_path, new_hash)
 
     def path_matches_hash(self, file_path, clip_hash, exact):
         # type: (str, int, bool) -> bool
         if file_path not in self._file_path_mapping:
             return False
 
-        equivalences = self._file_path_mapping.get(file_path, [])
-
         # exact will not check previous versions
         if exact:
-            return clip_hash == next(iter(equivalences), None)
+            return clip_hash == self._file_path_mapping[file_path][0]
         else:
-            return clip_hash in equivalences
+            return file_path in self._hash_to_file_paths.get(clip_hash, ())
@@ -7,6 +7,7 @@ from protocol0.domain.lom.clip.Clip import Clip
 from protocol0.domain.lom.clip.ClipConfig import ClipConfig
 from protocol0.domain.lom.clip_slot.ClipSlot import ClipSlot
 from protocol0.domain.lom.clip_slot.ClipSlotHasClipEvent import ClipSlotHasClipEvent
+from protocol0.domain.lom.clip_slot.ClipSlotIndex import ClipSlotIndex
 from protocol0.domain.lom.device.SimpleTrackDevices import SimpleTrackDevices
 from protocol0.domain.lom.instrument.InstrumentInterface import InstrumentInterface
 from protocol0.domain.lom.track.simple_track.SimpleTrackClips import SimpleTrackClips
@@ -83,7 +84,14 @@ class SimpleTrackClipSlots(SlotManager, Observable):
             else:
                 clip_slot = self._clip_slot_class(live_clip_slot, index, self._clip_config)
                 clip_slot.register_observer(self)
+                ClipSlotIndex.add_clip_slot(clip_slot)
                 new_clip_slots.append(clip_slot)
+
+        # clip slots of deleted scenes
+        kept_clip_slot_ids = set(id(cs) for cs in new_clip_slots)
+        for clip_slot in self._clip_slots:
+            if id(clip_slot) not in kept_clip_slot_ids:
+                ClipSlotIndex.remove_clip_slot(clip_slot)
         self._clip_slots[:] = new_clip_slots  # type: List[ClipSlot]
 
         for cs in self._clip_slots:
@@ -116,4 +124,5 @@ class SimpleTrackClipSlots(SlotManager, Observable):
         # type: () -> None
         super(SimpleTrackClipSlots, self).disconnect()
         for clip_slot in self.clip_slots:
+            ClipSlotIndex.remove_clip_slot(clip_slot)
             clip_slot.disconnect()
@@ -0,0 +1,44 @@
+import collections
+
+from typing import Dict, List
+
+
+class CacheStats(object):
+    """Hits versus recomputes of a cache, listed by LogService.log_performance_stats"""
+
+    _ALL = collections.OrderedDict()  # type: Dict[str, CacheStats]
+
+    def __init__(self, name):
+        # type: (str) -> None
+        self.name = name
+        self.hits = 0
+        self.recomputes = 0
+        self.invalidations = 0
+        CacheStats._ALL[name] = self
+
+    def __repr__(self):
+        # type: () -> str
+        return "%s: hits: %s, recomputes: %s (hit rate: %.1f%%), invalidations: %s" % (
+            self.name,
+            self.hits,
+            self.recomputes,
+            self.hit_rate * 100,
+            self.invalidations,
+        )
+
+    @property
+    def hit_rate(self):
+        # type: () -> float
+        total = self.hits + self.recomputes
+        return float(self.hits) / total if total else 0
+
+    @classmethod
+    def all(cls):
+        # type: () -> List[CacheStats]
+        return list(cls._ALL.values())
+
+    def reset(self):
+        # type: () -> None
+        self.hits = 0
+        self.recomputes = 0
+        self.invalidations = 0
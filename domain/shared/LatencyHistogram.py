@@ -0,0 +1,65 @@
+import bisect
+import collections
+
+from typing import List, Dict, Any
+
+
+class LatencyHistogram(object):
+    """Fixed bucket histogram of durations in ms, cheap enough to be fed on each call"""
+
+    # bucket upper bounds in ms. A Live timer tick is ~17ms
+    _BUCKETS = [0.1, 0.25, 0.5, 1, 2, 5, 10, 17, 50, 100, 500, 1000]
+
+    def __init__(self):
+        # type: () -> None
+        # the last bucket counts durations above the last bound
+        self._counts = [0] * (len(self._BUCKETS) + 1)  # type: List[int]
+        self.count = 0
+        self._total = 0.0
+        self._max = 0.0
+
+    def __repr__(self):
+        # type: () -> str
+        return "count: %s, p50: %sms, p99: %sms, max: %.3fms" % (
+            self.count,
+            self.percentile(50),
+            self.percentile(99),
+            self._max,
+        )
+
+    def add(self, duration):
+        # type: (float) -> None
+        """duration in seconds"""
+        duration_ms = duration * 1000
+        self._counts[bisect.bisect_left(self._BUCKETS, duration_ms)] += 1
+        self.count += 1
+        self._total += duration_ms
+        if duration_ms > self._max:
+            self._max = duration_ms
+
+    def percentile(self, percent):
+        # type: (float) -> float
+        """Returns the upper bound of the bucket containing the percentile"""
+        if self.count == 0:
+            return 0
+
+        threshold = self.count * float(percent) / 100
+        cumulated_count = 0
+        for index, count in enumerate(self._counts):
+            cumulated_count += count
+            if cumulated_count >= threshold:
+                if index == len(self._BUCKETS):
+                    return round(self._max, 3)
+                return self._BUCKETS[index]
+
+        return round(self._max, 3)
+
+    def to_dict(self):
+        # type: () -> Dict[str, Any]
+        output = collections.OrderedDict()  # type: Dict[str, Any]
+        output["count"] = self.count
+        output["mean"] = round(self._total / self.count, 3) if self.count else 0
+        output["p50"] = self.percentile(50)
+        output["p99"] = self.percentile(99)
+        output["max"] = round(self._max, 3)
+        return output
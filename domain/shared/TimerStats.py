@@ -0,0 +1,42 @@
+import collections
+
+from typing import Dict, List
+
+
+class TimerStats(object):
+    """Calls versus executions of a debounced or throttled function, listed by LogService"""
+
+    _ALL = collections.OrderedDict()  # type: Dict[str, TimerStats]
+
+    def __init__(self, name):
+        # type: (str) -> None
+        self.name = name
+        self.calls = 0
+        self.executions = 0
+        # calls absorbed by an already pending deadline
+        self.coalesced = 0
+        # pending deadlines moved by a later call
+        self.rearms = 0
+        TimerStats._ALL[name] = self
+
+    def __repr__(self):
+        # type: () -> str
+        return "%s: calls: %s, executions: %s, coalesced: %s, rearms: %s" % (
+            self.name,
+            self.calls,
+            self.executions,
+            self.coalesced,
+            self.rearms,
+        )
+
+    @classmethod
+    def all(cls):
+        # type: () -> List[TimerStats]
+        return list(cls._ALL.values())
+
+    def reset(self):
+        # type: () -> None
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+        self.rearms = 0
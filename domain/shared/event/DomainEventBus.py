@@ -1,13 +1,16 @@
 import inspect
+import time
 from functools import partial
 
-from typing import Dict, List, Type, Callable, TYPE_CHECKING
+from typing import Dict, List, Type, Callable, TYPE_CHECKING, Optional, Any
 
 from protocol0.domain.lom.scene.PlayingSceneChangedEvent import PlayingSceneChangedEvent
 from protocol0.domain.lom.scene.SceneLastBarPassedEvent import SceneLastBarPassedEvent
 from protocol0.domain.lom.song.SongStoppedEvent import SongStoppedEvent
+from protocol0.domain.shared.LatencyHistogram import LatencyHistogram
 from protocol0.domain.shared.backend.Backend import Backend
 from protocol0.domain.shared.errors.error_handler import handle_error
+from protocol0.domain.shared.event.EventSubscribers import EventSubscribers
 from protocol0.domain.shared.scheduler.BarChangedEvent import BarChangedEvent
 from protocol0.domain.shared.scheduler.BarEndingEvent import BarEndingEvent
 from protocol0.domain.shared.scheduler.Last16thPassedEvent import Last16thPassedEvent
@@ -15,10 +18,11 @@ from protocol0.domain.shared.scheduler.Last32thPassedEvent import Last32thPassed
 from protocol0.domain.shared.scheduler.Last8thPassedEvent import Last8thPassedEvent
 from protocol0.domain.shared.scheduler.LastBeatPassedEvent import LastBeatPassedEvent
 from protocol0.domain.shared.scheduler.Scheduler import Scheduler
-from protocol0.domain.shared.utils.func import is_func_equal, get_callable_repr, get_class_from_func
+from protocol0.domain.shared.utils.func import get_callable_repr, get_class_from_func
 from protocol0.infra.interface.session.SessionUpdatedEvent import SessionUpdatedEvent
 from protocol0.infra.midi.MidiBytesReceivedEvent import MidiBytesReceivedEvent
 from protocol0.shared.logging.Logger import Logger
+from protocol0.shared.sequence.HasSequenceState import HasSequenceState
 from protocol0.shared.types import T
 
 if TYPE_CHECKING:
@@ -27,6 +31,8 @@ if TYPE_CHECKING:
 
 class DomainEventBus(object):
     _DEBUG = False
+    # count emits and measure their duration by event type
+    _STATS = False
     _DEBUGGED_EVENTS = ()
     # these periodic events are not logged even in debug mode
     _SILENT_EVENTS = (
@@ -42,7 +48,8 @@ class DomainEventBus(object):
         SessionUpdatedEvent,
         MidiBytesReceivedEvent,
     )
-    _registry = {}  # type: Dict[Type, List[Callable]]
+    _registry = {}  # type: Dict[Type, EventSubscribers]
+    _stats = {}  # type: Dict[Type, LatencyHistogram]
 
     @classmethod
     def once(cls, domain_event, subscriber):
@@ -60,50 +67,83 @@ class DomainEventBus(object):
     def subscribe(cls, domain_event, subscriber, unique_method=False):
         # type: (Type, Callable, bool) -> None
         if domain_event not in cls._registry:
-            cls._registry[domain_event] = []
-
-        for sub in cls._registry[domain_event]:
-            if is_func_equal(sub, subscriber, unique_method):
-                Backend.client().show_warning(
-                    "duplicate subscriber : %s for event %s" % (sub, domain_event)
+            cls._registry[domain_event] = EventSubscribers()
+
+        sub = cls._registry[domain_event].find_duplicate(subscriber, unique_method)
+        if sub is not None:
+            Backend.client().show_warning(
+                "duplicate subscriber : %s for event %s" % (sub, domain_event)
+            )
+            if inspect.ismethod(sub):
+                Logger.warning(
+                    "method class: %s <-> %s"
+                    % (get_class_from_func(sub), get_class_from_func(subscriber))
                 )
-                if inspect.ismethod(sub):
-                    Logger.warning(
-                        "method class: %s <-> %s"
-                        % (get_class_from_func(sub), get_class_from_func(subscriber))
-                    )
-                return
+            return
 
-        cls._registry[domain_event].append(subscriber)
+        cls._registry[domain_event].add(subscriber)
 
     @classmethod
     def un_subscribe(cls, domain_event, subscriber):
         # type: (Type, Callable) -> None
-        if domain_event in cls._registry and subscriber in cls._registry[domain_event]:
+        if domain_event in cls._registry:
             cls._registry[domain_event].remove(subscriber)
 
     @classmethod
     @handle_error
     def emit(cls, domain_event):
-        # type: (object) -> Sequence
-        if cls._DEBUG and type(domain_event) not in cls._SILENT_EVENTS:
-            Logger.info("Event emitted: %s" % domain_event.__class__.__name__)
+        # type: (object) -> Optional[Sequence]
+        """
+        Subscribers are called synchronously. A Sequence is created only
+        when a subscriber returns a Sequence that is not terminated
+        """
+        event_type = type(domain_event)
+        if cls._DEBUG and event_type not in cls._SILENT_EVENTS:
+            Logger.info("Event emitted: %s" % event_type.__name__)
+
+        start_at = time.time() if cls._STATS else 0
+
+        event_subscribers = cls._registry.get(event_type)
+        if not event_subscribers:
+            return None
+
+        # the tuple is replaced, not mutated, on unsubscribe in subscribers
+        subscribers = event_subscribers.subscribers
+        if event_type in cls._DEBUGGED_EVENTS:
+            Logger.info("Found subscribers: %s" % [get_callable_repr(sub) for sub in subscribers])
+
+        pending_sequences = []  # type: List[Sequence]
+        for sub in subscribers:
+            res = cls._notify_subscriber(sub, domain_event)
+            if res is not None and isinstance(res, HasSequenceState) and not res.state.terminated:
+                pending_sequences.append(res)
+
+        if cls._STATS:
+            if event_type not in cls._stats:
+                cls._stats[event_type] = LatencyHistogram()
+            cls._stats[event_type].add(time.time() - start_at)
+
+        if not pending_sequences:
+            return None
 
         from protocol0.shared.sequence.Sequence import Sequence
 
+        # wait for the asynchronous subscribers
         seq = Sequence()
+        seq.add([partial(_get_sequence, sub_seq) for sub_seq in pending_sequences])
+        return seq.done()
 
-        if type(domain_event) in cls._registry:
-            # protect the list from unsubscribe in subscribers
-            subscribers = cls._registry[type(domain_event)][:]
-            if type(domain_event) in cls._DEBUGGED_EVENTS:
-                Logger.info(
-                    "Found subscribers: %s" % [get_callable_repr(sub) for sub in subscribers]
-                )
-
-            seq.add([partial(sub, domain_event) for sub in subscribers])
+    @classmethod
+    @handle_error
+    def _notify_subscriber(cls, subscriber, domain_event):
+        # type: (Callable, object) -> Any
+        """an error in a subscriber doesn't prevent notifying the next ones"""
+        return subscriber(domain_event)
 
-        return seq.done()
+    @classmethod
+    def stats(cls):
+        # type: () -> Dict[str, LatencyHistogram]
+        return {event_type.__name__: stats for event_type, stats in cls._stats.items()}
 
     @classmethod
     def defer_emit(cls, domain_event):
@@ -116,3 +156,9 @@ class DomainEventBus(object):
         # type: () -> None
         """Resets the bus (removing all events and listeners)"""
         cls._registry = {}
+        cls._stats = {}
+
+
+def _get_sequence(seq):
+    # type: (Sequence) -> Sequence
+    return seq
@@ -0,0 +1,79 @@
+import inspect
+from collections import defaultdict
+
+from typing import Callable, Tuple, Set, Hashable, Dict, Optional
+
+from protocol0.domain.shared.utils.func import get_func_key, get_class_from_func
+
+
+class EventSubscribers(object):
+    """
+    Subscribers of one event type.
+
+    The subscribers tuple is rebuilt on (un)subscribe only (copy on write)
+    so emitting doesn't need to copy the subscriber list to protect it from
+    subscribers unsubscribing during the emit.
+    Duplicates are detected with hash lookups instead of is_func_equal scans.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        self.subscribers = ()  # type: Tuple[Callable, ...]
+        self._func_keys = set()  # type: Set[Hashable]
+        # several instances of a class can subscribe the same method
+        self._method_key_counts = defaultdict(int)  # type: Dict[Hashable, int]
+
+    def __len__(self):
+        # type: () -> int
+        return len(self.subscribers)
+
+    def find_duplicate(self, subscriber, unique_method):
+        # type: (Callable, bool) -> Optional[Callable]
+        func_key = get_func_key(subscriber)
+        method_key = _get_method_key(subscriber)
+        if func_key not in self._func_keys and not (
+            unique_method and method_key is not None and method_key in self._method_key_counts
+        ):
+            return None
+
+        # rare : find the actual duplicate for the warning
+        for sub in self.subscribers:
+            if get_func_key(sub) == func_key:
+                return sub
+            if unique_method and method_key is not None and _get_method_key(sub) == method_key:
+                return sub
+
+        return None
+
+    def add(self, subscriber):
+        # type: (Callable) -> None
+        self.subscribers = self.subscribers + (subscriber,)
+        self._func_keys.add(get_func_key(subscriber))
+        method_key = _get_method_key(subscriber)
+        if method_key is not None:
+            self._method_key_counts[method_key] += 1
+
+    def remove(self, subscriber):
+        # type: (Callable) -> None
+        if subscriber not in self.subscribers:
+            return
+
+        subscribers = list(self.subscribers)
+        subscribers.remove(subscriber)
+        self.subscribers = tuple(subscribers)
+
+        self._func_keys.discard(get_func_key(subscriber))
+        method_key = _get_method_key(subscriber)
+        if method_key is not None:
+            self._method_key_counts[method_key] -= 1
+            if self._method_key_counts[method_key] <= 0:
+                del self._method_key_counts[method_key]
+
+
+def _get_method_key(func):
+    # type: (Callable) -> Optional[Hashable]
+    """Same method on different objects, see is_func_equal compare_methods"""
+    if inspect.ismethod(func):
+        return get_class_from_func(func), func.__name__
+    else:
+        return None
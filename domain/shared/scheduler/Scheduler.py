@@ -54,11 +54,16 @@ class Scheduler(object):
     @classmethod
     def restart(cls):
         # type: () -> None
+        from protocol0.infra.persistence.DataWriter import DataWriter
+        from protocol0.shared.logging.Logger import Logger
         from protocol0.shared.sequence.Sequence import Sequence
 
         Sequence.reset()
         cls._INSTANCE._tick_scheduler.start()
         cls._INSTANCE._beat_scheduler.reset()
+        # the deferred flushes were dropped with the scheduled events
+        DataWriter.on_scheduler_restart()
+        Logger.flush()
 
     @classmethod
     def reset(cls):
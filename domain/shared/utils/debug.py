@@ -18,10 +18,21 @@ def get_frame_info(frame_count=1):
         (filename, line, method_name, _, _) = inspect.getframeinfo(call_frame)
     except IndexError:
         return None
-    filename = filename.replace(Config.PROJECT_ROOT + "\\", "").replace(
-        Config.REMOTE_SCRIPTS_ROOT + "\\", ""
-    )
-    class_name = filename.replace(".py", "").split("\\")[-1]
+    filename = get_relative_filename(filename)
+    class_name = get_class_name_from_filename(filename)
 
     FrameInfo = namedtuple("FrameInfo", ["filename", "class_name", "line", "method_name"])
     return FrameInfo(filename=filename, class_name=class_name, line=line, method_name=method_name)
+
+
+def get_relative_filename(filename):
+    # type: (str) -> str
+    return filename.replace(Config.PROJECT_ROOT + "\\", "").replace(
+        Config.REMOTE_SCRIPTS_ROOT + "\\", ""
+    )
+
+
+def get_class_name_from_filename(filename):
+    # type: (str) -> str
+    """one class per file"""
+    return filename.replace(".py", "").split("\\")[-1]
@@ -3,7 +3,7 @@ import sys
 import types
 from functools import partial
 
-from typing import Any, Callable, Optional, Type
+from typing import Any, Callable, Optional, Type, Hashable
 
 from protocol0.domain.shared.errors.Protocol0Error import Protocol0Error
 
@@ -110,3 +110,15 @@ def is_func_equal(func1, func2, compare_methods=False):
         return c1 == c2 and func1.__name__ == func2.__name__
     else:
         return False
+
+
+def get_func_key(func):
+    # type: (Callable) -> Hashable
+    """
+    Hashable counterpart of is_func_equal : two functions are equal
+    for is_func_equal when they have the same key
+    """
+    if isinstance(func, partial):
+        return partial, func.func
+    else:
+        return func
@@ -1,10 +1,10 @@
-import inspect
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from functools import wraps, partial
 
-from typing import Any, Callable, Optional, Tuple
+from typing import Any, Callable, Optional, Tuple, Dict
 
+from protocol0.domain.shared.TimerStats import TimerStats
 from protocol0.domain.shared.scheduler.Scheduler import Scheduler
 from protocol0.domain.shared.utils.func import get_callable_repr
 from protocol0.domain.shared.utils.utils import clamp
@@ -25,31 +25,90 @@ def defer(func):
     return decorate
 
 
+# ~ duration of a Live tick
+_TICK_DURATION = 17
+
+
+def _is_method(func):
+    # type: (Callable) -> bool
+    """At decoration time methods are still plain functions"""
+    code = getattr(func, "__code__", None)
+    return code is not None and code.co_argcount > 0 and code.co_varnames[0] == "self"
+
+
+def _get_timer_name(func):
+    # type: (Callable) -> str
+    """one class per file"""
+    return "%s.%s" % (func.__module__.split(".")[-1], func.__name__)
+
+
+class Debouncer(object):
+    """
+    Keeps one pending deadline : calls in the meantime move it
+    and replace the arguments instead of scheduling another callback
+    """
+
+    def __init__(self, func, duration, stats, on_executed):
+        # type: (Callable, int, TimerStats, Callable) -> None
+        self._func = func
+        self._duration = duration
+        self._stats = stats
+        self._on_executed = on_executed
+        self._deadline = 0.0
+        self._last_args = None  # type: Optional[Tuple[Any, Any]]
+        self._pending = False
+
+    def execute(self, *a, **k):
+        # type: (Any, Any) -> None
+        self._last_args = (a, k)
+        self._deadline = time.time() + float(self._duration) / 1000
+
+        if self._pending:
+            self._stats.coalesced += 1
+        else:
+            self._pending = True
+            Scheduler.wait_ms(self._duration, self._on_deadline)
+
+    def _on_deadline(self):
+        # type: () -> None
+        remaining_ticks = int((self._deadline - time.time()) * 1000 / _TICK_DURATION)
+        if remaining_ticks > 0:
+            self._stats.rearms += 1
+            Scheduler.wait(remaining_ticks, self._on_deadline)
+            return
+
+        self._pending = False
+        self._on_executed()
+        a, k = self._last_args
+        self._last_args = None
+        self._stats.executions += 1
+        self._func(*a, **k)
+
+
 def debounce(duration=100):
     # type: (int) -> Func
-    """duration: ms"""
+    """duration: ms, the last call is executed (per object for methods)"""
 
     def wrap(func):
         # type: (Func) -> Func
+        is_method = _is_method(func)
+        stats = TimerStats(_get_timer_name(func))
+        # object id -> pending debouncer
+        debouncers = {}  # type: Dict[Optional[int], Debouncer]
+
         @wraps(func)
         def decorate(*a, **k):
             # type: (Any, Any) -> None
-            object_source = a[0] if inspect.ismethod(func) else decorate
+            stats.calls += 1
+            object_id = id(a[0]) if is_method else None
+            if object_id not in debouncers:
+                debouncers[object_id] = Debouncer(
+                    func, duration, stats, partial(debouncers.pop, object_id, None)
+                )
 
-            decorate.count[object_source] += 1  # type: ignore[attr-defined]
+            debouncers[object_id].execute(*a, **k)
 
-            from protocol0.domain.shared.scheduler.Scheduler import Scheduler
-
-            Scheduler.wait_ms(duration, partial(execute, func, *a, **k))
-
-        decorate.count = defaultdict(int)  # type: ignore[attr-defined]
-
-        def execute(real_func, *a, **k):
-            # type: (Callable, Any, Any) -> Any
-            object_source = a[0] if inspect.ismethod(real_func) else decorate
-            decorate.count[object_source] -= 1  # type: ignore[attr-defined]
-            if decorate.count[object_source] == 0:  # type: ignore[attr-defined]
-                return real_func(*a, **k)
+        decorate.stats = stats  # type: ignore[attr-defined]
 
         return decorate
 
@@ -57,30 +116,46 @@ def debounce(duration=100):
 
 
 class Throttler(object):
-    def __init__(self, func, duration):
-        # type: (Callable, int) -> None
+    """
+    Executes the first call of a window right away
+    and the last call of the window when it ends (one pending deadline)
+    """
+
+    def __init__(self, func, duration, stats):
+        # type: (Callable, int, TimerStats) -> None
         self._func = func
         self._func_repr = get_callable_repr(func)
         self._duration = duration
+        self._stats = stats
         self._last_res = None
         self._last_args = None  # type: Optional[Tuple[Any, Any]]
-        self._throttled = False
+        self._window_end = 0.0
+        self._pending = False
 
     def execute(self, *a, **k):
         # type: (Any, Any) -> Any
-        if not self._throttled:
+        now = time.time()
+        if now >= self._window_end and not self._pending:
+            self._window_end = now + float(self._duration) / 1000
+            self._stats.executions += 1
             self._last_res = self._func(*a, **k)
-            Scheduler.wait_ms(self._duration, self._on_duration_elapsed)
-            self._throttled = True
             return self._last_res
+
+        Logger.warning("%s throttled" % self._func_repr)
+        self._last_args = (a, k)
+        if self._pending:
+            self._stats.coalesced += 1
         else:
-            Logger.warning("%s throttled" % self._func_repr)
-            self._last_args = (a, k)
-            return self._last_res
+            self._pending = True
+            remaining_ticks = int((self._window_end - now) * 1000 / _TICK_DURATION)
+            Scheduler.wait(max(remaining_ticks, 1), self._on_window_end)
 
-    def _on_duration_elapsed(self):
+        return self._last_res
+
+    def _on_window_end(self):
         # type: () -> None
-        self._throttled = False
+        self._pending = False
+        self._window_end = 0.0
         if self._last_args is not None:
             a, k = self._last_args
             self._last_args = None
@@ -93,14 +168,21 @@ def throttle(duration=100):
 
     def wrap(func):
         # type: (Func) -> Func
+        is_method = _is_method(func)
+        stats = TimerStats(_get_timer_name(func))
+        throttlers = {}  # type: Dict[Optional[int], Throttler]
+
         @wraps(func)
         def decorate(*a, **k):
             # type: (Any, Any) -> Any
-            object_source = a[0] if inspect.ismethod(func) else decorate
+            stats.calls += 1
+            object_id = id(a[0]) if is_method else None
+            if object_id not in throttlers:
+                throttlers[object_id] = Throttler(func, duration, stats)
 
-            return decorate._throttler[object_source].execute(*a, **k)  # type: ignore[attr-defined]
+            return throttlers[object_id].execute(*a, **k)
 
-        decorate._throttler = defaultdict(lambda: Throttler(func, duration))  # type: ignore[attr-defined]
+        decorate.stats = stats  # type: ignore[attr-defined]
 
         return decorate
 
@@ -122,22 +204,25 @@ def accelerate(func):
     # number of calls allowed before acceleration starts
     FINE_TUNING_RANGE = 2
 
+    is_method = _is_method(func)
+    duration_second = float(ACCELERATION_ACTIVATION_DURATION) / 1000
+
     @wraps(func)
     def decorate(*a, **k):
         # type: (Any, Any) -> None
-        object_source = a[0] if inspect.ismethod(func) else decorate
-
-        last_calls = decorate.last_calls[object_source]    # type: ignore[attr-defined]
-        last_calls.append(time.time())
+        object_id = id(a[0]) if is_method else None
 
-        duration_second = float(ACCELERATION_ACTIVATION_DURATION) / 1000
-        last_calls = list(filter(lambda t: t >= time.time() - duration_second, last_calls))
-        decorate.last_calls[object_source] = last_calls  # type: ignore[attr-defined]
+        # ascending timestamps : the expired ones are at the left
+        last_calls = decorate.last_calls[object_id]  # type: ignore[attr-defined]
+        now = time.time()
+        while last_calls and last_calls[0] < now - duration_second:
+            last_calls.popleft()
+        last_calls.append(now)
 
         acceleration = len(last_calls) - FINE_TUNING_RANGE + 1
         k["factor"] = clamp(acceleration, 1, MAX_ACCELERATION)
         return func(*a, **k)
 
-    decorate.last_calls = defaultdict(list)  # type: ignore[attr-defined]
+    decorate.last_calls = defaultdict(deque)  # type: ignore[attr-defined]
 
     return decorate
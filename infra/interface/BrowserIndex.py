@@ -0,0 +1,143 @@
+import collections
+
+import Live
+from typing import Dict, List, Tuple, Optional, Set
+
+from protocol0.shared.logging.Logger import Logger
+
+FolderPath = Tuple[str, ...]
+PendingFolders = List[Tuple[FolderPath, Live.Browser.BrowserItem]]
+
+
+class BrowserIndex(object):
+    """
+    Name -> loadable item index of a browser category, expanded lazily.
+
+    Item paths (the folder names from the category root) are kept in `paths`,
+    that is saved and reused across sessions : a known item is resolved by listing
+    only the folders on its path. Unknown names expand the folders not listed yet
+    until the item is found. A stale path only lists again the parent folder of the
+    missing entry.
+    """
+
+    _DEBUG = False
+
+    def __init__(self, root, paths):
+        # type: (Live.Browser.BrowserItem, Dict[str, List[str]]) -> None
+        self._root = root
+        self.paths = paths
+        self.paths_changed = False
+        self._items = {}  # type: Dict[str, Live.Browser.BrowserItem]
+        self._children = {}  # type: Dict[FolderPath, Dict[str, Live.Browser.BrowserItem]]
+        # folders not expanded yet by the lazy walk
+        self._pending_folders = [((), root)]  # type: PendingFolders
+        self.touched_item_count = 0
+        # folders listed during the current lookup
+        self._listed_folders = set()  # type: Set[FolderPath]
+
+    def __repr__(self):
+        # type: () -> str
+        return "BrowserIndex(%s, items=%s)" % (self._root.name, len(self.paths))
+
+    def get_item(self, name):
+        # type: (str) -> Optional[Live.Browser.BrowserItem]
+        self.touched_item_count = 0
+        self._listed_folders = set()
+
+        item = self._items.get(name)
+        if item is None and name in self.paths:
+            item = self._resolve_path(name)
+        if item is None:
+            if not self._pending_folders:
+                # fully expanded : the item was added since
+                self._reset()
+            item = self._expand(name, self._pending_folders)
+
+        if self._DEBUG:
+            Logger.info("%s: %s items touched for %s" % (self, self.touched_item_count, name))
+
+        return item
+
+    def _reset(self):
+        # type: () -> None
+        self._items = {}
+        self._children = {}
+        self._pending_folders = [((), self._root)]
+
+    def _resolve_path(self, name):
+        # type: (str) -> Optional[Live.Browser.BrowserItem]
+        folder_path = tuple(self.paths[name][:-1])
+        folder = self._root
+        for index, folder_name in enumerate(folder_path):
+            sub_folder = self._get_children(folder_path[:index], folder).get(folder_name)
+            if sub_folder is None:
+                return self._refresh_folder(folder_path[:index], folder, name)
+            folder = sub_folder
+
+        item = self._get_children(folder_path, folder).get(name)
+        if item is None or self._is_folder(item):
+            return self._refresh_folder(folder_path, folder, name)
+
+        self._items[name] = item
+        return item
+
+    def _refresh_folder(self, folder_path, folder, name):
+        # type: (FolderPath, Live.Browser.BrowserItem, str) -> Optional[Live.Browser.BrowserItem]
+        """
+        Lists again the folder of a stale entry (unless just listed), looks for the item in it.
+        Only the entries of this folder are dropped : the sub folders entries are still valid
+        """
+        if folder_path not in self._listed_folders:
+            self._children.pop(folder_path, None)
+
+        for item_name, item_path in list(self.paths.items()):
+            if tuple(item_path[:-1]) == folder_path:
+                del self.paths[item_name]
+                self._items.pop(item_name, None)
+        self.paths_changed = True
+
+        pending_folders = [(folder_path, folder)]
+        item = self._expand(name, pending_folders)
+        # the sub folders not listed are expanded by the next lookups
+        self._pending_folders.extend(
+            pending_folder
+            for pending_folder in pending_folders
+            if pending_folder[0] not in self._children
+        )
+        return item
+
+    def _expand(self, name, pending_folders):
+        # type: (str, PendingFolders) -> Optional[Live.Browser.BrowserItem]
+        """Depth first, stops when the item is found. pending_folders is consumed"""
+        while pending_folders:
+            folder_path, folder = pending_folders.pop()
+            sub_folders = []
+            for child_name, child in self._get_children(folder_path, folder).items():
+                if self._is_folder(child):
+                    sub_folders.append((folder_path + (child_name,), child))
+                else:
+                    self._items[child_name] = child
+                    self.paths[child_name] = list(folder_path) + [child_name]
+                    self.paths_changed = True
+
+            pending_folders.extend(reversed(sub_folders))
+            if name in self._items:
+                return self._items[name]
+
+        return None
+
+    def _get_children(self, folder_path, folder):
+        # type: (FolderPath, Live.Browser.BrowserItem) -> Dict[str, Live.Browser.BrowserItem]
+        if folder_path not in self._children:
+            children = collections.OrderedDict()  # type: Dict[str, Live.Browser.BrowserItem]
+            for child in folder.iter_children:
+                self.touched_item_count += 1
+                children[child.name] = child
+            self._children[folder_path] = children
+            self._listed_folders.add(folder_path)
+
+        return self._children[folder_path]
+
+    def _is_folder(self, item):
+        # type: (Live.Browser.BrowserItem) -> bool
+        return item.is_folder or not item.is_loadable
@@ -1,9 +1,14 @@
+import json
+import os
+
 import Live
-from typing import Dict
+from typing import Dict, List, Optional
 
 from protocol0.domain.lom.device.Sample.SampleNotFoundError import SampleNotFoundError
 from protocol0.domain.shared.errors.Protocol0Error import Protocol0Error
 from protocol0.domain.shared.errors.Protocol0Warning import Protocol0Warning
+from protocol0.infra.interface.BrowserIndex import BrowserIndex
+from protocol0.shared.Config import Config
 from protocol0.shared.logging.Logger import Logger
 
 AUDIO_FX = (
@@ -76,10 +81,13 @@ INSTRUMENTS = (
 
 
 class BrowserLoaderService(object):
-    def __init__(self, browser):
-        # type: (Live.Browser.Browser) -> None
+    def __init__(self, browser, index_path=None):
+        # type: (Live.Browser.Browser, Optional[str]) -> None
         self._browser = browser
-        self._cached_browser_items = {}  # type: Dict[str, Dict[str, Live.Browser.BrowserItem]]
+        self._index_path = index_path or Config.BROWSER_INDEX_PATH
+        # category -> name -> item path, saved across sessions
+        self._saved_paths = None  # type: Optional[Dict[str, Dict[str, List[str]]]]
+        self._indexes = {}  # type: Dict[str, BrowserIndex]
 
     def load_device(self, device_name):
         # type: (str) -> None
@@ -110,10 +118,7 @@ class BrowserLoaderService(object):
 
     def get_sample(self, sample_name):
         # type: (str) -> Live.Browser.BrowserItem
-        self._cache_category("samples")
-        return self._cached_browser_items["samples"].get(
-            str(sample_name.decode("utf-8")), None
-        )
+        return self._get_item("samples", str(sample_name.decode("utf-8")))
 
     def _do_load_item(self, item, header="Device"):
         # type: (Live.Browser.BrowserItem, str) -> None
@@ -131,35 +136,43 @@ class BrowserLoaderService(object):
 
     def _get_item_for_category(self, category, name):
         # type: (str, str) -> Live.Browser.BrowserItem
-        """Returns the cached item for the category."""
-        self._cache_category(category)
-        item = self._cached_browser_items[category].get(name, None)
+        item = self._get_item(category, name)
         if item is None:
             raise SampleNotFoundError(name)
 
         return item
 
-    def _cache_category(self, category):
-        # type: (str) -> None
-        """This will cache an entire dict of items for the category if one doesn't
-        already exist."""
-        if category == "user_library" and self._cached_browser_items.get(category, False):
-            self._cached_browser_items[category] = {}
-        if not self._cached_browser_items.get(category, None):
-            self._cached_browser_items[category] = {}
-            self._get_children_for_item(
-                getattr(self._browser, category), self._cached_browser_items[category]
-            )
-
-    def _get_children_for_item(self, item, i_dict, is_drum_rack=False):
-        # type: (Live.Browser.BrowserItem, Dict[str, Live.Browser.BrowserItem], bool) -> None
-        """Recursively builds dict of children items for the given item. This is needed
-        to deal with children that are folders. If is_drum_rack, will only deal with
-        racks in the root (not drum hits)."""
-        for i in item.iter_children:
-            if i.is_folder or not i.is_loadable:
-                if is_drum_rack:
-                    continue
-                self._get_children_for_item(i, i_dict)
-            elif not is_drum_rack or i.name.endswith(".adg"):
-                i_dict[i.name] = i
+    def _get_item(self, category, name):
+        # type: (str, str) -> Optional[Live.Browser.BrowserItem]
+        if category not in self._indexes:
+            paths = self._load_paths().setdefault(category, {})
+            self._indexes[category] = BrowserIndex(getattr(self._browser, category), paths)
+
+        index = self._indexes[category]
+        item = index.get_item(name)
+        if index.paths_changed:
+            self._save_paths()
+            index.paths_changed = False
+
+        return item
+
+    def _load_paths(self):
+        # type: () -> Dict[str, Dict[str, List[str]]]
+        if self._saved_paths is None:
+            self._saved_paths = {}
+            if os.path.exists(self._index_path):
+                try:
+                    with open(self._index_path) as f:
+                        self._saved_paths = json.load(f)
+                except (IOError, ValueError) as e:
+                    Logger.warning("Couldn't load the browser index: %s" % e)
+
+        return self._saved_paths
+
+    def _save_paths(self):
+        # type: () -> None
+        try:
+            with open(self._index_path, "w") as f:
+                json.dump(self._saved_paths, f)
+        except IOError as e:
+            Logger.warning("Couldn't save the browser index: %s" % e)
@@ -0,0 +1,16 @@
+from typing import Any, Optional, Tuple
+
+from protocol0.shared.logging.LogLevelEnum import LogLevelEnum
+
+
+class LogRecord(object):
+    """The message is formatted only when the record is written"""
+
+    __slots__ = ("message", "level", "frame")
+
+    def __init__(self, message, level, frame):
+        # type: (Any, LogLevelEnum, Optional[Tuple[str, int, str]]) -> None
+        self.message = message
+        self.level = level
+        # (filename, line, method name) of the caller
+        self.frame = frame
@@ -1,53 +1,145 @@
+import collections
 import json
 import logging
 import sys
 import types
 
-from typing import Optional, Any, List, Dict
+from typing import Optional, Any, List, Dict, Deque
 
 from protocol0.domain.shared.errors.Protocol0Error import Protocol0Error
 from protocol0.domain.shared.utils.string import smart_string
+from protocol0.infra.logging.LogRecord import LogRecord
 from protocol0.shared.Config import Config
 from protocol0.shared.logging.LogLevelEnum import LogLevelEnum
 from protocol0.shared.logging.LoggerServiceInterface import LoggerServiceInterface
 
 
 class LoggerService(LoggerServiceInterface):
+    """
+    Records are kept in a ring buffer and written to Live's log on the next tick.
+    Warnings and errors are written right away (with the records before them)
+    """
+
+    _MAX_RECORDS = 1000
+
+    def __init__(self):
+        # type: () -> None
+        self._records = collections.deque(maxlen=self._MAX_RECORDS)  # type: Deque[LogRecord]
+        # the last records of the buffer that are not written yet
+        self._pending_record_count = 0
+        self._flush_scheduled = False
+
     def log(self, message, debug=True, level=None):
         # type: (Any, bool, Optional[LogLevelEnum]) -> None
         """a log function and not method allowing us to call this even with no access to the ControlSurface object"""
+        level = level or LogLevelEnum.INFO
+        if level.value < Config.LOG_LEVEL.value:
+            return
+        if not isinstance(debug, bool):
+            raise Protocol0Error("logger: parameter mismatch")
+
         if isinstance(message, types.GeneratorType):
             message = list(message)
 
+        frame = None
+        if debug:
+            try:
+                # caller of the Logger facade
+                # noinspection PyProtectedMember
+                call_frame = sys._getframe(3)
+                code = call_frame.f_code
+                frame = (code.co_filename, call_frame.f_lineno, code.co_name)
+            except ValueError:
+                pass
+
+        self._records.append(LogRecord(message, level, frame))
+        self._pending_record_count = min(self._pending_record_count + 1, self._MAX_RECORDS)
+
+        if level.value >= LogLevelEnum.WARNING.value:
+            self.flush()
+        else:
+            self._schedule_flush()
+
+    def _schedule_flush(self):
+        # type: () -> None
+        if self._flush_scheduled:
+            return
+
+        from protocol0.domain.shared.scheduler.Scheduler import Scheduler
+
+        if Scheduler._INSTANCE is None:
+            self.flush()
+        else:
+            self._flush_scheduled = True
+            Scheduler.defer(self.flush)
+
+    def flush(self):
+        # type: () -> None
+        self._flush_scheduled = False
+        pending_record_count = self._pending_record_count
+        self._pending_record_count = 0
+        if not pending_record_count:
+            return
+
+        records = list(self._records)[-pending_record_count:]
+        for record in records:
+            self._write(self._format(record))
+
+    def get_last_records(self, count):
+        # type: (int) -> List[str]
+        return [self._format(record) for record in list(self._records)[-count:]]
+
+    def dump_last_records(self, count):
+        # type: (int) -> None
+        """Writes the last written records again, without adding them to the buffer"""
+        records = list(self._records)[: len(self._records) - self._pending_record_count]
+        # a clear would hide the dumped records
+        records = [record for record in records if record.message != "clear_logs"]
+        self.flush()
+        for record in records[-count:]:
+            self._write(self._format(record))
+
+    def _format(self, record):
+        # type: (LogRecord) -> str
+        """The message is formatted when written : it can fail (e.g. a disconnected LOM object)"""
+        # noinspection PyBroadException
+        try:
+            message = self._format_message(record.message)
+        except Exception as e:
+            message = "unformattable %s (%r)" % (record.message.__class__.__name__, e)
+
+        message = "%s: %s" % (record.level.name.lower(), message)
+        if record.frame is not None:
+            from protocol0.domain.shared.utils.debug import get_relative_filename
+
+            filename, line, method_name = record.frame
+            message = "%s (%s:%s in %s)" % (
+                message,
+                get_relative_filename(filename),
+                line,
+                method_name,
+            )
+
+        return message
+
+    def _format_message(self, message):
+        # type: (Any) -> str
         if isinstance(message, List) or isinstance(message, Dict):
             try:
                 # use str to json encode classes
                 message = json.dumps(message, indent=4, default=str)
             except (TypeError, UnicodeEncodeError) as e:
-                from protocol0.shared.logging.Logger import Logger
-
-                Logger.warning(e)
+                message = "%s (%s)" % (message, e)
 
         if sys.version_info.major == 2 and not isinstance(message, basestring):
             message = str(message)
 
-        level = level or LogLevelEnum.INFO
-        if level.value < Config.LOG_LEVEL.value:
-            return
-        message = "%s: %s" % (level.name.lower(), smart_string(message))
-        if not isinstance(debug, bool):
-            raise Protocol0Error("logger: parameter mismatch")
-        if debug:
-            from protocol0.domain.shared.utils.debug import get_frame_info
-
-            frame_info = get_frame_info(4)
-            if frame_info:
-                message = "%s (%s:%s in %s)" % (
-                    message,
-                    frame_info.filename,
-                    frame_info.line,
-                    frame_info.method_name,
-                )
+        message = smart_string(message)
+        # smart_string returns the message as is on python 3
+        return message if isinstance(message, str) else str(message)
+
+    def _write(self, message):
+        # type: (str) -> None
         for line in message.splitlines():
             if sys.version_info.major == 2:
                 line.decode("utf-8").encode("ascii", "replace")
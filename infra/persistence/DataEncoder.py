@@ -0,0 +1,56 @@
+import base64
+import json
+import zlib
+
+from typing import Any, Dict, List
+
+
+class DataEncoder(object):
+    """
+    Compact encoding of large file path mappings (file path -> value).
+
+    The directories are interned : {"d": [directories], "p": {"<index>:<basename>": value}}
+    then the json is zlib compressed and base64 encoded behind a prefix.
+    Small mappings are kept as is, and not prefixed values are decoded as is (previous set data).
+    """
+
+    _PREFIX = "p0z1:"
+    _MIN_ENCODED_SIZE = 2048
+
+    @classmethod
+    def encode(cls, file_path_mapping):
+        # type: (Dict[str, Any]) -> Any
+        if len(json.dumps(file_path_mapping)) < cls._MIN_ENCODED_SIZE:
+            return file_path_mapping
+
+        directories = []  # type: List[str]
+        directory_indexes = {}  # type: Dict[str, int]
+        paths = {}  # type: Dict[str, Any]
+        for file_path, value in file_path_mapping.items():
+            # the directory keeps its separator : the path is rebuilt as is
+            name = file_path.replace("\\", "/").split("/")[-1]
+            directory = file_path[: len(file_path) - len(name)]
+            if directory not in directory_indexes:
+                directory_indexes[directory] = len(directories)
+                directories.append(directory)
+            paths["%s:%s" % (directory_indexes[directory], name)] = value
+
+        data = json.dumps({"d": directories, "p": paths}, separators=(",", ":"))
+        encoded_data = base64.b64encode(zlib.compress(data.encode("utf-8"))).decode("ascii")
+        return cls._PREFIX + str(encoded_data)
+
+    @classmethod
+    def decode(cls, value):
+        # type: (Any) -> Any
+        if isinstance(value, dict) or not str(value).startswith(cls._PREFIX):
+            return value
+
+        encoded_data = str(value)[len(cls._PREFIX):]
+        data = json.loads(zlib.decompress(base64.b64decode(encoded_data)).decode("utf-8"))
+        directories = data["d"]
+        file_path_mapping = {}  # type: Dict[str, Any]
+        for key, path_value in data["p"].items():
+            directory_index, name = key.split(":", 1)
+            file_path_mapping[directories[int(directory_index)] + name] = path_value
+
+        return file_path_mapping
@@ -0,0 +1,83 @@
+import collections
+import json
+import weakref
+
+from typing import Any, Callable, Dict, Tuple
+
+from protocol0.domain.shared.scheduler.Scheduler import Scheduler
+from protocol0.shared.logging.Logger import Logger
+
+SetData = Callable[[str, Any], None]
+DirtyEntry = Tuple[Any, SetData, str, Callable[[], Any]]
+
+
+class DataWriter(object):
+    """
+    Batches the set and track data writes.
+
+    Owners mark their data dirty, the values are read and written once on the next tick
+    (or on script disconnect). Values equal to the last written ones are not written again.
+    """
+
+    _DEBUG = False
+
+    # (owner id, key) -> (owner, set_data, key, get_value)
+    _DIRTY = collections.OrderedDict()  # type: Dict[Tuple[int, str], DirtyEntry]
+    # owner -> key -> last written json
+    _WRITTEN = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary
+    _FLUSH_SCHEDULED = False
+
+    flush_count = 0
+    bytes_written = 0
+    last_flush_bytes_written = 0
+
+    @classmethod
+    def mark_dirty(cls, owner, set_data, key, get_value):
+        # type: (Any, SetData, str, Callable[[], Any]) -> None
+        cls._DIRTY[(id(owner), key)] = (owner, set_data, key, get_value)
+
+        if not cls._FLUSH_SCHEDULED:
+            cls._FLUSH_SCHEDULED = True
+            Scheduler.defer(cls.flush)
+
+    @classmethod
+    def on_scheduler_restart(cls):
+        # type: () -> None
+        """The restart drops the scheduled flush"""
+        cls._FLUSH_SCHEDULED = False
+        if cls._DIRTY:
+            cls._FLUSH_SCHEDULED = True
+            Scheduler.defer(cls.flush)
+
+    @classmethod
+    def flush(cls):
+        # type: () -> None
+        dirty_entries = cls._DIRTY
+        cls._DIRTY = collections.OrderedDict()
+        cls._FLUSH_SCHEDULED = False
+
+        bytes_written = 0
+        for owner, set_data, key, get_value in dirty_entries.values():
+            value = get_value()
+            serialized_value = json.dumps(value, sort_keys=True)
+            written_values = cls._WRITTEN.setdefault(owner, {})  # type: Dict[str, str]
+            if written_values.get(key) == serialized_value:
+                continue
+
+            set_data(key, value)
+            written_values[key] = serialized_value
+            bytes_written += len(serialized_value)
+
+        cls.flush_count += 1
+        cls.last_flush_bytes_written = bytes_written
+        cls.bytes_written += bytes_written
+
+        if cls._DEBUG and bytes_written:
+            Logger.info("flushed %s entries: %s bytes" % (len(dirty_entries), bytes_written))
+
+    @classmethod
+    def reset(cls):
+        # type: () -> None
+        cls._DIRTY = collections.OrderedDict()
+        cls._WRITTEN = weakref.WeakKeyDictionary()
+        cls._FLUSH_SCHEDULED = False
@@ -4,6 +4,7 @@ from protocol0.domain.lom.scene.SceneFiredEvent import SceneFiredEvent
 from protocol0.domain.lom.song.components.SceneComponent import SceneComponent
 from protocol0.domain.shared.event.DomainEventBus import DomainEventBus
 from protocol0.domain.shared.scheduler.Scheduler import Scheduler
+from protocol0.infra.persistence.DataWriter import DataWriter
 from protocol0.infra.persistence.SongDataEnum import SongDataEnum
 from protocol0.shared.Song import Song
 
@@ -43,9 +44,9 @@ class SongDataService(object):
 
     def _save(self):
         # type: () -> None
-        """Save watched elements in the set data"""
+        """Save watched elements in the set data (unchanged values are not written again)"""
         for enum, element in self._elements.items():
-            self._set_data(enum.value, element.get_value())
+            DataWriter.mark_dirty(self, self._set_data, enum.value, element.get_value)
 
     def _restore(self):
         # type: () -> None
@@ -1,7 +1,9 @@
-from typing import TYPE_CHECKING, Dict
+from typing import TYPE_CHECKING, Any, Dict
 
 from protocol0.domain.lom.track.simple_track.AudioToMidiClipMapping import AudioToMidiClipMapping
 from protocol0.domain.shared.LiveObject import liveobj_valid
+from protocol0.infra.persistence.DataEncoder import DataEncoder
+from protocol0.infra.persistence.DataWriter import DataWriter
 from protocol0.infra.persistence.TrackDataEnum import TrackDataEnum
 
 if TYPE_CHECKING:
@@ -19,11 +21,18 @@ class TrackData(object):
 
     def save(self):
         # type: () -> None
+        """The mapping is written on the next tick (or on script disconnect)"""
+        DataWriter.mark_dirty(
+            self,
+            self._set_data,
+            TrackDataEnum.CLIP_MAPPING.value,
+            lambda: self._track.clip_mapping.to_dict(),
+        )
+
+    def _set_data(self, key, value):
+        # type: (str, Any) -> None
         if liveobj_valid(self._track._track):
-            self._track._track.set_data(
-                TrackDataEnum.CLIP_MAPPING.value,
-                self._track.clip_mapping.to_dict(),
-            )
+            self._track._track.set_data(key, DataEncoder.encode(value))
 
     def restore(self):
         # type: () -> None
@@ -33,4 +42,5 @@ class TrackData(object):
         )  # type: Dict
 
         if mapping_data is not None:
+            mapping_data = DataEncoder.decode(mapping_data)
             self._track.clip_mapping = AudioToMidiClipMapping(self, mapping_data)
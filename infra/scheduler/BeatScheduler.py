@@ -1,6 +1,9 @@
+import heapq
+import itertools
+
 import Live
 from _Framework.SubjectSlot import subject_slot, SlotManager
-from typing import Callable, List
+from typing import Callable, List, Tuple
 
 from protocol0.domain.lom.scene.SceneLastBarPassedEvent import SceneLastBarPassedEvent
 from protocol0.domain.shared.event.DomainEventBus import DomainEventBus
@@ -16,10 +19,16 @@ from protocol0.infra.scheduler.BeatSchedulerEvent import BeatSchedulerEvent
 from protocol0.infra.scheduler.BeatTime import BeatTime
 from protocol0.shared.Song import Song
 
+# (execution_tick, insertion order, event)
+HeapEntry = Tuple[int, int, BeatSchedulerEvent]
+
 
 class BeatScheduler(SlotManager, BeatSchedulerInterface):
     """BeatScheduler schedules action lists to be triggered after a specified
-    number of bars."""
+    number of bars.
+
+    Events are kept in a min heap sorted by absolute song tick
+    and the song time is read once per tick."""
 
     def __init__(self, song):
         # type: (Live.Song.Song) -> None
@@ -29,32 +38,42 @@ class BeatScheduler(SlotManager, BeatSchedulerInterface):
         self._last_beats_song_time = BeatTime.from_song_beat_time(
             song.get_current_beats_song_time()
         )
-        self._scheduled_events = []  # type: List[BeatSchedulerEvent]
+        self._insertion_counter = itertools.count()
+        self._scheduled_events = []  # type: List[HeapEntry]
         self._is_playing_listener.subject = song
 
     @subject_slot("is_playing")
     def _is_playing_listener(self):
         # type: () -> None
         if not self._song.is_playing:
-            self._execute_events()  # execute song stopped events
+            self._execute_song_stopped_events()
             self.reset()
 
     def _on_tick(self):
         # type: () -> None
-        self._dispatch_timing_events()
-        self._execute_events()
+        current_beats_song_time = BeatTime.from_song_beat_time(Song.current_beats_song_time())
+        self._dispatch_timing_events(current_beats_song_time)
+        self._execute_events(current_beats_song_time)
+
+    def _execute_events(self, current_beats_song_time):
+        # type: (BeatTime) -> None
+        """Pops only the due events, in song time order"""
+        current_tick_count = current_beats_song_time._to_tick_count
+        scheduled_events = self._scheduled_events
+        while scheduled_events and scheduled_events[0][0] <= current_tick_count:
+            _, _, event = heapq.heappop(scheduled_events)
+            event.execute()
 
-    def _execute_events(self):
+    def _execute_song_stopped_events(self):
         # type: () -> None
-        for event in self._scheduled_events:
-            if event.should_execute:
+        scheduled_events = sorted(self._scheduled_events)
+        del self._scheduled_events[:]
+        for _, _, event in scheduled_events:
+            if event.execute_on_song_stop:
                 event.execute()
-                self._scheduled_events.remove(event)
-
-    def _dispatch_timing_events(self):
-        # type: () -> None
-        current_beats_song_time = BeatTime.from_song_beat_time(Song.current_beats_song_time())
 
+    def _dispatch_timing_events(self, current_beats_song_time):
+        # type: (BeatTime) -> None
         events = []  # type: List[object]
         if (
             current_beats_song_time.bars != self._last_beats_song_time.bars
@@ -106,7 +125,10 @@ class BeatScheduler(SlotManager, BeatSchedulerInterface):
         if beats_offset == 0:
             event.execute()
         else:
-            self._scheduled_events.append(event)
+            heapq.heappush(
+                self._scheduled_events,
+                (event.execution_tick, next(self._insertion_counter), event),
+            )
 
     def disconnect(self):
         # type: () -> None
@@ -1,17 +1,21 @@
 from math import floor
 
 import Live
+from typing import Optional
 
 from protocol0.shared.Song import Song
 
 
 class BeatTime(object):
+    """Immutable : the absolute tick count is computed once"""
+
     def __init__(self, bars, beats, sixteenths, ticks):
         # type: (int, int, int, int) -> None
-        self.bars = bars
-        self.beats = beats
+        self._bars = bars
+        self._beats = beats
         self._sixteenths = sixteenths
         self._ticks = ticks  # 1 to 60
+        self._tick_count = None  # type: Optional[int]
 
     def __repr__(self):
         # type: () -> str
@@ -22,6 +26,16 @@ class BeatTime(object):
             self._ticks,
         )
 
+    @property
+    def bars(self):
+        # type: () -> int
+        return self._bars
+
+    @property
+    def beats(self):
+        # type: () -> int
+        return self._beats
+
     def __eq__(self, other):
         # type: (object) -> bool
         return isinstance(other, BeatTime) and self._to_tick_count == other._to_tick_count
@@ -37,20 +51,26 @@ class BeatTime(object):
     @property
     def _to_tick_count(self):
         # type: () -> int
-        sixteenths_coeff = 60
-        beat_coeff = 4 * sixteenths_coeff
-        bar_coeff = beat_coeff * Song.signature_numerator()
-        return (
-            self._ticks
-            + self._sixteenths * sixteenths_coeff
-            + self.beats * beat_coeff
-            + self.bars * bar_coeff
-        )
+        """
+        Absolute song tick, computed with the signature at the time of the first access.
+        A signature change doesn't move the tick count of existing BeatTime objects
+        """
+        if self._tick_count is None:
+            sixteenths_coeff = 60
+            beat_coeff = 4 * sixteenths_coeff
+            bar_coeff = beat_coeff * Song.signature_numerator()
+            self._tick_count = (
+                self._ticks
+                + self._sixteenths * sixteenths_coeff
+                + self.beats * beat_coeff
+                + self.bars * bar_coeff
+            )
+        return self._tick_count
 
     @property
     def is_start(self):
         # type: () -> bool
-        return self == BeatTime(1, 1, 1, 1)
+        return self.bars == 1 and self.beats == 1 and self._sixteenths == 1 and self._ticks == 1
 
     @classmethod
     def from_song_beat_time(cls, beat_time):
@@ -1,25 +1,41 @@
+import heapq
+import itertools
+
 import Live
-from typing import List, Callable, Optional
+from typing import List, Callable, Optional, Tuple, Dict, Hashable, Set
 
 from protocol0.domain.shared.errors.error_handler import handle_error
 from protocol0.domain.shared.scheduler.TickSchedulerEventInterface import (
     TickSchedulerEventInterface,
 )
 from protocol0.domain.shared.scheduler.TickSchedulerInterface import TickSchedulerInterface
-from protocol0.domain.shared.utils.func import is_func_equal
+from protocol0.domain.shared.utils.func import get_func_key
 from protocol0.infra.scheduler.BeatScheduler import BeatScheduler
 from protocol0.infra.scheduler.TickSchedulerEvent import TickSchedulerEvent
 from protocol0.shared.logging.Logger import Logger
 
+# (execution_tick, insertion order, event) : the insertion order keeps the
+# heap stable for events due on the same tick and avoids comparing events
+HeapEntry = Tuple[int, int, TickSchedulerEvent]
+
 
 class TickScheduler(TickSchedulerInterface):
+    """
+    Events are stored in a min heap keyed on an absolute tick count.
+    A tick only pops the due events, instead of decrementing every pending event
+    """
+
     def __init__(self, beat_scheduler, song):
         # type: (BeatScheduler, Live.Song.Song) -> None
         self._beat_scheduler = beat_scheduler
         self._song = song
         self._live_timer = None  # type: Optional[Live.Base.Timer]
+        self._tick = 0
+        self._insertion_counter = itertools.count()
         # noinspection PyArgumentList
-        self._scheduled_events = []  # type: List[TickSchedulerEvent]
+        self._scheduled_events = []  # type: List[HeapEntry]
+        # pending events by callback, used to cancel duplicates when scheduling with unique=True
+        self._events_by_func_key = {}  # type: Dict[Hashable, Set[TickSchedulerEvent]]
 
         self.start()
 
@@ -27,6 +43,7 @@ class TickScheduler(TickSchedulerInterface):
         # type: () -> None
         if self._live_timer:
             del self._scheduled_events[:]
+            self._events_by_func_key.clear()
             # noinspection PyArgumentList
             self._live_timer.stop()
 
@@ -49,30 +66,67 @@ class TickScheduler(TickSchedulerInterface):
 
         if is_song_playing:
             self._beat_scheduler._on_tick()
-        for scheduled_event in self._scheduled_events[:]:
-            if scheduled_event.should_execute:
-                scheduled_event.execute()
-                try:
-                    self._scheduled_events.remove(scheduled_event)
-                except ValueError:
-                    pass
-            else:
-                scheduled_event.decrement_timeout()
+
+        self._tick += 1
+        scheduled_events = self._scheduled_events
+        # events scheduled during execution are due at least one tick later
+        while scheduled_events and scheduled_events[0][0] <= self._tick:
+            _, _, scheduled_event = heapq.heappop(scheduled_events)
+            self._un_index_event(scheduled_event)
+            # cancelled events are skipped by execute
+            scheduled_event.execute()
 
     def schedule(self, tick_count, callback, unique=False):
         # type: (int, Callable, bool) -> TickSchedulerEventInterface
         assert callable(callback), "callback is not callable"
         assert tick_count > 0, "ticks_count is <= 0"
 
+        # same timing as the former decrementing countdown :
+        # the event executes on the tick following its last decrement
+        scheduled_event = TickSchedulerEvent(
+            callback=callback, execution_tick=self._tick + tick_count + 1
+        )
+
+        func_key = _get_hashable_func_key(callback)
+        scheduled_event.func_key = func_key
+        pending_events = self._events_by_func_key.setdefault(func_key, set())
+
         if unique:
-            for event in self._scheduled_events:
-                if is_func_equal(event.callback, callback):
+            for event in pending_events:
+                if not event.cancelled:
                     Logger.warning(
                         "Cancelling duplicate callback : %s -> %s" % (event.callback, callback)
                     )
                     event.cancel()
-                    self._scheduled_events.remove(event)
+            # cancelled events are skipped when popped from the heap
+            pending_events.clear()
 
-        scheduled_event = TickSchedulerEvent(callback=callback, tick_count=tick_count)
-        self._scheduled_events.append(scheduled_event)
+        pending_events.add(scheduled_event)
+
+        heapq.heappush(
+            self._scheduled_events,
+            (scheduled_event.execution_tick, next(self._insertion_counter), scheduled_event),
+        )
         return scheduled_event
+
+    def _un_index_event(self, scheduled_event):
+        # type: (TickSchedulerEvent) -> None
+        pending_events = self._events_by_func_key.get(scheduled_event.func_key)
+        if pending_events is None:
+            return
+
+        # cancelled duplicates are already removed
+        pending_events.discard(scheduled_event)
+        if not pending_events:
+            del self._events_by_func_key[scheduled_event.func_key]
+
+
+def _get_hashable_func_key(func):
+    # type: (Callable) -> Hashable
+    func_key = get_func_key(func)
+    try:
+        hash(func_key)
+    except TypeError:
+        # e.g. a method of an unhashable object : fallback on identity
+        return id(func)
+    return func_key
@@ -1,4 +1,4 @@
-from typing import Callable
+from typing import Callable, Optional, Hashable
 
 from protocol0.domain.shared.scheduler.TickSchedulerEventInterface import (
     TickSchedulerEventInterface,
@@ -7,10 +7,13 @@ from protocol0.domain.shared.utils.func import get_callable_repr
 
 
 class TickSchedulerEvent(TickSchedulerEventInterface):
-    def __init__(self, callback, tick_count):
+    def __init__(self, callback, execution_tick):
         # type: (Callable, int) -> None
         self.callback = callback
-        self._ticks_left = tick_count
+        # absolute tick of the TickScheduler counter
+        self.execution_tick = execution_tick
+        # set by the scheduler to cancel duplicate callbacks
+        self.func_key = None  # type: Optional[Hashable]
         self._cancelled = False
 
     def __repr__(self):
@@ -18,14 +21,9 @@ class TickSchedulerEvent(TickSchedulerEventInterface):
         return get_callable_repr(self.callback)
 
     @property
-    def should_execute(self):
+    def cancelled(self):
         # type: () -> bool
-        return self._ticks_left == 0
-
-    def decrement_timeout(self):
-        # type: () -> None
-        assert self._ticks_left > 0, "0 ticks left"
-        self._ticks_left -= 1
+        return self._cancelled
 
     def execute(self):
         # type: () -> None
@@ -34,4 +32,5 @@ class TickSchedulerEvent(TickSchedulerEventInterface):
 
     def cancel(self):
         # type: () -> None
+        """Lazy cancellation : the event stays in the queue and is skipped when due"""
         self._cancelled = True
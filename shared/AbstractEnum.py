@@ -1,10 +1,13 @@
 from enum import Enum
-from typing import TypeVar, cast, Any, Dict
+from typing import TypeVar, cast, Any, Dict, Optional, Type
 
 from protocol0.domain.shared.errors.Protocol0Error import Protocol0Error
 
 T = TypeVar("T", bound=Enum)
 
+# enum class -> value -> member (enum classes cannot hold mutable attributes)
+_VALUE_TO_MEMBER = {}  # type: Dict[Type[Enum], Dict[Any, Enum]]
+
 
 class AbstractEnum(Enum):
     def __str__(self):
@@ -14,11 +17,34 @@ class AbstractEnum(Enum):
     @classmethod
     def from_value(cls, value):
         # type: (Any) -> T
-        for _, enum in cls.__members__.items():
-            if value == enum.value:
-                return cast(T, enum)
+        enum = cls.get_from_value(value)
+        if enum is None:
+            raise Protocol0Error("Couldn't find matching enum for value %s" % value)
+
+        return cast(T, enum)
+
+    @classmethod
+    def get_from_value(cls, value):
+        # type: (Any) -> Optional[T]
+        """Same as from_value without raising on unknown values"""
+        value_to_member = _VALUE_TO_MEMBER.get(cls)
+        if value_to_member is None:
+            value_to_member = _VALUE_TO_MEMBER[cls] = {}
+            # the first member wins
+            for enum in reversed(list(cls.__members__.values())):
+                try:
+                    value_to_member[enum.value] = enum
+                except TypeError:
+                    pass
 
-        raise Protocol0Error("Couldn't find matching enum for value %s" % value)
+        try:
+            return cast(T, value_to_member.get(value))
+        except TypeError:
+            # unhashable value
+            for enum in cls.__members__.values():
+                if value == enum.value:
+                    return cast(T, enum)
+            return None
 
     def get_value_from_mapping(self, mapping):
         # type: (Dict[AbstractEnum, Any]) -> Any
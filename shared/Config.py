@@ -13,6 +13,8 @@ class Config(object):
     PROJECT_ROOT = dirname(dirname(realpath(__file__)))
     REMOTE_SCRIPTS_ROOT = dirname(PROJECT_ROOT)
     SAMPLE_DIRECTORY = str(os.getenv("SAMPLE_DIRECTORY"))
+    PRESET_INDEX_DIRECTORY = os.path.join(PROJECT_ROOT, ".preset_index")
+    BROWSER_INDEX_PATH = os.path.join(PROJECT_ROOT, ".browser_index.json")
 
     # SERVICES
     SENTRY_DSN = os.getenv("SENTRY_DSN")
@@ -27,6 +29,10 @@ class Config(object):
 
     TRACK_VOLUME_MONITORING = False
 
+    # clips subscribe to live when selected, playing or needed by a service
+    # (the scene caches attach the loop listeners of their clips)
+    LAZY_CLIP_LISTENERS = False
+
     DEFAULT_WARP_MODE = Live.Clip.WarpMode.beats
 
     CLIP_MAX_LENGTH = 63072000
@@ -2,10 +2,11 @@ import traceback
 from typing import Iterator
 
 import Live
-from typing import TYPE_CHECKING, Optional, List, cast, Type
+from typing import TYPE_CHECKING, Optional, List, cast, Type, Tuple
 
 from protocol0.domain.shared.errors.Protocol0Error import Protocol0Error
 from protocol0.domain.shared.errors.Protocol0Warning import Protocol0Warning
+from protocol0.shared.SongSnapshot import SongSnapshot
 from protocol0.shared.types import T
 
 if TYPE_CHECKING:
@@ -80,6 +81,26 @@ class Song(object):
         self._track_recorder_service = track_recorder_service
         self._session_to_arrangement_service = session_to_arrangement_service
 
+        self._song_snapshot = None  # type: Optional[SongSnapshot]
+
+    @classmethod
+    def _snapshot(cls):
+        # type: () -> SongSnapshot
+        """Tracks and scenes, mapped again only when their generation changed"""
+        snapshot = cls._INSTANCE._song_snapshot
+        if snapshot is not None and snapshot.is_valid:
+            SongSnapshot.CACHE_STATS.hits += 1
+            return snapshot
+
+        SongSnapshot.CACHE_STATS.recomputes += 1
+        snapshot = SongSnapshot(
+            cls._INSTANCE._track_mapper_service,
+            cls._INSTANCE._track_component,
+            cls._INSTANCE._scene_service,
+        )
+        cls._INSTANCE._song_snapshot = snapshot
+        return snapshot
+
     @classmethod
     def _live_song(cls):
         # type: () -> Live.Song.Song
@@ -137,7 +158,7 @@ class Song(object):
     @classmethod
     def abstract_tracks(cls):
         # type: () -> Iterator[AbstractTrack]
-        return cls._INSTANCE._track_component.abstract_tracks
+        return iter(cls._snapshot().abstract_tracks)
 
     @classmethod
     def live_track_to_simple_track(cls, live_track):
@@ -166,21 +187,15 @@ class Song(object):
     @classmethod
     def simple_tracks(cls, track_cls=None):
         # type: (Optional[Type[T]]) -> Iterator[T|SimpleTrack]
-        from protocol0.domain.lom.track.simple_track.SimpleTrack import SimpleTrack
-
-        track_cls = track_cls or SimpleTrack
-
-        tracks = (track for track in cls.all_simple_tracks() if track.IS_ACTIVE)
-
-        return (track for track in tracks if isinstance(track, track_cls))
+        if track_cls is None:
+            return iter(cls._snapshot().simple_tracks)
+        else:
+            return iter(cls._snapshot().get_simple_tracks(track_cls))
 
     @classmethod
     def all_simple_tracks(cls):
         # type: () -> Iterator[SimpleTrack]
-        return (
-            track
-            for track in cls._INSTANCE._track_mapper_service._live_track_id_to_simple_track.values()
-        )
+        return iter(cls._snapshot().all_simple_tracks)
 
     @classmethod
     def abstract_group_tracks(cls):
@@ -189,9 +204,7 @@ class Song(object):
             AbstractGroupTrack,
         )
 
-        for track in cls.abstract_tracks():
-            if isinstance(track, AbstractGroupTrack):
-                yield track
+        return iter(cls._snapshot().get_abstract_tracks(AbstractGroupTrack))
 
     @classmethod
     def external_synth_tracks(cls):
@@ -200,9 +213,7 @@ class Song(object):
             ExternalSynthTrack,
         )
 
-        for track in cls.abstract_tracks():
-            if isinstance(track, ExternalSynthTrack):
-                yield track
+        return iter(cls._snapshot().get_abstract_tracks(ExternalSynthTrack))
 
     @classmethod
     def scrollable_tracks(cls):
@@ -217,7 +228,8 @@ class Song(object):
     @classmethod
     def armed_tracks(cls):
         # type: () -> Iterator[AbstractTrack]
-        return (track for track in cls.abstract_tracks() if track.arm_state.is_armed)
+        # the arm state is not part of the snapshot
+        return (track for track in cls._snapshot().abstract_tracks if track.arm_state.is_armed)
 
     @classmethod
     def drums_track(cls):
@@ -250,8 +262,8 @@ class Song(object):
 
     @classmethod
     def scenes(cls):
-        # type: () -> List[Scene]
-        return cls._INSTANCE._scene_service.scenes
+        # type: () -> Tuple[Scene, ...]
+        return cls._snapshot().scenes
 
     @classmethod
     def last_scene(cls):
@@ -287,19 +299,16 @@ class Song(object):
         # type: (Optional[Type[T]]) -> Optional[T|ClipSlot]
         from protocol0.domain.lom.clip_slot.ClipSlot import ClipSlot
 
+        from protocol0.domain.lom.clip_slot.ClipSlotIndex import ClipSlotIndex
+
         clip_slot_cls = clip_slot_cls or ClipSlot
 
-        if cls.selected_track() is None:
+        highlighted_clip_slot = cls._live_song().view.highlighted_clip_slot
+        if cls.selected_track() is None or highlighted_clip_slot is None:
             return None
         else:
-            clip_slot = next(
-                (
-                    cs
-                    for cs in cls.selected_track().clip_slots
-                    if cs._clip_slot == cls._live_song().view.highlighted_clip_slot
-                ),
-                None,
-            )
+            # the highlighted clip slot is on the selected track
+            clip_slot = ClipSlotIndex.get_clip_slot(highlighted_clip_slot)
 
             if clip_slot is None:
                 return None
@@ -316,7 +325,8 @@ class Song(object):
 
         clip_cls = clip_cls or Clip
 
-        clip = cls.selected_clip_slot() and cls.selected_clip_slot().clip
+        selected_clip_slot = cls.selected_clip_slot()
+        clip = selected_clip_slot and selected_clip_slot.clip
         if clip is None:
             clip = cls.selected_track().clip_slots[Song.selected_scene().index].clip
 
@@ -326,6 +336,9 @@ class Song(object):
         if clip is not None and not isinstance(clip, clip_cls):
             raise Protocol0Warning("clip is not a %s" % clip_cls.__name__)
 
+        if clip is not None:
+            clip.attach_listeners()
+
         return clip
 
     @classmethod
@@ -0,0 +1,99 @@
+from typing import TYPE_CHECKING, Tuple, Dict, Optional, Type
+
+from protocol0.domain.shared.CacheStats import CacheStats
+
+if TYPE_CHECKING:
+    from protocol0.domain.lom.scene.SceneService import SceneService
+    from protocol0.domain.lom.song.components.TrackComponent import TrackComponent
+    from protocol0.domain.lom.track.TrackMapperService import TrackMapperService
+    from protocol0.domain.lom.track.abstract_track.AbstractTrack import AbstractTrack
+    from protocol0.domain.lom.track.simple_track.SimpleTrack import SimpleTrack
+    from protocol0.domain.lom.scene.Scene import Scene
+
+
+class SongSnapshot(object):
+    """
+    Tracks and scenes of the song as tuples, with per class indexes.
+
+    A snapshot is valid for one generation : TrackMapperService and SceneService
+    bump the generation each time they change their mapping.
+    Its parts are computed on first access.
+    """
+
+    _GENERATION = 0
+    CACHE_STATS = CacheStats("song snapshot")
+
+    def __init__(self, track_mapper_service, track_component, scene_service):
+        # type: (TrackMapperService, TrackComponent, SceneService) -> None
+        self.generation = self._GENERATION
+        self._track_mapper_service = track_mapper_service
+        self._track_component = track_component
+        self._scene_service = scene_service
+
+        self._all_simple_tracks = None  # type: Optional[Tuple[SimpleTrack, ...]]
+        self._simple_tracks = None  # type: Optional[Tuple[SimpleTrack, ...]]
+        self._abstract_tracks = None  # type: Optional[Tuple[AbstractTrack, ...]]
+        self._scenes = None  # type: Optional[Tuple[Scene, ...]]
+        self._simple_tracks_by_class = {}  # type: Dict[Type, Tuple[SimpleTrack, ...]]
+        self._abstract_tracks_by_class = {}  # type: Dict[Type, Tuple[AbstractTrack, ...]]
+
+    def __repr__(self):
+        # type: () -> str
+        return "SongSnapshot(generation=%s)" % self.generation
+
+    @classmethod
+    def bump_generation(cls):
+        # type: () -> None
+        cls._GENERATION += 1
+
+    @property
+    def is_valid(self):
+        # type: () -> bool
+        return self.generation == self._GENERATION
+
+    @property
+    def all_simple_tracks(self):
+        # type: () -> Tuple[SimpleTrack, ...]
+        if self._all_simple_tracks is None:
+            self._all_simple_tracks = tuple(
+                self._track_mapper_service._live_track_id_to_simple_track.values()
+            )
+        return self._all_simple_tracks
+
+    @property
+    def simple_tracks(self):
+        # type: () -> Tuple[SimpleTrack, ...]
+        """Without return and master tracks"""
+        if self._simple_tracks is None:
+            self._simple_tracks = tuple(t for t in self.all_simple_tracks if t.IS_ACTIVE)
+        return self._simple_tracks
+
+    @property
+    def abstract_tracks(self):
+        # type: () -> Tuple[AbstractTrack, ...]
+        if self._abstract_tracks is None:
+            self._abstract_tracks = tuple(self._track_component.abstract_tracks)
+        return self._abstract_tracks
+
+    @property
+    def scenes(self):
+        # type: () -> Tuple[Scene, ...]
+        if self._scenes is None:
+            self._scenes = tuple(self._scene_service.scenes)
+        return self._scenes
+
+    def get_simple_tracks(self, track_cls):
+        # type: (Type) -> Tuple[SimpleTrack, ...]
+        if track_cls not in self._simple_tracks_by_class:
+            self._simple_tracks_by_class[track_cls] = tuple(
+                t for t in self.simple_tracks if isinstance(t, track_cls)
+            )
+        return self._simple_tracks_by_class[track_cls]
+
+    def get_abstract_tracks(self, track_cls):
+        # type: (Type) -> Tuple[AbstractTrack, ...]
+        if track_cls not in self._abstract_tracks_by_class:
+            self._abstract_tracks_by_class[track_cls] = tuple(
+                t for t in self.abstract_tracks if isinstance(t, track_cls)
+            )
+        return self._abstract_tracks_by_class[track_cls]
@@ -1,5 +1,6 @@
-from typing import Any, Optional
+from typing import Any, Optional, List
 
+from protocol0.shared.Config import Config
 from protocol0.shared.logging.LogLevelEnum import LogLevelEnum
 from protocol0.shared.logging.LoggerServiceInterface import LoggerServiceInterface
 
@@ -48,6 +49,10 @@ class Logger(object):
     @classmethod
     def _log(cls, message="", level=LogLevelEnum.INFO, debug=False):
         # type: (Any, LogLevelEnum, bool) -> None
+        # before any formatting
+        if level.value < Config.LOG_LEVEL.value:
+            return None
+
         if not message:
             debug = False
 
@@ -57,6 +62,22 @@ class Logger(object):
             level=level,
         )
 
+    @classmethod
+    def flush(cls):
+        # type: () -> None
+        """Writes the buffered records"""
+        cls._INSTANCE._logger.flush()
+
+    @classmethod
+    def get_last_records(cls, count):
+        # type: (int) -> List[str]
+        return cls._INSTANCE._logger.get_last_records(count)
+
+    @classmethod
+    def dump_last_records(cls, count):
+        # type: (int) -> None
+        cls._INSTANCE._logger.dump_last_records(count)
+
     @classmethod
     def clear(cls):
         # type: () -> None
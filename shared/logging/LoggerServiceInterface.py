@@ -1,4 +1,4 @@
-from typing import Any, Optional
+from typing import Any, Optional, List
 
 from protocol0.shared.logging.LogLevelEnum import LogLevelEnum
 
@@ -7,3 +7,15 @@ class LoggerServiceInterface(object):
     def log(self, message, debug=True, level=None):
         # type: (Any, bool, Optional[LogLevelEnum]) -> None
         pass
+
+    def flush(self):
+        # type: () -> None
+        pass
+
+    def get_last_records(self, count):
+        # type: (int) -> List[str]
+        return []
+
+    def dump_last_records(self, count):
+        # type: (int) -> None
+        pass
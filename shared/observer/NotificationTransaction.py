@@ -0,0 +1,140 @@
+import collections
+from functools import wraps
+
+from typing import Any, Callable, Dict, List, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from protocol0.shared.observer.Observable import Observable
+    from protocol0.shared.observer.Observer import Observer
+
+
+class NotificationStats(object):
+    """Notifications of an (observable class, observer class) pair"""
+
+    def __init__(self):
+        # type: () -> None
+        self.notifications = 0
+        self.deliveries = 0
+
+    def __repr__(self):
+        # type: () -> str
+        return "notifications: %s, deliveries: %s, coalesced: %s" % (
+            self.notifications,
+            self.deliveries,
+            self.coalesced,
+        )
+
+    @property
+    def coalesced(self):
+        # type: () -> int
+        return self.notifications - self.deliveries
+
+
+class NotificationTransaction(object):
+    """
+    While a transaction is open, Observable.notify_observers queues the
+    (observable, observer) pairs. Each pair is notified once when the outermost
+    transaction commits : the notifications made by the observers during the commit
+    are queued as well, so a cascade reaches each observer once per observable.
+
+    Usable as a context manager or as a decorator :
+        with NotificationTransaction():
+        @NotificationTransaction()
+
+    NB : observers are notified at commit, not when the change happens.
+    Transient state read by the observers needs Observable.notify_observers(immediate=True)
+    """
+
+    # count notifications by (observable class, observer class), also outside transactions
+    _STATS = False
+
+    _DEPTH = 0
+    # (id(observable), id(observer)) -> (observable, observer)
+    _PENDING = collections.OrderedDict()  # type: Dict[Tuple[int, int], Tuple[Observable, Observer]]
+    _stats = {}  # type: Dict[Tuple[str, str], NotificationStats]
+
+    def __enter__(self):
+        # type: () -> None
+        self.begin()
+
+    def __exit__(self, *_):
+        # type: (Any) -> None
+        self.commit()
+
+    def __call__(self, func):
+        # type: (Callable) -> Callable
+        @wraps(func)
+        def decorate(*a, **k):
+            # type: (Any, Any) -> Any
+            with NotificationTransaction():
+                return func(*a, **k)
+
+        return decorate
+
+    @classmethod
+    def begin(cls):
+        # type: () -> None
+        cls._DEPTH += 1
+
+    @classmethod
+    def commit(cls):
+        # type: () -> None
+        """Only the outermost transaction notifies the observers"""
+        if cls._DEPTH == 0:
+            return
+
+        if cls._DEPTH > 1:
+            cls._DEPTH -= 1
+            return
+
+        # the transaction stays open while notifying : the observer notifications are queued
+        try:
+            while cls._PENDING:
+                _, (observable, observer) = cls._PENDING.popitem(last=False)
+                if cls._STATS:
+                    cls._get_stats(observable, observer).deliveries += 1
+                observer.update(observable)
+        finally:
+            cls._DEPTH = 0
+            cls._PENDING.clear()
+
+    @classmethod
+    def notify(cls, observable, observers, immediate=False):
+        # type: (Observable, List[Observer], bool) -> None
+        """Called by Observable.notify_observers when a transaction is open or stats are on"""
+        if cls._DEPTH == 0 or immediate:
+            for observer in observers:
+                if cls._STATS:
+                    stats = cls._get_stats(observable, observer)
+                    stats.notifications += 1
+                    stats.deliveries += 1
+                observer.update(observable)
+            return
+
+        for observer in observers:
+            if cls._STATS:
+                cls._get_stats(observable, observer).notifications += 1
+            cls._PENDING[(id(observable), id(observer))] = (observable, observer)
+
+    @classmethod
+    def _get_stats(cls, observable, observer):
+        # type: (Observable, Observer) -> NotificationStats
+        key = (observable.__class__.__name__, observer.__class__.__name__)
+        if key not in cls._stats:
+            cls._stats[key] = NotificationStats()
+        return cls._stats[key]
+
+    @classmethod
+    def stats(cls):
+        # type: () -> Dict[str, NotificationStats]
+        return {
+            "%s -> %s" % (observable_name, observer_name): stats
+            for (observable_name, observer_name), stats in cls._stats.items()
+        }
+
+    @classmethod
+    def reset(cls):
+        # type: () -> None
+        cls._DEPTH = 0
+        cls._PENDING.clear()
+        cls._stats = {}
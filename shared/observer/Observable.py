@@ -1,5 +1,6 @@
 from typing import List
 
+from protocol0.shared.observer.NotificationTransaction import NotificationTransaction
 from protocol0.shared.observer.Observer import Observer
 
 
@@ -18,7 +19,12 @@ class Observable(object):
         if observer in self._observers:
             self._observers.remove(observer)
 
-    def notify_observers(self):
-        # type: () -> None
+    def notify_observers(self, immediate=False):
+        # type: (bool) -> None
+        """immediate : bypasses an open NotificationTransaction (e.g. for a transient flag)"""
+        if NotificationTransaction._DEPTH or NotificationTransaction._STATS:
+            NotificationTransaction.notify(self, self._observers, immediate)
+            return
+
         for observer in self._observers:
             observer.update(self)
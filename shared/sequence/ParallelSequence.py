@@ -3,7 +3,6 @@ from collections import deque
 from _Framework.SubjectSlot import SlotManager
 from typing import List, Callable
 
-from protocol0.domain.shared.utils.func import get_callable_repr
 from protocol0.shared.observer.Observable import Observable
 from protocol0.shared.sequence.SequenceState import SequenceState
 from protocol0.shared.sequence.SequenceStep import SequenceStep
@@ -16,7 +15,7 @@ class ParallelSequence(SlotManager, Observable):
     def __init__(self, funcs):
         # type: (List[Callable]) -> None
         super(ParallelSequence, self).__init__()
-        self._steps = deque([SequenceStep(func, get_callable_repr(func), True) for func in funcs])
+        self._steps = deque([SequenceStep(func, None, True) for func in funcs])
         self._steps_terminated_count = 0
         self.state = SequenceState()
         self.res = None
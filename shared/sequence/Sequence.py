@@ -1,7 +1,8 @@
+import sys
 from collections import deque
 from functools import partial
 
-from typing import Deque, Iterable, Union, Any, Optional, List, Type, Callable, cast
+from typing import Deque, Iterable, Union, Any, Optional, List, Type, Callable, cast, Tuple
 
 from protocol0.domain.lom.song.SongStartedEvent import SongStartedEvent
 from protocol0.domain.lom.song.SongStoppedEvent import SongStoppedEvent
@@ -11,12 +12,13 @@ from protocol0.domain.shared.backend.NotificationColorEnum import NotificationCo
 from protocol0.domain.shared.event.DomainEventBus import DomainEventBus
 from protocol0.domain.shared.event.HasEmitter import HasEmitter
 from protocol0.domain.shared.scheduler.Scheduler import Scheduler
-from protocol0.domain.shared.utils.debug import get_frame_info
-from protocol0.domain.shared.utils.func import nop, get_callable_repr
+from protocol0.domain.shared.utils.debug import get_class_name_from_filename, get_relative_filename
+from protocol0.domain.shared.utils.func import nop
 from protocol0.shared.Song import Song
 from protocol0.shared.logging.Logger import Logger
 from protocol0.shared.observer.Observable import Observable
 from protocol0.shared.sequence.ParallelSequence import ParallelSequence
+from protocol0.shared.sequence.SequenceRegistry import SequenceRegistry
 from protocol0.shared.sequence.SequenceState import SequenceState
 from protocol0.shared.sequence.SequenceStep import SequenceStep
 from protocol0.shared.sequence.SequenceTransition import SequenceStateEnum
@@ -30,7 +32,7 @@ class Sequence(Observable):
     Encapsulates and composes all asynchronous tasks done in the script.
     """
 
-    RUNNING_SEQUENCES = []  # type: List[Sequence]
+    RUNNING_SEQUENCES = SequenceRegistry()
     _DEBUG = False
     _STEP_TIMEOUT = 50  # seconds
 
@@ -42,18 +44,37 @@ class Sequence(Observable):
         self._current_step = None  # type: Optional[SequenceStep]
         self.state = SequenceState()
         self.res = None  # type: Optional[Any]
-        frame_info = get_frame_info(2)
-        if name:
-            self.name = name
-        elif frame_info:
-            self.name = "[seq %s.%s]" % (frame_info.class_name, frame_info.method_name)
-        else:
-            self.name = "Unknown"
+        # synchronous steps are executed in a loop instead of recursively
+        self._is_executing_steps = False
+        self._has_next_step = False
+
+        self._name = name
+        # the name is resolved lazily from the caller code (no source file access)
+        self._caller = None  # type: Optional[Tuple[str, str]]
+        if not name:
+            try:
+                caller_code = sys._getframe(1).f_code
+                self._caller = (caller_code.co_filename, caller_code.co_name)
+            except ValueError:
+                pass
 
     def __repr__(self, **k):
         # type: (Any) -> str
         return self.name
 
+    @property
+    def name(self):
+        # type: () -> str
+        if not self._name:
+            if self._caller:
+                filename, method_name = self._caller
+                class_name = get_class_name_from_filename(get_relative_filename(filename))
+                self._name = "[seq %s.%s]" % (class_name, method_name)
+            else:
+                self._name = "Unknown"
+
+        return self._name
+
     def add(self, func=nop, name=None, notify_terminated=True):
         # type: (Union[Iterable, Callable, object], str, bool) -> Sequence
         """callback can be a callable or a list of callable (will execute in parallel)"""
@@ -65,9 +86,8 @@ class Sequence(Observable):
 
         func = cast(Callable, func)
 
-        step_name = "%s : step %s" % (self.name, name or get_callable_repr(func))
-
-        step = SequenceStep(func, step_name, notify_terminated)
+        # the step name is resolved lazily
+        step = SequenceStep(func, name, notify_terminated, self)
         self._steps.append(step)
 
         return self
@@ -75,32 +95,43 @@ class Sequence(Observable):
     def done(self):
         # type: () -> Sequence
         self.state.change_to(SequenceStateEnum.STARTED)
-        self.RUNNING_SEQUENCES.append(self)
+        self.RUNNING_SEQUENCES.add(self)
         self._execute_next_step()
         return self
 
     def _execute_next_step(self):
         # type: () -> None
-        if not self.state.started:
+        if self._is_executing_steps:
+            # synchronous termination of the current step : continue in the loop below
+            self._has_next_step = True
             return
-        if len(self._steps):
-            self._current_step = self._steps.popleft()
-            if self._DEBUG:
-                Logger.info("%s : Executing %s" % (self, self._current_step))
-            self._current_step.register_observer(self)
-            self._current_step.start()
-        else:
-            self._terminate()
+
+        self._is_executing_steps = True
+        self._has_next_step = True
+        try:
+            while self._has_next_step and self.state.started:
+                self._has_next_step = False
+                if len(self._steps):
+                    self._current_step = self._steps.popleft()
+                    if self._DEBUG:
+                        Logger.info("%s : Executing %s" % (self, self._current_step))
+                    self._current_step.register_observer(self)
+                    self._current_step.start()
+                else:
+                    self._terminate()
+        finally:
+            self._is_executing_steps = False
 
     @classmethod
     def reset(cls, name=None):
         # type: (Optional[str]) -> None
-        for seq in reversed(Sequence.RUNNING_SEQUENCES):
-            if name is not None and seq.name != name:
-                continue
-
+        """name : cancels only the sequences created with this explicit name"""
+        for seq in Sequence.RUNNING_SEQUENCES.get_sequences(name):
             seq._cancel()
-        Sequence.RUNNING_SEQUENCES = []
+            Sequence.RUNNING_SEQUENCES.remove(seq)
+
+        if name is None:
+            Sequence.RUNNING_SEQUENCES.clear()
 
     def update(self, observable):
         # type: (Observable) -> None
@@ -322,7 +353,4 @@ class Sequence(Observable):
     def disconnect(self):
         # type: () -> None
         self._current_step = None
-        try:
-            self.RUNNING_SEQUENCES.remove(self)
-        except ValueError:
-            pass
+        self.RUNNING_SEQUENCES.remove(self)
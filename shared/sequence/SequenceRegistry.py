@@ -0,0 +1,69 @@
+import time
+from collections import OrderedDict
+
+from typing import Dict, List, TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from protocol0.shared.sequence.Sequence import Sequence
+
+
+class SequenceRegistry(object):
+    """
+    Running sequences ordered by start, keyed by identity.
+    Explicitly named sequences are also indexed by name
+    so that add, remove and cancel by name are O(1)
+    """
+
+    def __init__(self):
+        # type: () -> None
+        # sequence -> started at
+        self._sequences = OrderedDict()  # type: OrderedDict[Sequence, float]
+        self._sequences_by_name = {}  # type: Dict[str, OrderedDict[Sequence, None]]
+
+    def __len__(self):
+        # type: () -> int
+        return len(self._sequences)
+
+    def __contains__(self, seq):
+        # type: (object) -> bool
+        return seq in self._sequences
+
+    def add(self, seq):
+        # type: (Sequence) -> None
+        self._sequences[seq] = time.time()
+        # auto generated names are not resolved here
+        if seq._name:
+            self._sequences_by_name.setdefault(seq._name, OrderedDict())[seq] = None
+
+    def remove(self, seq):
+        # type: (Sequence) -> None
+        if self._sequences.pop(seq, None) is None:
+            return
+
+        if seq._name and seq._name in self._sequences_by_name:
+            named_sequences = self._sequences_by_name[seq._name]
+            named_sequences.pop(seq, None)
+            if not named_sequences:
+                del self._sequences_by_name[seq._name]
+
+    def get_sequences(self, name=None):
+        # type: (Optional[str]) -> List[Sequence]
+        """most recent first"""
+        if name is None:
+            return list(reversed(self._sequences))
+        else:
+            return list(reversed(self._sequences_by_name.get(name, ())))
+
+    def clear(self):
+        # type: () -> None
+        self._sequences.clear()
+        self._sequences_by_name.clear()
+
+    @property
+    def oldest_sequence_age(self):
+        # type: () -> float
+        """in seconds"""
+        for started_at in self._sequences.values():
+            return time.time() - started_at
+
+        return 0
@@ -2,18 +2,24 @@ from protocol0.domain.shared.errors.Protocol0Error import Protocol0Error
 from protocol0.shared.sequence.SequenceTransition import SequenceTransition, SequenceStateEnum
 
 
+def _create_un_started_state():
+    # type: () -> SequenceTransition
+    terminated_state = SequenceTransition(SequenceStateEnum.TERMINATED, [])
+    cancelled_state = SequenceTransition(SequenceStateEnum.CANCELLED, [])
+    errored_state = SequenceTransition(SequenceStateEnum.ERRORED, [])
+    started_state = SequenceTransition(
+        SequenceStateEnum.STARTED, [terminated_state, cancelled_state, errored_state]
+    )
+    return SequenceTransition(SequenceStateEnum.UN_STARTED, [started_state])
+
+
 class SequenceState(object):
+    # the transition graph is immutable and shared by all states
+    _UN_STARTED_STATE = _create_un_started_state()
+
     def __init__(self):
         # type: () -> None
-        terminated_state = SequenceTransition(SequenceStateEnum.TERMINATED, [])
-        cancelled_state = SequenceTransition(SequenceStateEnum.CANCELLED, [])
-        errored_state = SequenceTransition(SequenceStateEnum.ERRORED, [])
-        started_state = SequenceTransition(
-            SequenceStateEnum.STARTED, [terminated_state, cancelled_state, errored_state]
-        )
-        un_started_state = SequenceTransition(SequenceStateEnum.UN_STARTED, [started_state])
-
-        self.state = un_started_state
+        self.state = self._UN_STARTED_STATE
         self.res = None
 
     def change_to(self, enum):
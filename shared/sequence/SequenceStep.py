@@ -1,6 +1,6 @@
 import traceback
 
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Optional, TYPE_CHECKING
 
 from protocol0.domain.shared.errors.error_handler import handle_error
 from protocol0.domain.shared.utils.func import get_callable_repr
@@ -10,12 +10,16 @@ from protocol0.shared.sequence.HasSequenceState import HasSequenceState
 from protocol0.shared.sequence.SequenceState import SequenceState
 from protocol0.shared.sequence.SequenceTransition import SequenceStateEnum
 
+if TYPE_CHECKING:
+    from protocol0.shared.sequence.Sequence import Sequence
+
 
 class SequenceStep(Observable):
-    def __init__(self, func, name, notify_terminated):
-        # type: (Callable, str, bool) -> None
+    def __init__(self, func, name, notify_terminated, sequence=None):
+        # type: (Callable, Optional[str], bool, Optional[Sequence]) -> None
         super(SequenceStep, self).__init__()
         self._name = name
+        self._sequence = sequence
         self._callable = func
         self.state = SequenceState()
         self._notify_terminated = notify_terminated
@@ -23,7 +27,12 @@ class SequenceStep(Observable):
 
     def __repr__(self, **k):
         # type: (Any) -> str
-        return self._name
+        """resolved lazily as it is only needed for logging"""
+        step_name = self._name or get_callable_repr(self._callable)
+        if self._sequence is None:
+            return step_name
+        else:
+            return "%s : step %s" % (self._sequence.name, step_name)
 
     def update(self, observable):
         # type: (Observable) -> None
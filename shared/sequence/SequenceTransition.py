@@ -1,6 +1,5 @@
-from typing import Optional, List
+from typing import Optional, List, Dict
 
-from protocol0.domain.shared.utils.list import find_if
 from protocol0.shared.AbstractEnum import AbstractEnum
 
 
@@ -16,7 +15,9 @@ class SequenceTransition(object):
     def __init__(self, enum, allowed_transitions):
         # type: (SequenceStateEnum, List[SequenceTransition]) -> None
         self.enum = enum
-        self._allowed_transitions = allowed_transitions
+        self._allowed_transitions = {
+            transition.enum: transition for transition in allowed_transitions
+        }  # type: Dict[SequenceStateEnum, SequenceTransition]
 
     def __repr__(self):
         # type: () -> str
@@ -24,4 +25,4 @@ class SequenceTransition(object):
 
     def get_transition(self, new_state_enum):
         # type: (SequenceStateEnum) -> Optional["SequenceTransition"]
-        return find_if(lambda s: s.enum == new_state_enum, self._allowed_transitions)
+        return self._allowed_transitions.get(new_state_enum)
@@ -0,0 +1,37 @@
+from protocol0.application.CommandBus import CommandBus
+from protocol0.application.command.GetSetStateCommand import GetSetStateCommand
+from protocol0.application.command.LogCommandLatencyCommand import LogCommandLatencyCommand
+from protocol0.application.command.SerializableCommand import SerializableCommand
+from protocol0.application.command.ShowMessageCommand import ShowMessageCommand
+from protocol0.domain.lom.set.AbletonSet import AbletonSet
+from protocol0.shared.logging.Logger import Logger
+from protocol0.tests.domain.fixtures.p0 import make_protocol0
+
+
+def test_command_bus_dispatch(monkeypatch):
+    make_protocol0()
+    notified = []
+    monkeypatch.setattr(AbletonSet, "notify", lambda _, force: notified.append(force))
+
+    CommandBus.dispatch(GetSetStateCommand())
+    handler = CommandBus._INSTANCE._handlers[GetSetStateCommand]
+    for _ in range(4):
+        CommandBus.dispatch(GetSetStateCommand())
+
+    assert notified == [True] * 5
+    assert CommandBus._INSTANCE._handlers[GetSetStateCommand] is handler
+    assert CommandBus.latencies()[GetSetStateCommand].count == 5
+
+    logs = []
+    monkeypatch.setattr(Logger, "info", classmethod(lambda _, message: logs.append(message)))
+    CommandBus.dispatch(LogCommandLatencyCommand())
+    assert logs[1].startswith("GetSetStateCommand: count: 5, p50: ")
+
+
+def test_command_un_serialize():
+    make_protocol0()
+    command = SerializableCommand.un_serialize(ShowMessageCommand("message").serialize())
+
+    assert isinstance(command, ShowMessageCommand)
+    assert command.message == "message"
+
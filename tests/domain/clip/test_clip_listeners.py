@@ -0,0 +1,64 @@
+from typing import cast
+
+from protocol0.domain.lom.clip.ClipConfig import ClipConfig
+from protocol0.domain.lom.clip.MidiClip import MidiClip
+from protocol0.shared.Config import Config
+from protocol0.shared.Song import Song
+from protocol0.tests.domain.fixtures.clip_slot import AbletonClipSlot
+from protocol0.tests.domain.fixtures.p0 import make_protocol0
+
+
+def _make_live_clip():
+    make_protocol0()
+    live_clip_slot = cast(AbletonClipSlot, Song.selected_track().clip_slots[0]._clip_slot)
+    live_clip_slot.add_clip()
+    return live_clip_slot.clip
+
+
+def test_clip_listeners_eager():
+    clip = MidiClip(_make_live_clip(), 0, ClipConfig(0))
+
+    assert clip.listeners_attached
+    assert clip.listener_count == clip.max_listener_count == 9
+
+
+def test_clip_listeners_lazy(monkeypatch):
+    monkeypatch.setattr(Config, "LAZY_CLIP_LISTENERS", True)
+    live_clip = _make_live_clip()
+    clip = MidiClip(live_clip, 0, ClipConfig(0))
+
+    assert not clip.listeners_attached
+    assert clip.listener_count == 0
+
+    # the base name cache needs the name listener
+    assert clip.clip_name.base_name == "test"
+    assert clip.listener_count == 5
+
+    clip.select()
+    assert clip.listener_count == 9
+    clip.attach_listeners()
+    assert clip.listener_count == 9
+
+    # a playing clip is attached right away
+    live_clip.is_playing = True
+    assert MidiClip(live_clip, 0, ClipConfig(0)).listener_count == 9
+
+
+def test_clip_listeners_lazy_scene_length(monkeypatch):
+    monkeypatch.setattr(Config, "LAZY_CLIP_LISTENERS", True)
+    live_clip = _make_live_clip()
+    clip_slot = Song.selected_track().clip_slots[0]
+    live_clip.length = live_clip.loop_end = 8
+    # a clip of the loaded set
+    clip_slot._map_clip()
+    clip_slot.notify_observers()
+    scene_length = Song.scenes()[0]._scene_length
+    assert clip_slot.clip.listener_count == 0
+
+    # the cache needs the loop listeners
+    assert scene_length.length == 8
+    assert clip_slot.clip.listener_count == 3
+
+    live_clip.length = live_clip.loop_end = 4
+    clip_slot.clip.loop._loop_end_listener()
+    assert scene_length.length == 4
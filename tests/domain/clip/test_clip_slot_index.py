@@ -0,0 +1,34 @@
+from typing import cast
+
+from protocol0.domain.audit.LOMAnalyzerService import LOMAnalyzerService
+from protocol0.domain.lom.clip_slot.ClipSlotIndex import ClipSlotIndex
+from protocol0.shared.Song import Song
+from protocol0.tests.domain.fixtures.clip_slot import AbletonClipSlot
+from protocol0.tests.domain.fixtures.large_set import make_large_set
+from protocol0.tests.domain.fixtures.p0 import make_protocol0
+
+
+def test_clip_slot_index():
+    make_protocol0()
+    make_large_set(group_track_count=2, scene_count=4)
+    LOMAnalyzerService().check_clip_slot_index_consistency()
+
+    selected_track = Song.selected_track()
+    clip_slot = selected_track.clip_slots[2]
+    live_clip_slot = cast(AbletonClipSlot, clip_slot._clip_slot)
+    Song.view().highlighted_clip_slot = live_clip_slot
+    assert Song.selected_clip_slot() is clip_slot
+
+    live_clip_slot.add_clip()
+    clip_slot._has_clip_listener()
+    assert ClipSlotIndex.get_clip(live_clip_slot.clip) is clip_slot.clip
+    assert Song.selected_clip() is clip_slot.clip
+    LOMAnalyzerService().check_clip_slot_index_consistency()
+
+    # deleted track
+    live_song = Song._live_song()
+    live_track = live_song.tracks[-1]
+    live_song.tracks.remove(live_track)
+    Song._INSTANCE._track_mapper_service.tracks_listener()
+    assert ClipSlotIndex.get_clip_slot(live_track.clip_slots[0]) is None
+    LOMAnalyzerService().check_clip_slot_index_consistency()
@@ -0,0 +1,154 @@
+from collections import namedtuple
+
+from typing import cast
+
+from protocol0.domain.lom.clip.ClipConfig import ClipConfig
+from protocol0.domain.lom.clip.MidiClip import MidiClip
+from protocol0.domain.lom.device.Device import Device
+from protocol0.domain.lom.device_parameter.DeviceParameter import DeviceParameter
+from protocol0.domain.lom.note.Note import Note
+from protocol0.domain.lom.note.NoteBuffer import NoteBuffer
+from protocol0.domain.lom.note.NoteView import NoteView
+from protocol0.shared.Song import Song
+from protocol0.tests.domain.fixtures.clip_slot import AbletonClipSlot
+from protocol0.tests.domain.fixtures.device import AbletonDevice
+from protocol0.tests.domain.fixtures.device_parameter import AbletonDeviceParameter
+from protocol0.tests.domain.fixtures.p0 import make_protocol0
+
+MidiNote = namedtuple("MidiNote", ["pitch", "start_time", "duration", "velocity"])
+
+
+def _make_midi_clip(monkeypatch, midi_notes):
+    make_protocol0()
+    clip_slot = Song.selected_track().clip_slots[0]
+    live_clip_slot = cast(AbletonClipSlot, clip_slot._clip_slot)
+    live_clip_slot.add_clip()
+    live_clip = live_clip_slot.clip
+    calls = []
+
+    def get_notes_extended(*_):
+        calls.append(1)
+        return tuple(midi_notes)
+
+    monkeypatch.setattr(live_clip, "get_notes_extended", get_notes_extended, raising=False)
+
+    return MidiClip(live_clip, 0, ClipConfig(0)), calls
+
+
+def test_midi_clip_notes_cache(monkeypatch):
+    midi_notes = [MidiNote(60, 1, 1, 100), MidiNote(62, 0, 1, 100)]
+    clip, calls = _make_midi_clip(monkeypatch, midi_notes)
+
+    notes = clip.get_notes()
+    assert [note.pitch for note in notes] == [62, 60]
+    assert clip.get_notes() == notes
+    assert len(calls) == 1
+
+    # clip modification
+    midi_notes.append(MidiNote(64, 2, 1, 100))
+    clip._notes_listener()
+    assert len(clip.get_notes()) == 3
+    assert len(calls) == 2
+
+    clip.loop._loop_end_listener()
+    clip.get_notes()
+    assert len(calls) == 3
+
+
+def test_midi_clip_notes_from_cache(monkeypatch):
+    midi_notes = [MidiNote(60, 0, 1, 100)]
+    clip, calls = _make_midi_clip(monkeypatch, midi_notes)
+
+    note = Note(pitch=60, start=0.000001, duration=1)
+    note.velocity = 99.5
+    clip.set_notes([note])
+
+    # the set note is returned, with its float velocity
+    assert len(calls) == 0
+    clip_note = clip.get_notes()[0]
+    assert clip_note == note
+    assert clip_note.velocity == 99.5
+    assert len(calls) == 1
+
+    # a copy : modifying it doesn't change the cached notes
+    assert clip_note is not note
+    clip_note.pitch = 72
+    clip_note.velocity = 10
+    assert clip.get_notes()[0].pitch == 60
+    assert clip.get_notes()[0].velocity == 99.5
+    assert note.pitch == 60
+
+
+
+def test_midi_clip_notes_from_note_buffer(monkeypatch):
+    midi_notes = [MidiNote(60, 0, 1, 100)]
+    clip, _ = _make_midi_clip(monkeypatch, midi_notes)
+
+    note_buffer = NoteBuffer.from_notes([Note(pitch=60, start=0, duration=1)])
+    note_buffer.velocities[0] = 99.5
+    clip.set_notes(note_buffer)
+
+    # the cached notes don't follow the buffer
+    note_buffer.velocities[0] = 10
+    note_buffer.transpose(12)
+    clip_note = clip.get_notes()[0]
+    assert not isinstance(clip_note, NoteView)
+    assert clip_note.pitch == 60
+    assert clip_note.velocity == 99.5
+
+class AutomationEnvelope(object):
+    def __init__(self):
+        self.value_count = 0
+
+    def value_at_time(self, time):
+        self.value_count += 1
+        return time
+
+
+def test_midi_clip_hash(monkeypatch):
+    midi_notes = [MidiNote(60, 0, 1, 100)]
+    clip, calls = _make_midi_clip(monkeypatch, midi_notes)
+    envelope = AutomationEnvelope()
+    live_parameter = AbletonDeviceParameter("A-Cutoff")
+    monkeypatch.setattr(
+        clip._clip,
+        "automation_envelope",
+        lambda p: envelope if p is live_parameter else None,
+        raising=False,
+    )
+    device_parameters = [
+        DeviceParameter(live_parameter),
+        DeviceParameter(AbletonDeviceParameter("Res")),
+    ]
+
+    clip_hash = clip.get_hash(device_parameters)
+    assert clip.get_hash(device_parameters) == clip_hash
+    # notes fetched once, fixed cost automation footprint
+    assert len(calls) == 1
+    assert envelope.value_count == 2 * 18
+
+    midi_notes.append(MidiNote(62, 1, 1, 100))
+    clip._notes_listener()
+    assert clip.get_hash(device_parameters) != clip_hash
+    assert len(calls) == 2
+
+
+def test_midi_clip_automated_parameters(monkeypatch):
+    clip, _ = _make_midi_clip(monkeypatch, [])
+    live_device = AbletonDevice("Serum_x64")
+    live_device.parameters += [AbletonDeviceParameter("#%03d" % i) for i in range(1000)]
+    live_device.parameters.append(AbletonDeviceParameter("B-Cutoff"))
+    automated = live_device.parameters[10]
+    monkeypatch.setattr(
+        clip._clip,
+        "automation_envelope",
+        lambda p: AutomationEnvelope() if p in (automated, live_device.parameters[-1]) else None,
+        raising=False,
+    )
+    device = Device(live_device)  # noqa
+
+    # only the automated parameter is wrapped, the rev2 b layer is ignored
+    parameters = clip.automation.get_automated_parameters(device.parameters)
+    assert [p.name for p in parameters] == ["#009"]
+    assert device.parameters.wrapped_count == 1
+    assert clip.automation.get_automated_parameters(device.parameters)[0] is parameters[0]
@@ -0,0 +1,89 @@
+import sys
+
+import pytest
+
+from protocol0.domain.lom.device.Device import Device
+from protocol0.domain.lom.device.DeviceEnum import DeviceEnum
+from protocol0.domain.lom.device_parameter.ChainedDeviceParameters import ChainedDeviceParameters
+from protocol0.domain.lom.device_parameter.DeviceParameter import DeviceParameter
+from protocol0.domain.lom.device_parameter.DeviceParameterEnum import DeviceParameterEnum
+from protocol0.domain.shared.errors.Protocol0Error import Protocol0Error
+from protocol0.tests.domain.fixtures.device import AbletonDevice
+from protocol0.tests.domain.fixtures.device_parameter import AbletonDeviceParameter
+
+
+def test_enum_from_value():
+    assert DeviceEnum.from_value("Kontakt 7") == DeviceEnum.KONTAKT
+    assert DeviceEnum.get_from_value("unknown device") is None
+    with pytest.raises(Protocol0Error):
+        DeviceEnum.from_value("unknown device")
+
+    assert DeviceParameterEnum.from_name("Utility", "Gain") == DeviceParameterEnum.UTILITY_GAIN
+    assert DeviceParameterEnum.from_name("Kontakt 7", "#001") is None
+    assert DeviceParameterEnum.from_name("Kontakt 7", "#001") is None
+
+
+def test_device_parameters():
+    live_device = AbletonDevice("Utility")
+    live_device.parameters.append(AbletonDeviceParameter("Gain"))
+    device = Device(live_device)  # noqa
+
+    assert device.enum == DeviceEnum.UTILITY
+    assert device.parameters.wrapped_count == 0
+
+    gain = device.get_parameter_by_name(DeviceParameterEnum.UTILITY_GAIN)
+    assert gain.name == "Gain"
+    assert device.parameters.wrapped_count == 1
+    assert device.get_parameter_by_name("Gain") is gain
+    assert device.get_parameter_by_name("unknown") is None
+
+    assert len(device.parameters) == 2
+    assert device.parameters[-1] is gain
+    assert [p.name for p in device.parameters] == ["Device On", "Gain"]
+    assert device.parameters.wrapped_count == 2
+
+    # renamed plugin parameter
+    live_device.parameters[1].name = "Volume"
+    assert device.get_parameter_by_name("Volume") is gain
+    assert device.get_parameter_by_name("Gain") is None
+
+
+def test_device_parameters_live_ptr():
+    live_device = AbletonDevice("Utility")
+    live_device.parameters.append(AbletonDeviceParameter("Gain"))
+    device = Device(live_device)  # noqa
+    mixer_parameters = [DeviceParameter(AbletonDeviceParameter("Volume"))]
+    parameters = ChainedDeviceParameters([device.parameters, mixer_parameters])
+
+    gain = parameters.get_by_live_ptr(live_device.parameters[1]._live_ptr)
+    assert gain is device.parameters[1]
+    assert device.parameters.wrapped_count == 1
+    assert parameters.get_by_live_ptr(mixer_parameters[0]._device_parameter._live_ptr) is (
+        mixer_parameters[0]
+    )
+    assert parameters.get_by_live_ptr(id(device)) is None
+
+    assert len(parameters) == 3
+    assert parameters[-1] is mixer_parameters[0]
+    assert gain in parameters
+    assert device.parameters.wrapped_count == 1
+    assert DeviceParameter(live_device.parameters[0]) not in parameters
+    assert [p.name for p in parameters] == ["Device On", "Gain", "Volume"]
+
+
+def test_device_tree_parameters():
+    """4 plugins of 1000 parameters each"""
+    live_devices = []
+    for device_name in ("Kontakt 7", "Serum_x64", "Utility", "Unknown plugin"):
+        live_device = AbletonDevice(device_name)
+        live_device.parameters += [AbletonDeviceParameter("#%03d" % i) for i in range(1000)]
+        live_devices.append(live_device)
+
+    devices = [Device(live_device) for live_device in live_devices]  # noqa
+    assert all(device.parameters.wrapped_count == 0 for device in devices)
+
+    # only the looked up parameter is wrapped
+    for device in devices:
+        assert device.get_parameter_by_name(DeviceParameterEnum.DEVICE_ON) is not None
+        assert device.parameters.wrapped_count == 1
+        assert device.parameters.memory_size < sys.getsizeof([None] * 1001) + 1024
@@ -0,0 +1,78 @@
+from _Framework.SubjectSlot import Subject
+
+from protocol0.domain.lom.device.Device import Device
+from protocol0.domain.lom.device.DeviceEnum import DeviceEnum
+from protocol0.domain.lom.device.DeviceIndex import DeviceIndex
+from protocol0.domain.lom.device.RackDevice import RackDevice
+from protocol0.domain.lom.device.SetDeviceIndex import SetDeviceIndex
+from protocol0.shared.Song import Song
+from protocol0.tests.domain.fixtures.device import AbletonDevice
+from protocol0.tests.domain.fixtures.p0 import make_protocol0
+
+
+class AbletonChain(Subject):
+    __subject_events__ = ("devices",)
+
+    def __init__(self, devices):
+        self.name = "chain"
+        self.devices = devices
+
+
+class AbletonRackDevice(AbletonDevice):
+    __subject_events__ = ("parameters", "chains")
+
+    def __init__(self, name, chains):
+        super(AbletonRackDevice, self).__init__(name)
+        self.chains = chains
+        self.can_have_chains = True
+
+
+def _get_class(_, live_device):
+    return RackDevice if isinstance(live_device, AbletonRackDevice) else Device
+
+
+def test_device_index(monkeypatch):
+    monkeypatch.setattr(Device, "_get_class", classmethod(_get_class))
+    live_utility = AbletonDevice(DeviceEnum.UTILITY.value)
+    live_nested_utility = AbletonDevice(DeviceEnum.UTILITY.value)
+    live_rack = AbletonRackDevice(
+        "Audio Effect Rack",
+        [AbletonChain([AbletonDevice("Reverb")]), AbletonChain([live_nested_utility])],
+    )
+
+    devices = [Device.make(live_utility), Device.make(live_rack)]
+    index = DeviceIndex(devices)
+
+    assert [d.name for d in index.all] == ["Utility", "Audio Effect Rack", "Reverb", "Utility"]
+    assert index.get_from_live_device(live_nested_utility) is index.all[3]
+    assert index.get_from_enum(DeviceEnum.UTILITY) == [index.all[0], index.all[3]]
+    assert index.get_from_class(RackDevice) == [devices[1]]
+    assert len(index.get_from_class(Device)) == 4
+    # rack device index, chain index, device index in the chain
+    assert index.get_path(index.all[3]) == (1, 1, 0)
+    assert index.get_path(devices[0]) == (0,)
+    assert DeviceIndex(devices).version > index.version
+
+    # renaming a device doesn't rebuild the index
+    live_nested_utility.name = "Reverb"
+    assert index.get_from_enum(DeviceEnum.UTILITY) == [index.all[0]]
+
+
+def test_set_device_index(monkeypatch):
+    make_protocol0()
+    monkeypatch.setattr(Device, "_get_class", classmethod(_get_class))
+    set_device_index = SetDeviceIndex.get()
+    assert SetDeviceIndex.get() is set_device_index
+
+    track = Song.selected_track()
+    track._track.devices = [AbletonDevice(DeviceEnum.UTILITY.value)]
+    track.devices.build()
+
+    set_device_index = SetDeviceIndex.get()
+    assert SetDeviceIndex.get() is set_device_index
+    assert [device.name for _, device in set_device_index.all] == ["Utility"]
+    assert set_device_index.get_from_enum(DeviceEnum.UTILITY)[0][0] is track
+    assert set_device_index.get_from_name("Utility")[0][0] is track
+
+    track._track.devices[0].name = "Reverb"
+    assert SetDeviceIndex.get().get_from_enum(DeviceEnum.UTILITY) == []
@@ -14,9 +14,11 @@ class AbletonClip(Subject):
         "name",
         "warping",
         "muted",
+        "notes",
     )
 
     def __init__(self):
+        self._live_ptr = id(self)
         self.name = "test"
         self.view = AbletonClipView()
         self.is_recording = False
@@ -7,6 +7,7 @@ class AbletonClipSlot(Subject):
     __subject_events__ = ("has_clip", "is_triggered")
 
     def __init__(self):
+        self._live_ptr = id(self)
         self.clip = None
         self.has_clip = None
         self.has_stop_button = True
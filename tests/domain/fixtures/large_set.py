@@ -0,0 +1,29 @@
+from protocol0.application.CommandBus import CommandBus
+from protocol0.application.command.ReloadScriptCommand import ReloadScriptCommand
+from protocol0.shared.Song import Song
+from protocol0.tests.domain.fixtures.clip_slot import AbletonClipSlot
+from protocol0.tests.domain.fixtures.scene import AbletonScene
+from protocol0.tests.domain.fixtures.simple_track import add_track, TrackType, AbletonTrack
+
+
+def make_large_set(group_track_count=30, sub_track_count=4, scene_count=60):
+    # type: (int, int, int) -> None
+    """Maps a set of group tracks with midi sub tracks (~150 tracks and 60 scenes by default)"""
+    live_song = Song._live_song()
+    live_song.scenes = [AbletonScene() for _ in range(scene_count)]
+    live_song.view.selected_scene = live_song.scenes[0]
+
+    for _ in range(group_track_count):
+        group_track = add_track(track_type=TrackType.GROUP)
+        for _ in range(sub_track_count):
+            add_track(track_type=TrackType.MIDI).group_track = group_track
+
+    for track in live_song.tracks:
+        add_clip_slots(track, scene_count)
+
+    CommandBus.dispatch(ReloadScriptCommand())
+
+
+def add_clip_slots(track, scene_count):
+    # type: (AbletonTrack, int) -> None
+    track.clip_slots = [AbletonClipSlot() for _ in range(scene_count)]
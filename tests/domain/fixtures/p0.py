@@ -3,12 +3,14 @@ from typing import Optional
 from protocol0 import EmptyModule
 from protocol0.application.Protocol0 import Protocol0
 from protocol0.application.control_surface.ActionGroupFactory import ActionGroupFactory
+from protocol0.domain.lom.clip_slot.ClipSlotIndex import ClipSlotIndex
 from protocol0.domain.lom.set.AbletonSet import AbletonSet
 from protocol0.domain.lom.song.SongInitService import SongInitService
 from protocol0.domain.lom.track.group_track.matching_track.MatchingTrackInterface import MatchingTrackInterface
 from protocol0.domain.lom.track.routing.RoutingTrackDescriptor import RoutingTrackDescriptor
 from protocol0.domain.lom.track.simple_track.SimpleTrack import SimpleTrack
 from protocol0.domain.shared.backend.Backend import Backend
+from protocol0.domain.shared.event.DomainEventBus import DomainEventBus
 from protocol0.domain.shared.scheduler.Scheduler import Scheduler
 from protocol0.domain.shared.utils.func import nop
 from protocol0.infra.logging.LoggerService import LoggerService
@@ -22,6 +24,9 @@ from protocol0.tests.infra.scheduler.TickSchedulerTest import TickSchedulerTest
 
 def make_protocol0():
     # type: () -> Protocol0
+    # the previous test instances should not handle the events
+    DomainEventBus.reset()
+    ClipSlotIndex.reset()
     live_song = AbletonSong()
     Protocol0.song = lambda _: live_song
     wait = Scheduler.wait
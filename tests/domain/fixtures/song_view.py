@@ -8,3 +8,4 @@ class AbletonSongView(Subject):
         # type: () -> None
         self.selected_track = None
         self.selected_scene = None
+        self.highlighted_clip_slot = None
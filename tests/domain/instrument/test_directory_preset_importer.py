@@ -0,0 +1,138 @@
+import json
+import os
+
+import pytest
+
+from protocol0.domain.lom.instrument.preset.preset_importer.DirectoryPresetImporter import (
+    DirectoryPresetImporter,
+)
+from protocol0.domain.lom.instrument.preset.preset_importer.PresetDirectoryIndex import (
+    PresetDirectoryIndex,
+)
+from protocol0.shared.Config import Config
+
+
+def _make_tree(root, tree):
+    for name, content in tree.items():
+        path = os.path.join(str(root), name)
+        if isinstance(content, dict):
+            os.mkdir(path)
+            _make_tree(path, content)
+        else:
+            open(path, "w").close()
+
+
+@pytest.fixture
+def library(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "PRESET_INDEX_DIRECTORY", str(tmp_path / "index"))
+    PresetDirectoryIndex.clear_memory_cache()
+    root = tmp_path / "samples"
+    root.mkdir()
+    _make_tree(
+        root,
+        {
+            "kick 1.wav": None,
+            "Kicks": {"kick 2.wav": None, "kick.asd": None, "Old": {"kick 3.aif": None}},
+            "_Ignored": {"ignored.wav": None},
+            "Snares": {"snare.wav": None, "_snare.wav": None},
+        },
+    )
+    return str(root)
+
+
+def _get_presets(path, use_cache=False):
+    return sorted(
+        (preset.category, preset.name)
+        for preset in DirectoryPresetImporter(path).import_presets(use_cache=use_cache)
+    )
+
+
+def test_directory_preset_importer(library):
+    assert _get_presets(library) == [
+        ("kicks", "kick 2"),
+        ("kicks", "kick 3"),
+        ("snares", "snare"),
+        ("unclassified", "kick 1"),
+    ]
+
+    index = PresetDirectoryIndex(library)
+    index.walk()
+    assert index.listed_directory_count == 0
+
+    # only the changed directory is listed again
+    open(os.path.join(library, "Snares", "snare 2.wav"), "w").close()
+    os.utime(os.path.join(library, "Snares"), (0, 1))
+    assert ("snares", "snare 2") in _get_presets(library)
+    index.walk()
+    assert index.listed_directory_count == 0
+
+    os.rename(os.path.join(library, "Kicks"), os.path.join(library, "_Kicks"))
+    assert [category for category, _ in _get_presets(library)] == [
+        "snares",
+        "snares",
+        "unclassified",
+    ]
+
+
+def test_preset_directory_index_persistence(library):
+    index = PresetDirectoryIndex(library)
+    directories = index.walk()
+    assert index.listed_directory_count == 5
+
+    # new session : read from disk
+    PresetDirectoryIndex.clear_memory_cache()
+    index = PresetDirectoryIndex(library)
+    assert index.walk() == directories
+    assert index.listed_directory_count == 0
+
+    def normalize(walk):
+        return sorted((root, sorted(dirs), sorted(files)) for root, dirs, files in walk)
+
+    assert normalize(directories) == normalize(os.walk(library))
+
+
+def test_preset_directory_index_failed_save(library, monkeypatch):
+    PresetDirectoryIndex(library).walk()
+    open(os.path.join(library, "Snares", "snare 2.wav"), "w").close()
+    os.utime(os.path.join(library, "Snares"), (0, 1))
+
+    def dump(*_):
+        raise UnicodeDecodeError("utf-8", b"\xe9", 0, 1, "invalid byte")
+
+    json_dump = json.dump
+    monkeypatch.setattr(json, "dump", dump)
+    PresetDirectoryIndex(library).walk()
+    monkeypatch.setattr(json, "dump", json_dump)
+
+    # the previous index is kept
+    entries = PresetDirectoryIndex(library)._load()
+    assert sorted(entries[os.path.join(library, "Snares")]["files"]) == ["_snare.wav", "snare.wav"]
+
+
+def test_preset_directory_index_large_library(library, monkeypatch):
+    for i in range(50):
+        _make_tree(library, {"category %s" % i: {"sample %s.wav" % j: None for j in range(100)}})
+    PresetDirectoryIndex(library).walk()
+
+    listed_paths = []
+
+    def list_spy(list_directory):
+        def list_directory_spy(path):
+            listed_paths.append(path)
+            return list_directory(path)
+
+        return list_directory_spy
+
+    monkeypatch.setattr(os, "listdir", list_spy(os.listdir))
+    if hasattr(os, "scandir"):
+        monkeypatch.setattr(os, "scandir", list_spy(os.scandir))
+
+    # unchanged directories are only stat'ed
+    index = PresetDirectoryIndex(library)
+    assert len(index.walk()) == 55
+    assert listed_paths == []
+
+    os.utime(os.path.join(library, "category 7"), (0, 1))
+    index.walk()
+    assert listed_paths == [os.path.join(library, "category 7")]
+    assert index.listed_directory_count == 1
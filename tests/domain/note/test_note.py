@@ -0,0 +1,34 @@
+from protocol0.domain.lom.note.Note import Note
+
+
+def test_note_key():
+    note = Note(pitch=60, start=1, duration=0.5)
+    assert note.key == (60, 100000, 50000, False)
+
+    # equal notes share their key
+    close_note = Note(pitch=60, start=1.000004, duration=0.499996)
+    assert close_note == note
+    assert close_note.key == note.key
+
+    far_note = Note(pitch=60, start=1.00002, duration=0.5)
+    assert far_note != note
+    assert far_note.key != note.key
+
+    # on each side of a quantization boundary : equal with different keys
+    low_note = Note(pitch=60, start=1.000004, duration=0.5)
+    high_note = Note(pitch=60, start=1.000006, duration=0.5)
+    assert low_note == high_note
+    assert low_note.key != high_note.key
+
+
+def test_note_copy():
+    note = Note(pitch=60, start=1, duration=0.5, muted=True)
+    note.velocity = 99.5
+
+    note_copy = note.copy()
+    assert note_copy is not note
+    assert note_copy == note
+    assert note_copy.velocity == 99.5
+
+    note_copy.start = 2
+    assert note.start == 1
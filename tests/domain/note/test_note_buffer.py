@@ -0,0 +1,117 @@
+from __future__ import division
+
+import random
+
+import pytest
+
+from protocol0.domain.lom.note.Note import Note
+from protocol0.domain.lom.note.NoteBuffer import NoteBuffer
+from protocol0.domain.lom.note.NoteView import NoteView
+
+
+def _make_notes(count):
+    random.seed(0)
+    return [
+        Note(
+            pitch=random.randint(30, 90),
+            start=random.randint(0, count) / 4,
+            duration=random.choice([0.25, 0.5, 1]),
+            velocity=random.randint(20, 127),
+        )
+        for _ in range(count)
+    ]
+
+
+def _scale_velocities(notes, go_next, scaling_factor):
+    """the former MidiClip.scale_velocities loop"""
+    average_velo = sum([note.velocity for note in notes]) / len(notes)
+    for note in notes:
+        velocity_diff = note.velocity - average_velo
+        if go_next:
+            note.velocity += velocity_diff / (scaling_factor - 1)
+        else:
+            note.velocity -= velocity_diff / scaling_factor
+
+
+def _to_mono(notes):
+    """the former MidiClip.to_mono loop"""
+    notes.sort(key=lambda x: x.start)
+    current_note = notes[0]
+    for next_note in notes[1:]:
+        current_note.end = max(current_note.end, next_note.start)
+        current_note = next_note
+
+
+def test_note_buffer_to_data():
+    notes = _make_notes(50)
+    notes.append(Note(pitch=200, start=-1, duration=0.001, velocity=300, muted=True))
+
+    note_buffer = NoteBuffer.from_notes(notes)
+
+    assert len(note_buffer) == 51
+    assert note_buffer.to_data() == tuple(note.to_data() for note in notes)
+
+
+def test_note_buffer_view():
+    note_buffer = NoteBuffer.from_notes(_make_notes(3))
+    note = note_buffer[-1]
+    assert isinstance(note, Note)
+    assert note == list(note_buffer)[2]
+
+    note.pitch = 200
+    note.velocity = 64.5
+    note.muted = True
+    assert note_buffer.pitches[2] == 127
+    assert note_buffer.velocities[2] == 64.5
+    assert note_buffer.to_data()[2][4] is True
+
+
+def test_note_buffer_transforms():
+    for go_next in (True, False):
+        notes = _make_notes(100)
+        note_buffer = NoteBuffer.from_notes(notes)
+        _scale_velocities(notes, go_next, 4)
+        note_buffer.scale_velocities(go_next, 4)
+        assert list(note_buffer.velocities) == pytest.approx([note.velocity for note in notes])
+
+    notes = _make_notes(100)
+    note_buffer = NoteBuffer.from_notes(notes)
+    _to_mono(notes)
+    note_buffer.to_mono()
+    assert note_buffer.to_data() == tuple(note.to_data() for note in notes)
+
+    note_buffer = NoteBuffer.from_notes([Note(pitch=120, start=0.3), Note(pitch=60, start=0.6)])
+    note_buffer.transpose(12)
+    assert list(note_buffer.pitches) == [127, 72]
+    note_buffer.remap_pitches({72: 36})
+    assert list(note_buffer.pitches) == [127, 36]
+    note_buffer.set_pitch(60)
+    assert list(note_buffer.pitches) == [60, 60]
+    note_buffer.quantize(0.5)
+    assert list(note_buffer.starts) == [0.5, 0.5]
+
+
+def test_note_buffer_no_note_objects(monkeypatch):
+    notes = _make_notes(1000)
+    created = []
+
+    def count_init(init):
+        def init_spy(self, *a, **k):
+            created.append(self)
+            init(self, *a, **k)
+
+        return init_spy
+
+    monkeypatch.setattr(Note, "__init__", count_init(Note.__init__))
+    monkeypatch.setattr(NoteView, "__init__", count_init(NoteView.__init__))
+
+    # clip wide transforms work on the columns : no Note is created per row
+    note_buffer = NoteBuffer.from_notes(notes)
+    note_buffer.scale_velocities(False, 2)
+    note_buffer.to_mono()
+    note_buffer.quantize(0.25)
+    note_buffer.to_data()
+    assert created == []
+
+    note_buffer[0].pitch = 60
+    assert len(created) == 1
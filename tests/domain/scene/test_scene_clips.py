@@ -1,18 +1,37 @@
 from typing import cast
 
-from protocol0.domain.lom.scene.SceneClips import SceneClips
 from protocol0.shared.Song import Song
 from protocol0.tests.domain.fixtures.clip_slot import AbletonClipSlot
+from protocol0.tests.domain.fixtures.large_set import make_large_set
 from protocol0.tests.domain.fixtures.p0 import make_protocol0
 
 
 def test_scene_clips():
     make_protocol0()
-    clips = SceneClips(0)
+    clips = Song.scenes()[0].clips
     assert len(list(clips)) == 0
     clip_slot = Song.selected_track().clip_slots[0]
     cast(AbletonClipSlot, clip_slot._clip_slot).add_clip()
     clip_slot._has_clip_listener()
 
-    clips = SceneClips(0)
+    clips = Song.scenes()[0].clips
     assert len(list(clips)) == 1
+
+
+def test_scene_clip_matrix():
+    make_protocol0()
+    make_large_set(group_track_count=2, scene_count=4)
+    scene = Song.scenes()[2]
+    clip_matrix = scene.clips._clip_matrix
+    assert len(clip_matrix._cells) == 4 * len(list(Song.simple_tracks()))
+
+    clip_slot = Song.selected_track().clip_slots[2]
+    row = clip_matrix.get_row(2)
+    cast(AbletonClipSlot, clip_slot._clip_slot).add_clip()
+    clip_slot._has_clip_listener()
+
+    # the cell is updated in place
+    assert clip_matrix.get_row(2) is row
+    assert list(scene.clips) == [clip_slot.clip]
+    assert clip_matrix in clip_slot.clip._observers
+    assert all(len(list(s.clips)) == 0 for s in Song.scenes() if s != scene)
@@ -2,6 +2,7 @@ from typing import cast
 
 from protocol0.domain.lom.clip.Clip import Clip
 from protocol0.domain.lom.clip.ClipConfig import ClipConfig
+from protocol0.domain.lom.scene.SceneClipMatrix import SceneClipMatrix
 from protocol0.domain.lom.scene.SceneClips import SceneClips, SceneClipSlot
 from protocol0.domain.lom.scene.SceneLength import SceneLength
 from protocol0.shared.Song import Song
@@ -12,7 +13,9 @@ from protocol0.tests.domain.fixtures.p0 import make_protocol0
 
 def test_scene_length():
     make_protocol0()
-    clips = SceneClips(0)
+    clip_matrix = SceneClipMatrix()
+    clip_matrix.build(1)
+    clips = SceneClips(clip_matrix, 0)
     scene_length = SceneLength(clips, 0)
     assert scene_length.length == 0
     assert scene_length.bar_length == 0
@@ -28,6 +31,43 @@ def test_scene_length():
     clip_slot.has_clip = True
     clip_slot.clip = Clip(live_clip_slot.clip, 1, ClipConfig(1))
     clips._clip_slot_tracks.append(SceneClipSlot(None, clip_slot))  # noqa
+    clips.notify_observers()
 
     assert scene_length.length == 4
     assert scene_length.bar_length == 1
+
+
+def test_scene_length_cache():
+    make_protocol0()
+    scene = Song.scenes()[0]
+    scene_length = scene._scene_length
+    cache_stats = SceneLength.CACHE_STATS
+    cache_stats.reset()
+
+    assert scene_length.length == 0
+    assert scene_length.length == 0
+    assert scene.playing_state.in_last_bar is False
+    assert cache_stats.recomputes == 1
+    assert cache_stats.hits == 4
+
+    clip_slot = Song.selected_track().clip_slots[0]
+    live_clip_slot = cast(AbletonClipSlot, clip_slot._clip_slot)
+    live_clip_slot.add_clip()
+    live_clip_slot.clip.length = 8
+    clip_slot._has_clip_listener()
+
+    # invalidated by the clip slot change
+    assert scene_length.length == 8
+    assert cache_stats.recomputes == 2
+
+    # invalidated by the clip loop listener
+    live_clip_slot.clip.loop_end = live_clip_slot.clip.length = 4
+    clip_slot.clip.loop._loop_end_listener()
+    assert scene_length.length == 4
+    assert cache_stats.recomputes == 3
+
+    # the playing status is not listened to : invalidated by the song playing events
+    assert scene.playing_state.is_playing is False
+    SceneClips.on_playing_changed()
+    assert scene_length.length == 4
+    assert cache_stats.recomputes == 4
@@ -1,6 +1,5 @@
 from typing import cast
 
-from protocol0.domain.lom.scene.SceneClips import SceneClips
 from protocol0.domain.lom.scene.SceneLength import SceneLength
 from protocol0.domain.lom.scene.ScenePlayingState import ScenePlayingState
 from protocol0.shared.Song import Song
@@ -16,7 +15,7 @@ def test_scene_playing_state():
     live_clip_slot.clip.length = 8
     live_clip_slot.clip.is_playing = True
     clip_slot._has_clip_listener()
-    clips = SceneClips(0)
+    clips = Song.scenes()[0].clips
 
     scene_length = SceneLength(clips, 0)
     scene_position = ScenePlayingState(clips, scene_length)
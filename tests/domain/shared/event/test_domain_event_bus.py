@@ -1,5 +1,6 @@
 from protocol0.domain.shared.event.DomainEventBus import DomainEventBus
 from protocol0.domain.shared.scheduler.BarEndingEvent import BarEndingEvent
+from protocol0.shared.sequence.Sequence import Sequence
 
 
 def test_domain_event_bus():
@@ -25,11 +26,11 @@ def sub():
 def test_domain_event_bus_duplicate():
     DomainEventBus._registry = {}
     DomainEventBus.subscribe(TestEvent, sub)
-    assert DomainEventBus._registry[TestEvent] == [sub]
+    assert DomainEventBus._registry[TestEvent].subscribers == (sub,)
 
     # no duplicates
     DomainEventBus.subscribe(TestEvent, sub)
-    assert DomainEventBus._registry[TestEvent] == [sub]
+    assert DomainEventBus._registry[TestEvent].subscribers == (sub,)
 
 
 class Test(object):
@@ -41,8 +42,67 @@ def test_domain_event_bus_duplicate_methods():
     DomainEventBus._registry = {}
     t1, t2 = Test(), Test()
     DomainEventBus.subscribe(TestEvent, t1.m)
-    assert DomainEventBus._registry[TestEvent] == [t1.m]
+    assert DomainEventBus._registry[TestEvent].subscribers == (t1.m,)
 
     # no duplicates across classes
     DomainEventBus.subscribe(TestEvent, t2.m, unique_method=True)
-    assert DomainEventBus._registry[TestEvent] == [t1.m]
+    assert DomainEventBus._registry[TestEvent].subscribers == (t1.m,)
+
+    # same method on another object
+    DomainEventBus.subscribe(TestEvent, t2.m)
+    assert DomainEventBus._registry[TestEvent].subscribers == (t1.m, t2.m)
+
+    DomainEventBus.un_subscribe(TestEvent, t1.m)
+    assert DomainEventBus._registry[TestEvent].subscribers == (t2.m,)
+
+
+def test_domain_event_bus_un_subscribe_during_emit():
+    DomainEventBus._registry = {}
+    test_res = []
+
+    def listener_1(_):
+        test_res.append(1)
+        DomainEventBus.un_subscribe(TestEvent, listener_2)
+
+    def listener_2(_):
+        test_res.append(2)
+
+    DomainEventBus.subscribe(TestEvent, listener_1)
+    DomainEventBus.subscribe(TestEvent, listener_2)
+
+    # synchronous subscribers don't create a Sequence
+    assert DomainEventBus.emit(TestEvent()) is None
+    assert test_res == [1, 2]
+
+    DomainEventBus.emit(TestEvent())
+    assert test_res == [1, 2, 1]
+
+
+def test_domain_event_bus_async_subscriber():
+    DomainEventBus._registry = {}
+
+    def listener(_):
+        seq = Sequence()
+        seq.wait_for_event(BarEndingEvent)
+        return seq.done()
+
+    DomainEventBus.subscribe(TestEvent, listener)
+
+    seq = DomainEventBus.emit(TestEvent())
+    assert seq.state.started
+
+    DomainEventBus.emit(BarEndingEvent())
+    assert seq.state.terminated
+
+
+def test_domain_event_bus_stats():
+    DomainEventBus._registry = {}
+    DomainEventBus._STATS = True
+    DomainEventBus.subscribe(TestEvent, sub)
+
+    for _ in range(10):
+        DomainEventBus.emit(TestEvent())
+
+    assert DomainEventBus.stats()["TestEvent"].count == 10
+    DomainEventBus._STATS = False
+    DomainEventBus.reset()
@@ -1,4 +1,7 @@
-from protocol0.domain.shared.utils.timing import throttle
+import time
+
+from protocol0.domain.shared.scheduler.Scheduler import Scheduler
+from protocol0.domain.shared.utils.timing import throttle, debounce
 
 
 def test_throttle():
@@ -10,3 +13,86 @@ def test_throttle():
     for i in range(5):
         res = t(i)
         assert res == 10
+
+
+class Clock(object):
+    def __init__(self):
+        self.now = 0.0
+        self.callbacks = []
+
+    def time(self):
+        return self.now
+
+    def wait(self, tick_count, callback, *_, **__):
+        self.callbacks.append((tick_count, callback))
+
+    def wait_ms(self, duration, callback, *_, **__):
+        self.callbacks.append((duration, callback))
+
+    def run(self):
+        callbacks = self.callbacks
+        self.callbacks = []
+        for _, callback in callbacks:
+            callback()
+
+
+def _patch_clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(time, "time", clock.time)
+    monkeypatch.setattr(Scheduler, "wait", clock.wait)
+    monkeypatch.setattr(Scheduler, "wait_ms", clock.wait_ms)
+    return clock
+
+
+def test_debounce(monkeypatch):
+    clock = _patch_clock(monkeypatch)
+
+    class Listener(object):
+        def __init__(self):
+            self.values = []
+
+        @debounce(duration=100)
+        def update(self, value):
+            self.values.append(value)
+
+    listeners = [Listener(), Listener()]
+    for i in range(50):
+        for listener in listeners:
+            listener.update(i)
+        clock.now += 0.001
+
+    # one pending deadline by object
+    assert len(clock.callbacks) == 2
+    assert Listener.update.stats.coalesced == 98
+
+    # the deadline was moved by the last calls
+    clock.now = 0.1
+    clock.run()
+    assert listeners[0].values == []
+    assert len(clock.callbacks) == 2
+    assert clock.callbacks[0][0] == 2
+
+    clock.now = 0.15
+    clock.run()
+    assert [listener.values for listener in listeners] == [[49], [49]]
+    assert Listener.update.stats.executions == 2
+    assert clock.callbacks == []
+
+
+def test_throttle_trailing_call(monkeypatch):
+    clock = _patch_clock(monkeypatch)
+    calls = []
+
+    def func(val):
+        calls.append(val)
+
+    t = throttle(100)(func)
+    for i in range(5):
+        t(i)
+
+    assert calls == [0]
+    assert len(clock.callbacks) == 1
+
+    clock.now = 0.1
+    clock.run()
+    assert calls == [0, 4]
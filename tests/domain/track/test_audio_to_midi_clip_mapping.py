@@ -18,3 +18,56 @@ def test_audio_to_midi_clip_mapping():
     assert mapping.path_matches_hash("path1", 1, False)
     assert not mapping.path_matches_hash("path1", 2, False)
     assert mapping.path_matches_hash("path1", 11, False)
+
+    assert mapping.path_matches_hash("path1_bis", 11, False)
+    assert mapping.path_matches_hash("path1", 1, True)
+    assert not mapping.path_matches_hash("path1", 11, True)
+    assert not mapping.path_matches_hash("path3", 1, False)
+    assert mapping.to_dict() == {"path1": [1, 11], "path1_bis": [1, 11], "path2": [2]}
+
+
+# noinspection PyTypeChecker
+def test_audio_to_midi_clip_mapping_migration():
+    # set data saved by previous versions
+    mapping = AudioToMidiClipMapping(
+        EmptyModule(), {"path1": [1, 1, 11.0], "path2": 2, "path3": [], "path4": [None]}  # noqa
+    )
+
+    assert mapping.to_dict() == {"path1": [1, 11], "path2": [2]}
+    assert mapping.path_matches_hash("path1", 11, False)
+
+    other_mapping = AudioToMidiClipMapping(EmptyModule(), {"path2": [3], "path5": [4]})  # noqa
+    mapping.update(other_mapping)
+    mapping.register_hash_equivalence(3, 33)
+    assert mapping.to_dict() == {"path1": [1, 11], "path2": [2, 3, 33], "path5": [4]}
+
+    # non ascii sample paths
+    file_path = u"C:\\samples\\caf\u00e9.wav"
+    unicode_mapping = AudioToMidiClipMapping(EmptyModule(), {file_path: [1]})  # noqa
+    assert unicode_mapping.path_matches_hash(file_path, 1, True)
+
+
+class NoScanDict(dict):
+    """Fails when the mapping is scanned instead of looked up"""
+
+    def _scan(self, *_):
+        raise AssertionError("mapping scanned")
+
+    __iter__ = items = keys = values = _scan
+
+
+# noinspection PyTypeChecker
+def test_audio_to_midi_clip_mapping_lookups():
+    mapping = AudioToMidiClipMapping(EmptyModule())  # noqa
+    file_path_count = 1000
+    for i in range(file_path_count):
+        mapping.register_file_path("path%s" % i, ClipInfoTest(i))
+    mapping._file_path_mapping = NoScanDict(mapping._file_path_mapping)
+    mapping._hash_to_file_paths = NoScanDict(mapping._hash_to_file_paths)
+
+    # hash lookups, whatever the number of file paths
+    for version in range(1, 10):
+        mapping.register_hash_equivalence(7, 7 + version * file_path_count)
+    assert mapping.path_matches_hash("path7", 7 + 9 * file_path_count, False)
+    assert not mapping.path_matches_hash("path8", 7 + 9 * file_path_count, False)
+    assert mapping.path_matches_hash("path7", 7, True)
@@ -0,0 +1,134 @@
+from protocol0.domain.lom.track.TrackMapperService import TrackMapperService
+from protocol0.domain.lom.track.simple_track.SimpleTrack import SimpleTrack
+from protocol0.shared.Song import Song
+from protocol0.tests.domain.fixtures.large_set import make_large_set, add_clip_slots
+from protocol0.tests.domain.fixtures.p0 import make_protocol0
+from protocol0.tests.domain.fixtures.simple_track import AbletonTrack, TrackType
+
+
+def _track_mapper_service():
+    # type: () -> TrackMapperService
+    return Song._INSTANCE._track_mapper_service
+
+
+def _insert_track(index, group_track):
+    # type: (int, AbletonTrack) -> AbletonTrack
+    live_song = Song._live_song()
+    live_track = AbletonTrack(track_type=TrackType.MIDI)
+    live_track.group_track = group_track
+    add_clip_slots(live_track, len(live_song.scenes))
+    live_song.tracks.insert(index, live_track)
+    return live_track
+
+
+def _count_linked_tracks(monkeypatch):
+    linked_tracks = []
+    on_tracks_change = SimpleTrack.on_tracks_change
+
+    def on_tracks_change_spy(track):
+        linked_tracks.append(track)
+        on_tracks_change(track)
+
+    monkeypatch.setattr(SimpleTrack, "on_tracks_change", on_tracks_change_spy)
+    return linked_tracks
+
+
+def _assert_scene_clips_follow_tracks():
+    simple_tracks = list(Song.simple_tracks())
+    for scene in Song.scenes():
+        assert scene.clips.tracks == simple_tracks
+
+
+def test_track_mapper_add_track(monkeypatch):
+    make_protocol0()
+    make_large_set(group_track_count=10, scene_count=8)
+    live_song = Song._live_song()
+    group_track = live_song.tracks[1]
+    scene_clip_slots = list(Song.scenes()[0].clips._clip_slot_tracks)
+    linked_tracks = _count_linked_tracks(monkeypatch)
+
+    live_track = _insert_track(3, group_track)
+    _track_mapper_service().tracks_listener()
+
+    simple_track = Song.live_track_to_simple_track(live_track)
+    group_simple_track = Song.live_track_to_simple_track(group_track)
+    assert simple_track.group_track == group_simple_track
+    assert group_simple_track.sub_tracks.index(simple_track) == 1
+    assert len(group_simple_track.sub_tracks) == 5
+    assert simple_track.index == 3
+    # the added track and its group only
+    assert len(linked_tracks) == 6
+
+    _assert_scene_clips_follow_tracks()
+    # the other tracks clip slots are kept
+    new_scene_clip_slots = Song.scenes()[0].clips._clip_slot_tracks
+    assert new_scene_clip_slots[:3] == scene_clip_slots[:3]
+    assert new_scene_clip_slots[4:] == scene_clip_slots[3:]
+
+
+def test_track_mapper_remove_track(monkeypatch):
+    make_protocol0()
+    make_large_set(group_track_count=10, scene_count=8)
+    live_song = Song._live_song()
+    live_track = live_song.tracks[2]
+    group_simple_track = Song.live_track_to_simple_track(live_song.tracks[1])
+    linked_tracks = _count_linked_tracks(monkeypatch)
+
+    live_song.tracks.remove(live_track)
+    _track_mapper_service().tracks_listener()
+
+    assert Song.optional_simple_track_from_live_track(live_track) is None
+    assert len(group_simple_track.sub_tracks) == 3
+    assert len(linked_tracks) == 4
+    _assert_scene_clips_follow_tracks()
+
+
+def test_track_mapper_regroup_track():
+    make_protocol0()
+    make_large_set(group_track_count=10, scene_count=8)
+    live_song = Song._live_song()
+    live_track = live_song.tracks[5]
+    previous_group_track = Song.live_track_to_simple_track(live_song.tracks[1])
+    group_track = Song.live_track_to_simple_track(live_song.tracks[6])
+
+    # last sub track moved to the next group, same track order
+    live_track.group_track = live_song.tracks[6]
+    live_song.tracks[5], live_song.tracks[6] = live_song.tracks[6], live_song.tracks[5]
+    _track_mapper_service().tracks_listener()
+
+    simple_track = Song.live_track_to_simple_track(live_track)
+    assert simple_track not in previous_group_track.sub_tracks
+    assert group_track.sub_tracks[0] == simple_track
+    assert group_track.abstract_group_track.sub_tracks[0] == simple_track
+    _assert_scene_clips_follow_tracks()
+
+
+def test_track_mapper_no_change(monkeypatch):
+    make_protocol0()
+    make_large_set(group_track_count=10, scene_count=8)
+    linked_tracks = _count_linked_tracks(monkeypatch)
+
+    _track_mapper_service().tracks_listener()
+    assert linked_tracks == []
+
+    _track_mapper_service().remap_tracks()
+    assert len(linked_tracks) == len(list(Song.simple_tracks()))
+
+
+def test_track_mapper_large_set_add_track(monkeypatch):
+    make_protocol0()
+    make_large_set()
+    live_song = Song._live_song()
+    group_simple_track = Song.live_track_to_simple_track(live_song.tracks[1])
+    linked_tracks = _count_linked_tracks(monkeypatch)
+
+    # the cost of an added track doesn't depend on the set size
+    _insert_track(3, live_song.tracks[1])
+    _track_mapper_service().tracks_listener()
+    assert len(linked_tracks) == len(group_simple_track.sub_tracks) + 1
+
+    del linked_tracks[:]
+    _insert_track(3, live_song.tracks[1])
+    _track_mapper_service().remap_tracks()
+    assert len(linked_tracks) == len(list(Song.simple_tracks()))
+    assert len(linked_tracks) > 10 * (len(group_simple_track.sub_tracks) + 1)
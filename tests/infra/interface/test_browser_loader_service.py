@@ -0,0 +1,101 @@
+from protocol0.infra.interface.BrowserLoaderService import BrowserLoaderService
+
+
+class BrowserItem(object):
+    def __init__(self, name, children=None):
+        self.name = name
+        self.children = children
+        self.is_folder = children is not None
+        self.is_loadable = children is None
+
+    @property
+    def iter_children(self):
+        return iter(self.children or [])
+
+
+class Browser(object):
+    def __init__(self, user_library):
+        self.user_library = user_library
+        self.loaded_items = []
+
+    def load_item(self, item):
+        self.loaded_items.append(item)
+
+
+def _make_user_library():
+    """20k presets"""
+    return BrowserItem(
+        "User Library",
+        [
+            BrowserItem(
+                "Folder %s" % i,
+                [
+                    BrowserItem(
+                        "Sub folder %s" % j,
+                        [BrowserItem("Preset %s %s %s.adg" % (i, j, k)) for k in range(100)],
+                    )
+                    for j in range(10)
+                ],
+            )
+            for i in range(20)
+        ],
+    )
+
+
+def test_browser_loader_service(tmp_path):
+    index_path = str(tmp_path / "browser_index.json")
+    user_library = _make_user_library()
+    browser = Browser(user_library)
+    browser_loader_service = BrowserLoaderService(browser, index_path)
+
+    # lazy expansion stops at the first folders
+    browser_loader_service.load_from_user_library("Preset 0 1 5.adg")
+    assert browser.loaded_items[-1].name == "Preset 0 1 5.adg"
+    index = browser_loader_service._indexes["user_library"]
+    assert index.touched_item_count == 20 + 10 + 2 * 100
+
+    browser_loader_service.load_from_user_library("Preset 0 1 6.adg")
+    assert index.touched_item_count == 0
+
+    # new session : only the folders on the saved path are listed
+    browser_loader_service = BrowserLoaderService(browser, index_path)
+    browser_loader_service.load_from_user_library("Preset 0 1 5.adg")
+    index = browser_loader_service._indexes["user_library"]
+    assert index.touched_item_count == 20 + 10 + 100
+
+    # stale path : the item moved to another sub folder
+    browser_loader_service = BrowserLoaderService(browser, index_path)
+    sub_folder_0, sub_folder_1 = user_library.children[0].children[:2]
+    preset = sub_folder_1.children.pop(5)
+    sub_folder_0.children.append(preset)
+    browser_loader_service.load_from_user_library("Preset 0 1 5.adg")
+    assert browser.loaded_items[-1] is preset
+    index = browser_loader_service._indexes["user_library"]
+    assert index.touched_item_count == 20 + 10 + 99 + 101
+
+    # its new path was saved
+    browser_loader_service = BrowserLoaderService(browser, index_path)
+    browser_loader_service.load_from_user_library("Preset 0 1 5.adg")
+    assert browser_loader_service._indexes["user_library"].touched_item_count == 20 + 10 + 101
+
+
+def test_browser_loader_service_stale_folder(tmp_path):
+    index_path = str(tmp_path / "browser_index.json")
+    user_library = _make_user_library()
+    browser = Browser(user_library)
+    browser_loader_service = BrowserLoaderService(browser, index_path)
+    browser_loader_service.load_from_user_library("Preset 0 9 0.adg")
+    browser_loader_service.load_from_user_library("Preset 0 1 0.adg")
+
+    # stale path : a sub folder was renamed
+    user_library.children[0].children[1].name = "Renamed sub folder"
+    browser_loader_service = BrowserLoaderService(browser, index_path)
+    browser_loader_service.load_from_user_library("Preset 0 1 0.adg")
+    index = browser_loader_service._indexes["user_library"]
+    assert index.paths["Preset 0 1 0.adg"][1] == "Renamed sub folder"
+
+    # the sibling sub folder items are still indexed
+    assert index.paths["Preset 0 9 0.adg"] == ["Folder 0", "Sub folder 9", "Preset 0 9 0.adg"]
+    browser_loader_service.load_from_user_library("Preset 0 9 0.adg")
+    assert browser.loaded_items[-1].name == "Preset 0 9 0.adg"
+    assert index.touched_item_count == 100
@@ -0,0 +1,115 @@
+import logging
+
+from protocol0 import EmptyModule
+from protocol0.domain.shared.scheduler.Scheduler import Scheduler
+from protocol0.infra.logging.LoggerService import LoggerService
+from protocol0.shared.Config import Config
+from protocol0.shared.logging.LogLevelEnum import LogLevelEnum
+from protocol0.shared.logging.Logger import Logger
+
+
+class Message(object):
+    def __init__(self):
+        self.format_count = 0
+
+    def __str__(self):
+        self.format_count += 1
+        return "message"
+
+
+def _make_logger_service(monkeypatch):
+    lines = []
+    deferred_callbacks = []
+    monkeypatch.setattr(logging, "info", lines.append)
+    monkeypatch.setattr(Scheduler, "defer", deferred_callbacks.append)
+    monkeypatch.setattr(Scheduler, "_INSTANCE", object())
+    return LoggerService(), lines, deferred_callbacks
+
+
+def test_logger_service_buffers_records(monkeypatch):
+    logger_service, lines, deferred_callbacks = _make_logger_service(monkeypatch)
+    message = Message()
+
+    logger_service.log(message, debug=False)
+    logger_service.log({"key": "value"}, debug=True)
+    assert lines == []
+    assert message.format_count == 0
+    assert len(deferred_callbacks) == 1
+
+    deferred_callbacks.pop()()
+    assert message.format_count == 1
+    assert lines[0] == "P0 - info: message"
+    assert lines[1] == "P0 - info: {"
+    # caller of the Logger facade
+    assert lines[-1].startswith("P0 - } (")
+
+    # written right away, after the buffered records
+    logger_service.log("info", debug=False)
+    logger_service.log("warning", debug=False, level=LogLevelEnum.WARNING)
+    assert lines[-2:] == ["P0 - info: info", "P0 - warning: warning"]
+
+
+def test_logger_service_level(monkeypatch):
+    logger_service, lines, deferred_callbacks = _make_logger_service(monkeypatch)
+    monkeypatch.setattr(Config, "LOG_LEVEL", LogLevelEnum.INFO)
+    message = Message()
+
+    logger_service.log(message, level=LogLevelEnum.DEV)
+    assert message.format_count == 0
+    assert deferred_callbacks == []
+    assert logger_service.get_last_records(10) == []
+
+
+def test_logger_service_ring_buffer(monkeypatch):
+    logger_service, lines, deferred_callbacks = _make_logger_service(monkeypatch)
+
+    for i in range(LoggerService._MAX_RECORDS + 10):
+        logger_service.log(i, debug=False)
+    logger_service.flush()
+
+    assert len(lines) == LoggerService._MAX_RECORDS
+    assert lines[0] == "P0 - info: 10"
+    assert logger_service.get_last_records(2) == ["info: 1008", "info: 1009"]
+
+    logger_service.log("clear_logs", debug=False)
+    logger_service.dump_last_records(3)
+    assert lines[-4:] == [
+        "P0 - info: clear_logs",
+        "P0 - info: 1007",
+        "P0 - info: 1008",
+        "P0 - info: 1009",
+    ]
+    assert len(logger_service.get_last_records(LoggerService._MAX_RECORDS + 10)) == 1000
+
+
+class BrokenMessage(object):
+    def __str__(self):
+        raise RuntimeError("disconnected")
+
+
+def test_logger_service_unformattable_record(monkeypatch):
+    logger_service, lines, deferred_callbacks = _make_logger_service(monkeypatch)
+
+    logger_service.log(BrokenMessage(), debug=False)
+    logger_service.log("next", debug=False)
+    deferred_callbacks.pop()()
+
+    assert len(lines) == 2
+    assert lines[0].startswith("P0 - info: unformattable BrokenMessage (RuntimeError(")
+    assert lines[1] == "P0 - info: next"
+
+
+def test_logger_service_scheduler_restart(monkeypatch):
+    logger_service, lines, deferred_callbacks = _make_logger_service(monkeypatch)
+    monkeypatch.setattr(Logger, "_INSTANCE", EmptyModule())
+    Logger._INSTANCE._logger = logger_service
+    monkeypatch.setattr(Scheduler, "_INSTANCE", EmptyModule())
+
+    logger_service.log("before restart", debug=False)
+    # the restart drops the deferred flush
+    del deferred_callbacks[:]
+    Scheduler.restart()
+    assert lines == ["P0 - info: before restart"]
+
+    logger_service.log("after restart", debug=False)
+    assert len(deferred_callbacks) == 1
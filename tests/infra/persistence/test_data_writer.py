@@ -0,0 +1,125 @@
+from protocol0 import EmptyModule
+from protocol0.domain.lom.track.simple_track.AudioToMidiClipMapping import AudioToMidiClipMapping
+from protocol0.domain.shared.scheduler.Scheduler import Scheduler
+from protocol0.infra.persistence.DataEncoder import DataEncoder
+from protocol0.infra.persistence.DataWriter import DataWriter
+from protocol0.infra.persistence.TrackData import TrackData
+from protocol0.infra.persistence.TrackDataEnum import TrackDataEnum
+from protocol0.shared.logging.Logger import Logger
+
+_SAMPLE_DIRECTORY = "C:\\Users\\me\\Music\\Project\\Samples\\Processed\\Freeze\\"
+
+
+class LiveTrack(object):
+    def __init__(self):
+        self.data = {}
+        self.write_count = 0
+
+    def get_data(self, key, default_value):
+        return self.data.get(key, default_value)
+
+    def set_data(self, key, value):
+        self.data[key] = value
+        self.write_count += 1
+
+
+class ClipInfo(object):
+    def __init__(self, clip_hash):
+        self.hash = clip_hash
+
+
+def _defer_manually(monkeypatch):
+    deferred_callbacks = []
+    monkeypatch.setattr(Scheduler, "defer", deferred_callbacks.append)
+    DataWriter.reset()
+    return deferred_callbacks
+
+
+def test_data_writer_batches_writes(monkeypatch):
+    deferred_callbacks = _defer_manually(monkeypatch)
+    track = EmptyModule()
+    live_track = track._track = LiveTrack()
+    track_data = TrackData(track)  # noqa
+    track.clip_mapping = mapping = AudioToMidiClipMapping(track_data)
+
+    # flattening a track registers one file path per clip
+    for i in range(40):
+        mapping.register_file_path(_SAMPLE_DIRECTORY + "clip %s.wav" % i, ClipInfo(i))  # noqa
+
+    assert live_track.write_count == 0
+    assert len(deferred_callbacks) == 1
+
+    deferred_callbacks.pop()()
+    assert live_track.write_count == 1
+    assert DataWriter.last_flush_bytes_written > 0
+
+    # unchanged value
+    mapping.register_file_path(_SAMPLE_DIRECTORY + "clip 0.wav", ClipInfo(0))  # noqa
+    deferred_callbacks.pop()()
+    assert live_track.write_count == 1
+    assert DataWriter.last_flush_bytes_written == 0
+
+    # written on script disconnect
+    mapping.register_file_path(_SAMPLE_DIRECTORY + "clip 0.wav", ClipInfo(100))  # noqa
+    DataWriter.flush()
+    assert live_track.write_count == 2
+
+    track_data.restore()
+    assert track.clip_mapping is not mapping
+    assert track.clip_mapping.to_dict() == mapping.to_dict()
+    assert len(live_track.data[TrackDataEnum.CLIP_MAPPING.value]) < len(str(mapping.to_dict()))
+
+
+class TickScheduler(object):
+    def __init__(self):
+        self.callbacks = []
+
+    def schedule(self, _, callback, *__):
+        self.callbacks.append(callback)
+
+    def start(self):
+        # a restart drops the scheduled events
+        self.callbacks = []
+
+
+class BeatScheduler(object):
+    def reset(self):
+        pass
+
+
+def test_data_writer_scheduler_restart(monkeypatch):
+    tick_scheduler = TickScheduler()
+    monkeypatch.setattr(Scheduler, "_INSTANCE", Scheduler(tick_scheduler, BeatScheduler()))
+    monkeypatch.setattr(Logger, "flush", lambda: None)
+    DataWriter.reset()
+    live_track = LiveTrack()
+
+    DataWriter.mark_dirty(live_track, live_track.set_data, "key", lambda: 1)
+    assert len(tick_scheduler.callbacks) == 1
+    Scheduler.restart()
+
+    # the flush is scheduled again
+    assert len(tick_scheduler.callbacks) == 1
+    tick_scheduler.callbacks.pop()()
+    assert live_track.data == {"key": 1}
+
+    DataWriter.mark_dirty(live_track, live_track.set_data, "key", lambda: 2)
+    assert len(tick_scheduler.callbacks) == 1
+    DataWriter.reset()
+
+
+def test_data_encoder():
+    small_mapping = {"C:\\samples\\kick.wav": [1, 2]}
+    assert DataEncoder.encode(small_mapping) == small_mapping
+    assert DataEncoder.decode(small_mapping) == small_mapping
+
+    mapping = {}
+    for i in range(200):
+        file_path = "C:\\Users\\me\\Music\\Project %s\\Samples\\clip %s.wav" % (i % 5, i)
+        mapping[file_path] = [i]
+        mapping["/Users/me/Music/Project/Samples/Processed/Freeze clip %s.wav" % i] = [i, -i]
+
+    encoded_mapping = DataEncoder.encode(mapping)
+    assert encoded_mapping.startswith("p0z1:")
+    assert len(encoded_mapping) * 5 < len(str(mapping))
+    assert DataEncoder.decode(encoded_mapping) == mapping
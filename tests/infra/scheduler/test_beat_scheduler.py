@@ -0,0 +1,86 @@
+from collections import namedtuple
+from functools import partial
+
+from typing import Any
+
+from protocol0.infra.scheduler.BeatScheduler import BeatScheduler
+from protocol0.tests.domain.fixtures.p0 import make_protocol0
+from protocol0.tests.domain.fixtures.song import AbletonSong
+
+beats_song_time = namedtuple("beats_song_time", ["bars", "beats", "sub_division", "ticks"])
+
+
+def _set_song_time(monkeypatch, bars, beats):
+    # type: (Any, int, int) -> None
+    monkeypatch.setattr(
+        AbletonSong,
+        "get_current_beats_song_time",
+        lambda s: beats_song_time(bars, beats, 1, 1),
+    )
+
+
+def test_beat_scheduler_executes_all_due_events(monkeypatch):
+    make_protocol0()
+    beat_scheduler = BeatScheduler(AbletonSong())
+    test_res = []
+
+    _set_song_time(monkeypatch, 1, 1)
+    # removing events while iterating used to skip every other due event
+    for i in range(1000):
+        beat_scheduler.wait_beats(1, partial(test_res.append, i), False)
+
+    beat_scheduler._on_tick()
+    assert test_res == []
+
+    _set_song_time(monkeypatch, 1, 2)
+    beat_scheduler._on_tick()
+    assert test_res == list(range(1000))
+    assert beat_scheduler._scheduled_events == []
+
+
+def test_beat_scheduler_song_stop(monkeypatch):
+    make_protocol0()
+    song = AbletonSong()
+    song.is_playing = True
+    beat_scheduler = BeatScheduler(song)
+    test_res = []
+
+    _set_song_time(monkeypatch, 1, 1)
+    beat_scheduler.wait_beats(2, partial(test_res.append, 2), False)
+    beat_scheduler.wait_beats(1, partial(test_res.append, 1), False)
+    beat_scheduler.wait_beats(4, partial(test_res.append, 4), True)
+    beat_scheduler.wait_beats(8, partial(test_res.append, 8), False)
+
+    _set_song_time(monkeypatch, 1, 3)
+    beat_scheduler._on_tick()
+    assert test_res == [1, 2]
+
+    # only the events flagged with execute_on_song_stop are executed
+    song.is_playing = False
+    beat_scheduler._is_playing_listener()
+    assert test_res == [1, 2, 4]
+    assert beat_scheduler._scheduled_events == []
+
+
+def test_beat_scheduler_many_events(monkeypatch):
+    make_protocol0()
+    beat_scheduler = BeatScheduler(AbletonSong())
+    event_count = 5000
+    test_res = []
+
+    _set_song_time(monkeypatch, 1, 1)
+    for i in range(event_count):
+        beat_scheduler.wait_beats(i % 64 + 1, partial(test_res.append, i % 64), False)
+
+    _set_song_time(monkeypatch, 9, 1)
+    beat_scheduler._on_tick()
+    # due events only : 32 beats elapsed
+    assert len(test_res) == sum(1 for i in range(event_count) if i % 64 < 32)
+    assert len(beat_scheduler._scheduled_events) == event_count - len(test_res)
+
+    _set_song_time(monkeypatch, 17, 1)
+    beat_scheduler._on_tick()
+    assert len(test_res) == event_count
+    # executed in song time order
+    assert test_res == sorted(test_res)
+    assert beat_scheduler._scheduled_events == []
@@ -0,0 +1,112 @@
+from functools import partial
+
+from protocol0.infra.scheduler.TickScheduler import TickScheduler
+from protocol0.tests.domain.fixtures.song import AbletonSong
+
+
+def _make_tick_scheduler():
+    # type: () -> TickScheduler
+    # noinspection PyTypeChecker
+    return TickScheduler(None, AbletonSong())
+
+
+def test_tick_scheduler_timing():
+    tick_scheduler = _make_tick_scheduler()
+    test_res = []
+
+    tick_scheduler.schedule(2, lambda: test_res.append(2))
+    tick_scheduler.schedule(1, lambda: test_res.append(1))
+
+    tick_scheduler._on_tick()
+    assert test_res == []
+    tick_scheduler._on_tick()
+    assert test_res == [1]
+    tick_scheduler._on_tick()
+    assert test_res == [1, 2]
+    assert tick_scheduler._scheduled_events == []
+
+
+def test_tick_scheduler_cancel():
+    tick_scheduler = _make_tick_scheduler()
+    test_res = []
+
+    event = tick_scheduler.schedule(1, lambda: test_res.append(True))
+    event.cancel()
+
+    for _ in range(3):
+        tick_scheduler._on_tick()
+    assert test_res == []
+    assert tick_scheduler._scheduled_events == []
+
+
+def test_tick_scheduler_unique():
+    tick_scheduler = _make_tick_scheduler()
+    test_res = []
+
+    def append(value):
+        test_res.append(value)
+
+    tick_scheduler.schedule(1, partial(append, 1), unique=True)
+    tick_scheduler.schedule(1, partial(append, 2), unique=True)
+
+    for _ in range(3):
+        tick_scheduler._on_tick()
+    assert test_res == [2]
+    assert tick_scheduler._events_by_func_key == {}
+
+
+def test_tick_scheduler_unique_cancels_non_unique_events():
+    tick_scheduler = _make_tick_scheduler()
+    test_res = []
+
+    def append(value):
+        test_res.append(value)
+
+    tick_scheduler.schedule(1, partial(append, 1))
+    tick_scheduler.schedule(2, partial(append, 2))
+    tick_scheduler.schedule(1, partial(append, 3), unique=True)
+
+    for _ in range(4):
+        tick_scheduler._on_tick()
+    assert test_res == [3]
+    assert tick_scheduler._events_by_func_key == {}
+
+
+def test_tick_scheduler_schedule_during_tick():
+    tick_scheduler = _make_tick_scheduler()
+    test_res = []
+
+    def reschedule():
+        test_res.append(True)
+        tick_scheduler.schedule(1, reschedule)
+
+    tick_scheduler.schedule(1, reschedule)
+    for _ in range(6):
+        tick_scheduler._on_tick()
+
+    # every event is executed at most once per tick
+    assert test_res == [True, True, True]
+
+
+def test_tick_scheduler_many_events():
+    tick_scheduler = _make_tick_scheduler()
+    event_count = 10000
+    test_res = []
+
+    for i in range(event_count):
+        tick_scheduler.schedule(i % 100 + 1, partial(test_res.append, i % 100))
+
+    tick_scheduler._on_tick()
+    tick_scheduler._on_tick()
+    # only the due events are popped
+    assert len(test_res) == event_count / 100
+    assert len(tick_scheduler._scheduled_events) == event_count - len(test_res)
+
+    for _ in range(100):
+        tick_scheduler._on_tick()
+
+    assert len(test_res) == event_count
+    # executed in tick order
+    assert test_res == sorted(test_res)
+    assert tick_scheduler._scheduled_events == []
+    assert tick_scheduler._events_by_func_key == {}
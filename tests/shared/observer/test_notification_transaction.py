@@ -0,0 +1,73 @@
+from typing import cast
+
+from protocol0.shared.Song import Song
+from protocol0.shared.observer.NotificationTransaction import NotificationTransaction
+from protocol0.shared.observer.Observable import Observable
+from protocol0.tests.domain.fixtures.clip_slot import AbletonClipSlot
+from protocol0.tests.domain.fixtures.p0 import make_protocol0
+
+
+class Link(Observable):
+    """Observer forwarding its notifications, like ClipLoop -> Clip -> ClipSlot"""
+
+    def __init__(self):
+        super(Link, self).__init__()
+        self.update_count = 0
+
+    def update(self, observable):
+        self.update_count += 1
+        self.notify_observers()
+
+
+def _make_chain():
+    loop, clip, clip_slot = Link(), Link(), Link()
+    loop.register_observer(clip)
+    clip.register_observer(clip_slot)
+    return loop, clip, clip_slot
+
+
+def test_notification_transaction(monkeypatch):
+    monkeypatch.setattr(NotificationTransaction, "_STATS", True)
+    NotificationTransaction.reset()
+    loop, clip, clip_slot = _make_chain()
+
+    loop.notify_observers()
+    assert clip_slot.update_count == 1
+
+    with NotificationTransaction():
+        for _ in range(3):
+            loop.notify_observers()
+        with NotificationTransaction():
+            loop.notify_observers()
+        assert clip.update_count == 1
+
+    assert clip.update_count == clip_slot.update_count == 2
+    stats = NotificationTransaction.stats()["Link -> Link"]
+    assert stats.notifications == 7
+    assert stats.deliveries == 4
+    assert stats.coalesced == 3
+
+    @NotificationTransaction()
+    def notify():
+        loop.notify_observers()
+        loop.notify_observers()
+        return 1
+
+    assert notify() == 1
+    assert clip_slot.update_count == 3
+    NotificationTransaction.reset()
+
+
+def test_notification_transaction_clip_select(monkeypatch):
+    make_protocol0()
+    clip_slot = Song.selected_track().clip_slots[0]
+    cast(AbletonClipSlot, clip_slot._clip_slot).add_clip()
+    clip_slot._has_clip_listener()
+    selections = []
+    monkeypatch.setattr(clip_slot, "select", lambda: selections.append(clip_slot))
+
+    with NotificationTransaction():
+        clip_slot.clip.select()
+        assert selections == [clip_slot]
+
+    assert selections == [clip_slot]
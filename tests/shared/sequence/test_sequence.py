@@ -135,3 +135,29 @@ def test_cancel():
     seq.done()
 
     assert test_res == []
+
+
+def test_reset():
+    Sequence.reset()
+    seq_1 = Sequence("seq 1")
+    seq_1.defer()
+    seq_1.done()
+    seq_2 = Sequence()
+    seq_2.defer()
+    seq_2.done()
+    seq_3 = Sequence()
+    seq_3.add([])
+    seq_3.done()
+
+    # terminated sequences are unregistered
+    assert len(Sequence.RUNNING_SEQUENCES) == 2
+
+    Sequence.reset("seq 1")
+    assert seq_1.state.cancelled
+    assert not seq_2.state.cancelled
+    assert Sequence.RUNNING_SEQUENCES.get_sequences() == [seq_2]
+    assert Sequence.RUNNING_SEQUENCES._sequences_by_name == {}
+
+    Sequence.reset()
+    assert seq_2.state.cancelled
+    assert len(Sequence.RUNNING_SEQUENCES) == 0
@@ -0,0 +1,38 @@
+import inspect
+
+from protocol0.domain.shared.utils.func import nop
+from protocol0.shared.sequence.Sequence import Sequence
+
+
+def _create_sequence():
+    # type: () -> Sequence
+    seq = Sequence()
+    seq.add(nop)
+    seq.add(nop)
+    return seq
+
+
+def test_sequence_lazy_name(monkeypatch):
+    def get_frame_info_mock(*_, **__):
+        raise AssertionError("source file read on Sequence creation")
+
+    monkeypatch.setattr(inspect, "getframeinfo", get_frame_info_mock)
+
+    seq = _create_sequence()
+
+    assert seq._name is None
+    assert seq.name.endswith("._create_sequence]")
+    assert str(seq._steps[0]) == "%s : step nop" % seq.name
+
+
+def test_sequence_synchronous_steps():
+    test_res = []
+    seq = Sequence()
+    for i in range(2000):
+        seq.add(lambda i=i: test_res.append(i))
+    seq.done()
+
+    # executed in a loop : no recursion limit on long synchronous chains
+    assert seq.state.terminated
+    assert test_res == list(range(2000))
+
@@ -0,0 +1,38 @@
+from protocol0.domain.lom.track.group_track.NormalGroupTrack import NormalGroupTrack
+from protocol0.shared.Song import Song
+from protocol0.shared.SongSnapshot import SongSnapshot
+from protocol0.tests.domain.fixtures.large_set import make_large_set, add_clip_slots
+from protocol0.tests.domain.fixtures.p0 import make_protocol0
+from protocol0.tests.domain.fixtures.simple_track import AbletonTrack, TrackType
+
+
+def test_song_snapshot():
+    make_protocol0()
+    make_large_set(group_track_count=3, scene_count=4)
+
+    snapshot = Song._snapshot()
+    assert list(Song.simple_tracks()) == list(snapshot.simple_tracks)
+    assert len(list(Song.abstract_group_tracks())) == 3
+    assert all(isinstance(t, NormalGroupTrack) for t in Song.abstract_group_tracks())
+    assert len(Song.scenes()) == 4
+
+    # same generation : nothing is computed again
+    assert Song._snapshot() is snapshot
+    assert Song.scenes() is snapshot.scenes
+    assert snapshot.get_abstract_tracks(NormalGroupTrack) is snapshot.get_abstract_tracks(
+        NormalGroupTrack
+    )
+
+    live_song = Song._live_song()
+    live_track = AbletonTrack(track_type=TrackType.MIDI)
+    add_clip_slots(live_track, 4)
+    live_song.tracks.append(live_track)
+    Song._INSTANCE._track_mapper_service.tracks_listener()
+
+    assert not snapshot.is_valid
+    assert Song._snapshot() is not snapshot
+    assert list(Song.simple_tracks())[-1] == Song.live_track_to_simple_track(live_track)
+
+    generation = Song._snapshot().generation
+    SongSnapshot.bump_generation()
+    assert Song._snapshot().generation == generation + 1
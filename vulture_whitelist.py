@@ -13,6 +13,7 @@ LOMAnalyzer  # unused class (domain\audit\LOMAnalyzer.py:5)
 _.check_tracks_tree_consistency  # unused method (domain\audit\LOMAnalyzer.py:7)
 push2_method  # unused function (application\push2\decorators.py:12)
 LOMAnalyzerService  # unused class (domain\audit\LOMAnalyzerService.py:5)
+_.check_clip_slot_index_consistency  # unused method (domain\audit\LOMAnalyzerService.py:32)
 _.dev  # unused method (shared\logging\Logger.py:16)
 _.dev  # unused attribute (tests\fixtures\p0.py:37)
 InstrumentSerum  # unused class (domain\lom\instrument\instrument\InstrumentSerum.py:5)